@@ -1,12 +1,22 @@
 from .aio.client import AsyncClient as Autumn
+from .cache import *
+from .circuit import *
 from .client import *
 from .error import *
+from .evaluator import *
+from .lease import *
 from .models.balance import *
 from .models.customers import *
 from .models.entities import *
 from .models.features import *
 from .models.meta import *
 from .models.products import *
+from .pool import *
+from .ratelimit import *
+from .retry import *
+from .spool import *
+from .timeouts import *
+from .tracker import *
 
 __title__ = "autumn"
 __version__ = "3.1.6"
@@ -1 +1,6 @@
 from .client import *
+from .fanout import *
+from .http import *
+from .lease import *
+from .limits import *
+from .tracker import *
@@ -1,14 +1,39 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
+from ..cache import CheckCache
+from ..circuit import CircuitBreaker
 from ..client import Client
 from ..customers import Customers
 from ..entities import Entities
 from ..error import AutumnError
+from ..evaluator import EntitlementEvaluator
 from ..features import Features
+from ..lease import LeaseErrorCallback
 from ..products import Products
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..spool import Spool
+from ..timeouts import Timeout, _deadline_at, _remaining
+from ..tracker import ErrorCallback
+from .fanout import MapResult, _fan_out
 from .http import AsyncHTTPClient
+from .lease import AsyncLeaser
+from .limits import AdaptiveConcurrencyLimit
+from .tracker import AsyncTracker
 
 try:
     import aiohttp
@@ -21,6 +46,7 @@ except ImportError:
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from ..models.response import CheckResponse
     from .stubs import (
         AttachParams,
         CancelParams,
@@ -39,7 +65,7 @@ class AsyncClient(Client):
 
     This class is also exposed as ``autumn.Autumn``.
 
-    The ``AsyncClient`` automatically retries requests up to 5 times, exponentially backing off between attempts.
+    The ``AsyncClient`` automatically retries requests up to 5 times, backing off exponentially with jitter between attempts.
 
     Note that session creation is lazy. This means that the ``AsyncClient`` will not attempt to create a session until the first request is made.
 
@@ -50,9 +76,39 @@ class AsyncClient(Client):
     base_url: Optional[str]
         The base URL of the Autumn API. This is useful when you are self-hosting Autumn and need to point to your own instance.
     max_retries: int
-        The maximum number of retries to attempt for failed requests.
+        The maximum number of retries to attempt for failed requests. Ignored when ``retry_policy`` is given.
+    retry_policy: Optional[:class:`~autumn.retry.RetryPolicy`]
+        Controls backoff, which failures are retried and the retry budget. Share one policy between clients to share its budget.
     session: Optional[:class:`~aiohttp.ClientSession`]
         The session to use for requests. If not provided, a new session will be created **lazily**.
+    connector: Optional[:class:`~aiohttp.BaseConnector`]
+        A connector to share between several clients, usually created with :func:`~autumn.aio.http.create_connector`.
+        The client will not close a connector passed in here. When provided, the connector options below are ignored.
+    limit: int
+        The total number of simultaneous connections.
+    limit_per_host: int
+        The number of simultaneous connections to a single host. ``0`` means unlimited.
+    keepalive_timeout: float
+        The number of seconds an idle connection is kept open for reuse.
+    ttl_dns_cache: Optional[int]
+        The number of seconds resolved DNS entries are cached for. ``None`` caches them forever.
+    force_close: bool
+        Whether to close connections after every request, disabling keep-alive.
+    timeout: Optional[:class:`~autumn.timeouts.Timeout`]
+        The connect and read timeouts applied to each attempt. Defaults to 5 seconds to connect and 30 seconds to read.
+    endpoint_timeouts: Optional[Dict[str, :class:`~autumn.timeouts.Timeout`]]
+        Timeouts for specific endpoints, keyed by path (e.g. ``"/check"``). The longest matching path prefix is used.
+    circuit_breaker: Optional[:class:`~autumn.circuit.CircuitBreaker`]
+        A circuit breaker that fails requests to a degraded endpoint immediately with :class:`~autumn.error.AutumnCircuitOpenError`.
+    check_cache: Optional[:class:`~autumn.cache.CheckCache`]
+        A cache that answers repeated :meth:`check` calls locally for a short time.
+    single_flight: bool
+        Whether identical ``GET`` requests (same path and parameters) that are in flight at the same time share one
+        upstream call. Every caller then receives the same model instance, so do not mutate it.
+    rate_limiter: Optional[:class:`~autumn.ratelimit.RateLimiter`]
+        A limiter that paces every attempt, including retries, and slows down when Autumn answers ``429``.
+    concurrency_limit: Optional[:class:`~autumn.aio.limits.AdaptiveConcurrencyLimit`]
+        A limit on the number of attempts in flight at once that adapts to Autumn's latency.
 
     Attributes
     ----------
@@ -80,25 +136,54 @@ class AsyncClient(Client):
         *,
         base_url: Optional[str] = None,
         max_retries: int = 5,
+        retry_policy: Optional[RetryPolicy] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+        force_close: bool = False,
+        timeout: Optional[Timeout] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeout]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        check_cache: Optional[CheckCache] = None,
+        single_flight: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limit: Optional[AdaptiveConcurrencyLimit] = None,
     ) -> None:
         from .. import BASE_URL, VERSION
 
         _base_url = base_url or BASE_URL
         _base_url = _base_url.rstrip("/")
 
-        attempts = max_retries + 1
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
         self.http = AsyncHTTPClient(
             _base_url,
             VERSION,
             token,
-            attempts=attempts,
+            retry_policy,
             session=session,
+            connector=connector,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            force_close=force_close,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            circuit_breaker=circuit_breaker,
+            single_flight=single_flight,
+            rate_limiter=rate_limiter,
+            concurrency_limit=concurrency_limit,
         )
         self.customers = Customers(self.http)
         self.features = Features(self.http)
         self.products = Products(self.http)
         self.entities = Entities(self.http)
+        self.check_cache = check_cache
+        self._trackers: List[AsyncTracker] = []
+        self._leasers: List[AsyncLeaser] = []
 
     async def __aenter__(self) -> Self:
         return self
@@ -106,5 +191,199 @@ class AsyncClient(Client):
     async def __aexit__(self, _exc_type, _exc, _tb):
         await self.close()
 
-    async def close(self):
-        await self.http.close()
+    def tracker(  # type: ignore[override]
+        self,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+        max_attempts: int = 3,
+        concurrency: int = 10,
+        on_error: Optional[ErrorCallback] = None,
+        coalesce: bool = False,
+        spool: Optional[Spool] = None,
+    ) -> AsyncTracker:
+        """Create a buffered tracker that sends usage events from a background task.
+
+        See :class:`~autumn.aio.tracker.AsyncTracker`. The parameters are the same as :meth:`autumn.Client.tracker`.
+
+        Returns
+        -------
+        :class:`~autumn.aio.tracker.AsyncTracker`
+            The tracker. It is closed, and its queue flushed, when :meth:`close` is awaited.
+        """
+        tracker = AsyncTracker(
+            self.http,
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            max_queue=max_queue,
+            max_attempts=max_attempts,
+            concurrency=concurrency,
+            on_error=on_error,
+            coalesce=coalesce,
+            check_cache=self.check_cache,
+            spool=spool,
+        )
+        self._trackers.append(tracker)
+        return tracker
+
+    async def check_many(  # type: ignore[override]
+        self,
+        customer_id: str,
+        feature_ids: Iterable[str],
+        *,
+        entity_id: Optional[str] = None,
+        required_balance: Optional[int] = 1,
+        send_event: bool = False,
+        local: bool = False,
+        concurrency: int = 10,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, CheckResponse]:
+        """Check if a customer has access to several features.
+
+        The parameters are the same as :meth:`autumn.Client.check_many`, plus:
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum number of checks in flight at once.
+
+        If a check fails, the checks still in flight are cancelled and the error is raised.
+        """
+        if local:
+            assert not send_event, "send_event cannot be used with local"
+            owner = await self._entitlement_owner(customer_id, entity_id)
+            return EntitlementEvaluator(owner).check_many(
+                feature_ids, required_balance=required_balance
+            )
+
+        feature_ids = list(feature_ids)
+        deadline_at = _deadline_at(deadline)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check(feature_id: str) -> CheckResponse:
+            async with semaphore:
+                return await self.check(
+                    customer_id,
+                    feature_id=feature_id,
+                    required_balance=required_balance,
+                    send_event=send_event,
+                    entity_id=entity_id,
+                    deadline=_remaining(deadline_at, "POST", "/check"),
+                )
+
+        tasks = [asyncio.ensure_future(check(f)) for f in feature_ids]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return dict(zip(feature_ids, results))
+
+    def map(
+        self,
+        method: Union[str, Callable[..., Awaitable[Any]]],
+        calls: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> AsyncIterator[MapResult[Any]]:
+        """Call a method once per set of keyword arguments, with bounded concurrency.
+
+        Results are streamed as they become available, so the input may be a lazy iterable of any size.
+        A call that raises does not stop the others: its exception is returned in its :class:`~autumn.aio.fanout.MapResult`.
+
+        Concurrency is capped at the client's connection limit, so the fan-out never waits on the pool.
+        Breaking out of the loop cancels the calls still in flight.
+
+        Example:
+
+        .. code-block:: python
+
+            from autumn import Autumn
+
+            async def main():
+                client = Autumn(token="your_api_key")
+                calls = ({"customer_id": id, "feature_id": "seats"} for id in customer_ids)
+
+                async for item in client.map("check", calls, concurrency=50):
+                    if not item.ok:
+                        print(item.kwargs["customer_id"], item.error)
+
+        Parameters
+        ----------
+        method: Union[str, Callable[..., Awaitable[Any]]]
+            The name of a client method, such as ``"check"`` or ``"customers.get"``, or any coroutine function.
+        calls: Iterable[Dict[str, Any]]
+            The keyword arguments for each call.
+        concurrency: int
+            The maximum number of calls in flight at once.
+        ordered: bool
+            Whether to yield results in input order instead of completion order.
+
+        Returns
+        -------
+        AsyncIterator[:class:`~autumn.aio.fanout.MapResult`]
+            One result per call.
+        """
+        func = (
+            self._resolve_method(method) if isinstance(method, str) else method
+        )
+
+        limit = self.http.connection_limit
+        if limit is not None:
+            concurrency = min(concurrency, limit)
+
+        return _fan_out(
+            func, calls, concurrency=max(concurrency, 1), ordered=ordered
+        )
+
+    def submit(  # type: ignore[override]
+        self, method: str, /, **kwargs: Any
+    ) -> asyncio.Task:
+        """Schedule a client method on the running event loop.
+
+        The ``async`` counterpart of :meth:`autumn.Client.submit`.
+
+        Returns
+        -------
+        :class:`asyncio.Task`
+            A task for the method's return value.
+        """
+        return asyncio.ensure_future(self._resolve_method(method)(**kwargs))
+
+    def leaser(  # type: ignore[override]
+        self,
+        *,
+        chunk: int = 100,
+        ttl: float = 30.0,
+        on_error: Optional[LeaseErrorCallback] = None,
+    ) -> AsyncLeaser:
+        """Create a leaser that answers usage checks locally against balance reserved in chunks.
+
+        See :class:`~autumn.aio.lease.AsyncLeaser`. The parameters are the same as :meth:`autumn.Client.leaser`.
+
+        Returns
+        -------
+        :class:`~autumn.aio.lease.AsyncLeaser`
+            The leaser. Its leases are released when :meth:`close` is awaited.
+        """
+        leaser = AsyncLeaser(self, chunk=chunk, ttl=ttl, on_error=on_error)
+        self._leasers.append(leaser)
+        return leaser
+
+    async def close(self):  # type: ignore[override]
+        # Each stage runs even if an earlier one raises, like Client.close.
+        try:
+            for leaser in self._leasers:
+                await leaser.close()
+        finally:
+            self._leasers.clear()
+            try:
+                for tracker in self._trackers:
+                    await tracker.close()
+            finally:
+                self._trackers.clear()
+                await self.http.close()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+__all__ = ("MapResult",)
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class MapResult(Generic[R]):
+    """The outcome of one call made by :meth:`~autumn.aio.client.AsyncClient.map`.
+
+    Attributes
+    ----------
+    index: int
+        The position of the call's arguments in the input.
+    kwargs: Dict[str, Any]
+        The keyword arguments the method was called with.
+    result: Optional[Any]
+        The value returned by the method, if it succeeded.
+    error: Optional[Exception]
+        The exception raised by the method, if it failed.
+    """
+
+    index: int
+    kwargs: Dict[str, Any]
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> R:
+        """Return the result, or raise the call's exception."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+
+async def _fan_out(
+    func: Callable[..., Awaitable[R]],
+    calls: Iterable[Dict[str, Any]],
+    *,
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[MapResult[R]]:
+    items = enumerate(calls)
+    done: asyncio.Queue[Optional[MapResult[R]]] = asyncio.Queue()
+    # Bounds the calls that are running or finished but not yet yielded, so
+    # neither a slow consumer nor a slow head call (when ordered) lets memory
+    # grow with the size of the input.
+    window = asyncio.Semaphore(concurrency * 2)
+    failures: List[BaseException] = []
+
+    async def worker() -> None:
+        try:
+            while True:
+                await window.acquire()
+                try:
+                    index, kwargs = next(items)
+                except StopIteration:
+                    window.release()
+                    return
+
+                try:
+                    result = await func(**kwargs)
+                except Exception as exc:
+                    done.put_nowait(MapResult(index, kwargs, error=exc))
+                else:
+                    done.put_nowait(MapResult(index, kwargs, result=result))
+        except BaseException as exc:
+            # The input iterable itself failed; stop everything.
+            if not isinstance(exc, asyncio.CancelledError):
+                failures.append(exc)
+            raise
+        finally:
+            done.put_nowait(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    pending: Dict[int, MapResult[R]] = {}
+    next_index = 0
+    finished = 0
+    try:
+        while finished < len(workers):
+            item = await done.get()
+            if item is None:
+                finished += 1
+                if failures:
+                    raise failures[0]
+                continue
+
+            if not ordered:
+                window.release()
+                yield item
+                continue
+
+            pending[item.index] = item
+            while next_index in pending:
+                window.release()
+                yield pending.pop(next_index)
+                next_index += 1
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -1,11 +1,33 @@
 import asyncio
-from typing import Optional, Type, TypeVar
+import time
+from typing import Dict, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
-from ..error import AutumnError, AutumnHTTPError
+from ..circuit import CircuitBreaker
+from ..error import AutumnError
 from ..http import HTTPClient, _RetryRequestError
-from ..utils import ExponentialBackoff, _build_model, _check_response
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..singleflight import _AsyncSingleFlight, _flight_key
+from ..timeouts import (
+    DEFAULT_TIMEOUT,
+    Timeout,
+    _check_deadline,
+    _clamp,
+    _deadline_at,
+    _deadline_exceeded,
+    _remaining,
+    _select_timeout,
+)
+from ..utils import (
+    _build_model_json,
+    _check_raw_response,
+    _decode_error,
+    _encode_body,
+    _http_error,
+)
+from .limits import AdaptiveConcurrencyLimit
 
 try:
     import aiohttp
@@ -18,7 +40,50 @@ except ImportError:
 T = TypeVar("T", bound=BaseModel)
 
 
-__all__ = ("AsyncHTTPClient",)
+__all__ = ("AsyncHTTPClient", "create_connector")
+
+
+def create_connector(
+    *,
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = 15.0,
+    ttl_dns_cache: Optional[int] = 10,
+    force_close: bool = False,
+) -> aiohttp.TCPConnector:
+    """Create an :class:`aiohttp.TCPConnector` tuned for the Autumn API.
+
+    Pass the returned connector to several :class:`~autumn.aio.client.AsyncClient` instances to share one connection pool between them.
+    The connector is not owned by any client, so you must close it yourself once every client using it has been closed.
+
+    This must be called from inside a running event loop.
+
+    Parameters
+    ----------
+    limit: int
+        The total number of simultaneous connections. ``0`` means unlimited.
+    limit_per_host: int
+        The number of simultaneous connections to a single host. ``0`` means unlimited.
+    keepalive_timeout: float
+        The number of seconds an idle connection is kept open for reuse.
+    ttl_dns_cache: Optional[int]
+        The number of seconds resolved DNS entries are cached for. ``None`` caches them forever.
+    force_close: bool
+        Whether to close connections after every request, disabling keep-alive.
+
+    Returns
+    -------
+    :class:`aiohttp.TCPConnector`
+        The connector.
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=None if force_close else keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+        use_dns_cache=True,
+        force_close=force_close,
+    )
 
 
 class AsyncHTTPClient:
@@ -27,51 +92,256 @@ class AsyncHTTPClient:
         base_url: str,
         version: str,
         token: str,
-        attempts: int,
+        retry_policy: RetryPolicy,
         *,
         session: Optional[aiohttp.ClientSession] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: Optional[int] = 10,
+        force_close: bool = False,
+        timeout: Optional[Timeout] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeout]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limit: Optional[AdaptiveConcurrencyLimit] = None,
     ):
         self.base_url = base_url
         self.version = version
         self.session = session  # type: ignore
+        self.connector = connector
+        self._connector_options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": ttl_dns_cache,
+            "force_close": force_close,
+        }
         self._headers = HTTPClient._build_headers(token)
-        self.attempts = attempts
+        self.retry_policy = retry_policy
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.concurrency_limit = concurrency_limit
+        self._single_flight = _AsyncSingleFlight() if single_flight else None
 
         self._build_url = HTTPClient._build_url
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        # A shared connector is owned by whoever created it, so closing this
+        # client must not tear down connections other clients are using.
+        if self.connector is not None:
+            return aiohttp.ClientSession(
+                connector=self.connector, connector_owner=False
+            )
+
+        connector = create_connector(**self._connector_options)
+        return aiohttp.ClientSession(connector=connector)
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # Nothing is awaited between the check and the assignment, so
+        # concurrent first requests on one event loop share a single session.
+        if self.session is None:
+            self.session = self._create_session()
+        return self.session
+
+    @property
+    def connection_limit(self) -> Optional[int]:
+        """The total number of simultaneous connections this client may open. ``None`` means unlimited."""
+        if self.session is not None and self.session.connector is not None:
+            limit = self.session.connector.limit
+        elif self.connector is not None:
+            limit = self.connector.limit
+        else:
+            limit = self._connector_options["limit"]
+        return limit or None
+
+    def _attempt_timeout(
+        self, path: str, remaining: Optional[float]
+    ) -> aiohttp.ClientTimeout:
+        timeout = _select_timeout(path, self.timeout, self.endpoint_timeouts)
+        return aiohttp.ClientTimeout(
+            total=remaining,
+            sock_connect=_clamp(timeout.connect, remaining),
+            sock_read=_clamp(timeout.read, remaining),
+        )
+
     async def request(
-        self, method: str, path: str, type_: Type[T], **kwargs
+        self,
+        method: str,
+        path: str,
+        type_: Type[T],
+        *,
+        deadline: Optional[float] = None,
+        retries: bool = True,
+        **kwargs,
     ) -> T:
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        if self._single_flight is not None:
+            key = _flight_key(method, path, type_, kwargs)
+            if key is not None:
+                return await self._single_flight.do(
+                    key,
+                    lambda: self._request(
+                        method,
+                        path,
+                        type_,
+                        deadline=deadline,
+                        retries=retries,
+                        **kwargs,
+                    ),
+                    deadline,
+                )
 
+        return await self._request(
+            method, path, type_, deadline=deadline, retries=retries, **kwargs
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        type_: Type[T],
+        *,
+        deadline: Optional[float] = None,
+        retries: bool = True,
+        **kwargs,
+    ) -> T:
+        session = self._ensure_session()
         url = self._build_url(self.base_url, self.version, path)
+        _encode_body(kwargs)
 
-        max_attempts = self.attempts
-        backoff = ExponentialBackoff()
-        for attempt in range(max_attempts):
+        deadline_at = _deadline_at(deadline)
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+        concurrency = self.concurrency_limit
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+        retry = 0
+        while True:
+            remaining = _remaining(deadline_at, method, path)
+            if limiter is not None:
+                wait = limiter._reserve(path, remaining)
+                if wait is None:
+                    raise _deadline_exceeded(method, path)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    remaining = _remaining(deadline_at, method, path)
+
+            if concurrency is not None:
+                if not await concurrency._acquire(remaining):
+                    raise _deadline_exceeded(method, path)
+
+            status = retry_after = None
+            sent_at = time.monotonic()
             try:
-                async with self.session.request(
-                    method, url, headers=self._headers, **kwargs
+                # From here on the slot is held, so anything that fails must
+                # go through the handlers below to give it back.
+                if concurrency is not None:
+                    remaining = _remaining(deadline_at, method, path)
+                if breaker is not None:
+                    breaker.before_request(path)
+
+                async with session.request(
+                    method,
+                    url,
+                    headers=self._headers,
+                    timeout=self._attempt_timeout(path, remaining),
+                    **kwargs,
                 ) as resp:
-                    if 500 <= resp.status <= 504:
+                    if resp.status in policy.retry_statuses:
+                        status = resp.status
+                        retry_after = resp.headers.get("Retry-After")
+                        error_data = _decode_error(await resp.read())
                         raise _RetryRequestError()
 
-                    data = await resp.json()
+                    raw = await resp.read()
 
-            except (_RetryRequestError, OSError, asyncio.TimeoutError):
-                if attempt == max_attempts - 1:
-                    raise
+            except (
+                _RetryRequestError,
+                OSError,
+                asyncio.TimeoutError,
+                aiohttp.ClientConnectionError,
+            ) as exc:
+                if concurrency is not None:
+                    concurrency._release(dropped=True)
+                if limiter is not None and status == 429:
+                    limiter.record_throttle(path)
+                if breaker is not None:
+                    if status is None or status >= 500:
+                        breaker.record_failure(path)
+                    else:
+                        breaker.record_success(path)
 
-                await asyncio.sleep(backoff.bedtime)
-                backoff.tick()
+                # Callers that retry on their own, such as trackers, opt out
+                # so that attempts do not multiply.
+                delay = (
+                    policy._next_delay(
+                        method, retry, status=status, retry_after=retry_after
+                    )
+                    if retries
+                    else None
+                )
+                if delay is None:
+                    if status is None:
+                        raise
+                    raise _http_error(status, error_data) from None
+
+                _check_deadline(deadline_at, delay, method, path, exc)
+                await asyncio.sleep(delay)
+                retry += 1
+            except BaseException:
+                if concurrency is not None:
+                    concurrency._release()
+                raise
             else:
-                _check_response(resp.status, data)
-                return _build_model(type_, data)
+                if concurrency is not None:
+                    concurrency._release(time.monotonic() - sent_at)
+                if limiter is not None:
+                    limiter.record_success(path)
+                if breaker is not None:
+                    breaker.record_success(path)
+
+                _check_raw_response(resp.status, raw)
+                return _build_model_json(type_, raw)
+
+    async def warmup(self, connections: int = 10) -> None:
+        """Create the session and open keep-alive connections to the API ahead of traffic.
+
+        Each connection resolves DNS and completes the TCP and TLS handshakes, then stays in the pool for
+        later requests. aiohttp only opens connections for requests, so this sends ``connections`` concurrent
+        ``GET`` requests to the root of the base URL and ignores their responses.
+
+        Parameters
+        ----------
+        connections: int
+            The number of connections to open. Capped at :attr:`connection_limit`.
+        """
+        session = self._ensure_session()
+        limit = self.connection_limit
+        if limit is not None:
+            connections = min(connections, limit)
+
+        url = f"{self.base_url}/"
+        headers = {"User-Agent": self._headers["User-Agent"]}
+        timeout = self._attempt_timeout("/", None)
+
+        async def open_connection() -> None:
+            async with session.get(
+                url, headers=headers, timeout=timeout
+            ) as resp:
+                # Reading the body lets the connection return to the pool.
+                await resp.read()
+
+        await asyncio.gather(*(open_connection() for _ in range(connections)))
 
-        # We should never get here. This is to appease type checkers.
-        msg = f"Max retries reached for {method} {path}"
-        raise AutumnHTTPError(msg, "max_retries_reached", 500)
+    async def resolved(self, value: T) -> T:
+        """Return ``value`` the way :meth:`request` returns a response, for results served without a request."""
+        return value
 
     async def close(self):
         if self.session is not None:
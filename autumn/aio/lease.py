@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import aiohttp
+
+from ..error import AutumnError
+from ..lease import Lease, LeaseErrorCallback, _BaseLeaser, _LeaseKey
+
+if TYPE_CHECKING:
+    from .client import AsyncClient
+
+__all__ = ("AsyncLeaser",)
+
+
+class AsyncLeaser(_BaseLeaser):
+    """Answers usage checks locally against balance reserved from Autumn in chunks.
+
+    The ``async`` counterpart of :class:`~autumn.lease.Leaser`. It must be used from a single event loop.
+
+    Example:
+
+    .. code-block:: python
+
+        from autumn import Autumn
+
+        async def main():
+            client = Autumn(token="your_api_key")
+            leaser = client.leaser(chunk=50)
+
+            if await leaser.check("john_doe", "api_calls"):
+                ...
+
+            await client.close()  # returns unused allowance
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        chunk: int = 100,
+        ttl: float = 30.0,
+        on_error: Optional[LeaseErrorCallback] = None,
+    ):
+        super().__init__(chunk=chunk, ttl=ttl, on_error=on_error)
+        self._client = client
+        self._key_locks: Dict[_LeaseKey, asyncio.Lock] = {}
+
+    def _key_lock(self, key: _LeaseKey) -> asyncio.Lock:
+        lock = self._key_locks.get(key)
+        if lock is None:
+            lock = self._key_locks[key] = asyncio.Lock()
+        return lock
+
+    async def check(
+        self,
+        customer_id: str,
+        feature_id: str,
+        *,
+        value: int = 1,
+        entity_id: Optional[str] = None,
+    ) -> bool:
+        """Use ``value`` of a customer's feature, reserving more balance first if needed.
+
+        See :meth:`autumn.lease.Leaser.check`.
+        """
+        self._check_open()
+        key = (customer_id, feature_id, entity_id)
+
+        # Fast path: no need to touch the lock while the lease covers the call.
+        lease = self._leases.get(key)
+        if lease is not None and lease._take(value):
+            return True
+
+        async with self._key_lock(key):
+            lease = self._leases.get(key)
+            if lease is not None:
+                if lease._take(value):
+                    return True
+                await self._release(lease)
+
+            lease = await self._reserve(key, value)
+            return lease is not None and lease._take(value)
+
+    async def _reserve(self, key: _LeaseKey, value: int) -> Optional[Lease]:
+        amount = max(self.chunk, value)
+        response = await self._client.check(
+            **self._reserve_kwargs(key, amount)
+        )
+
+        fallback = self._fallback_amount(response, amount, value)
+        if fallback is not None:
+            amount = fallback
+            response = await self._client.check(
+                **self._reserve_kwargs(key, amount)
+            )
+
+        return self._grant(key, response, amount)
+
+    async def _release(self, lease: Lease) -> None:
+        key = (lease.customer_id, lease.feature_id, lease.entity_id)
+        if self._leases.get(key) is lease:
+            del self._leases[key]
+
+        kwargs = self._release_kwargs(lease)
+        if kwargs is not None:
+            await self._client.track(**kwargs)
+
+    async def release(
+        self,
+        customer_id: str,
+        feature_id: str,
+        *,
+        entity_id: Optional[str] = None,
+    ) -> None:
+        """Hand the unused part of a customer's lease back to Autumn."""
+        key = (customer_id, feature_id, entity_id)
+        async with self._key_lock(key):
+            lease = self._leases.get(key)
+            if lease is not None:
+                await self._release(lease)
+
+    async def close(self) -> None:
+        """Release every lease.
+
+        Allowance that cannot be handed back, because Autumn answered with an error or could not be reached,
+        is lost. Each such lease is passed to ``on_error`` with the exception.
+        """
+        self._closed = True
+        leases: List[Lease] = list(self._leases.values())
+        for lease in leases:
+            try:
+                await self.release(
+                    lease.customer_id,
+                    lease.feature_id,
+                    entity_id=lease.entity_id,
+                )
+            except (
+                AutumnError,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                OSError,
+            ) as exc:
+                self._report(lease, exc)
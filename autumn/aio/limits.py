@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from ..error import AutumnError
+
+__all__ = ("AdaptiveConcurrencyLimit", "ConcurrencyStats")
+
+# The short-term RTT averages roughly this many samples, which smooths out
+# single slow responses without hiding a real change in latency.
+_SHORT_WINDOW = 10
+
+# The gradient never shrinks the limit by more than half in one step.
+_MIN_GRADIENT = 0.5
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """A snapshot of an :class:`AdaptiveConcurrencyLimit`.
+
+    Attributes
+    ----------
+    limit: int
+        The current number of requests allowed in flight at once.
+    in_flight: int
+        The number of requests currently in flight.
+    queued: int
+        The number of requests waiting for a slot.
+    rtt: Optional[float]
+        The recent average round-trip time, in seconds. ``None`` until a request has completed.
+    baseline_rtt: Optional[float]
+        The long-term average round-trip time, in seconds, that recent latency is compared against.
+    queue_wait: float
+        The recent average time, in seconds, a request waited for a slot.
+    total_queue_wait: float
+        The total time, in seconds, requests spent waiting for a slot.
+    acquired: int
+        The total number of slots handed out.
+    """
+
+    limit: int
+    in_flight: int
+    queued: int
+    rtt: Optional[float]
+    baseline_rtt: Optional[float]
+    queue_wait: float
+    total_queue_wait: float
+    acquired: int
+
+
+class AdaptiveConcurrencyLimit:
+    """A concurrency limit for :class:`~autumn.aio.client.AsyncClient` that adapts to the latency of Autumn's responses.
+
+    Every attempt, including retries, holds a slot while it is in flight. When no slot is free, attempts wait their
+    turn, in order. The limit follows a gradient: the recent round-trip time is compared with its long-term average,
+    and while the two are within ``tolerance`` of each other the limit keeps growing. Once requests start queueing
+    upstream, latency rises and the limit shrinks in proportion, so the client settles near the highest throughput
+    Autumn can serve without added queueing. Timeouts, connection errors and retryable statuses such as ``429`` or
+    ``503`` multiply the limit by ``backoff``.
+
+    The limit never grows while fewer than half of the slots are in use, so a quiet period does not leave it
+    inflated. Keep ``max_limit`` at or below the client's connection ``limit``, otherwise requests queue for a
+    connection instead of a slot and the measured latency includes that wait.
+
+    A limit may be shared between several clients running on the same event loop.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn.aio
+
+        client = autumn.aio.AsyncClient(
+            token="your_api_key",
+            concurrency_limit=autumn.aio.AdaptiveConcurrencyLimit(max_limit=50),
+        )
+        ...
+        print(client.http.concurrency_limit.stats())
+
+    Parameters
+    ----------
+    initial_limit: int
+        The number of requests allowed in flight before any latency has been measured.
+    min_limit: int
+        The limit is never lowered below this.
+    max_limit: int
+        The limit is never raised above this.
+    tolerance: float
+        How many times the long-term round-trip time recent latency may reach before the limit shrinks.
+    smoothing: float
+        How far, between ``0`` and ``1``, the limit moves towards its new target after each response.
+    backoff: float
+        What the limit is multiplied by after a timeout, connection error or retryable status.
+    long_window: int
+        Roughly how many responses the long-term round-trip time averages over.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        backoff: float = 0.9,
+        long_window: int = 600,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise AutumnError(
+                "Expected 1 <= min_limit <= initial_limit <= max_limit",
+                "invalid_concurrency_limit",
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff = backoff
+        self.long_window = long_window
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._short_rtt: Optional[float] = None
+        self._long_rtt: Optional[float] = None
+        self._queue_wait = 0.0
+        self._total_queue_wait = 0.0
+        self._acquired = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight at once."""
+        return int(self._limit)
+
+    def stats(self) -> ConcurrencyStats:
+        """Return a :class:`ConcurrencyStats` snapshot."""
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queued=len(self._waiters),
+            rtt=self._short_rtt,
+            baseline_rtt=self._long_rtt,
+            queue_wait=self._queue_wait,
+            total_queue_wait=self._total_queue_wait,
+            acquired=self._acquired,
+        )
+
+    def _record_wait(self, waited: float) -> None:
+        self._acquired += 1
+        self._total_queue_wait += waited
+        self._queue_wait += (waited - self._queue_wait) / _SHORT_WINDOW
+
+    async def _acquire(self, max_wait: Optional[float]) -> bool:
+        # Returns ``False`` if no slot became free within ``max_wait``.
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._record_wait(0.0)
+            return True
+
+        waiter: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        queued_at = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, max_wait)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the caller gave up.
+                self._release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.TimeoutError):
+                return False
+            raise
+
+        self._record_wait(time.monotonic() - queued_at)
+        return True
+
+    def _release(
+        self, rtt: Optional[float] = None, *, dropped: bool = False
+    ) -> None:
+        # ``rtt`` is set when the attempt got a response, ``dropped`` when it
+        # failed in a way that suggests overload. Otherwise, for example when
+        # it was cancelled, the limit is left alone.
+        in_flight = self._in_flight
+        self._in_flight -= 1
+
+        if dropped:
+            self._limit = max(self.min_limit, self._limit * self.backoff)
+        elif rtt is not None:
+            self._update(rtt, in_flight)
+
+        self._wake()
+
+    def _update(self, rtt: float, in_flight: int) -> None:
+        if self._long_rtt is None or self._short_rtt is None:
+            self._long_rtt = self._short_rtt = rtt
+        else:
+            self._short_rtt += (rtt - self._short_rtt) / _SHORT_WINDOW
+            self._long_rtt += (rtt - self._long_rtt) / self.long_window
+            # The long-term average is slow to follow latency down, so let it
+            # catch up once recent latency is well below it.
+            if self._long_rtt > self._short_rtt * 2:
+                self._long_rtt *= 0.95
+
+        gradient = max(
+            _MIN_GRADIENT,
+            min(1.0, self.tolerance * self._long_rtt / self._short_rtt),
+        )
+        # The square root allows a small queue upstream, which is what lets
+        # the limit probe upwards while latency is flat.
+        target = self._limit * gradient + math.sqrt(self._limit)
+        if target > self._limit and in_flight * 2 < self._limit:
+            return
+
+        limit = self._limit * (1 - self.smoothing) + target * self.smoothing
+        self._limit = max(self.min_limit, min(self.max_limit, limit))
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
@@ -35,6 +35,7 @@ class AttachParams(Protocol):
         free_trial: Optional[bool] = None,
         options: Optional[List[FeatureOptions]] = None,
         reward: Optional[Union[str, List[str]]] = None,
+        deadline: Optional[float] = None,
     ) -> Awaitable[AttachResponse]: ...
 
 
@@ -50,6 +51,7 @@ class CheckParams(Protocol):
         with_preview: bool = False,
         entity_id: Optional[str] = None,
         customer_data: Optional[CustomerData] = None,
+        deadline: Optional[float] = None,
     ) -> Awaitable[CheckResponse]: ...
 
 
@@ -65,6 +67,7 @@ class TrackParams(Protocol):
         idempotency_key: Optional[str] = None,
         properties: Optional[Dict[str, Any]] = None,
         customer_data: Optional[CustomerData] = None,
+        deadline: Optional[float] = None,
     ) -> Awaitable[TrackResponse]: ...
 
 
@@ -82,6 +85,7 @@ class CheckoutParams(Protocol):
         force_checkout: bool = False,
         checkout_session_params: Optional[Dict[str, Any]] = None,
         reward: Optional[Union[str, List[str]]] = None,
+        deadline: Optional[float] = None,
     ) -> Awaitable[CheckoutResponse]: ...
 
 
@@ -92,6 +96,7 @@ class QueryParams(Protocol):
         feature_id: Union[str, List[str]],
         *,
         range: Literal["24h", "7d", "30d", "90d", "last_cycle"] = "30d",
+        deadline: Optional[float] = None,
     ) -> Awaitable[QueryResponse]: ...
 
 
@@ -103,4 +108,5 @@ class CancelParams(Protocol):
         *,
         entity_id: Optional[str] = None,
         cancel_immediately: bool = False,
+        deadline: Optional[float] = None,
     ) -> Awaitable[CancelResponse]: ...
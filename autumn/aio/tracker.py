@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional
+
+from ..models.response import TrackResponse
+from ..tracker import ErrorCallback, TrackerStats, _BaseTracker, _PendingEvent
+
+if TYPE_CHECKING:
+    from ..cache import CheckCache
+    from ..spool import Spool
+    from .http import AsyncHTTPClient
+
+__all__ = ("AsyncTracker",)
+
+
+class AsyncTracker(_BaseTracker):
+    """Sends :meth:`~autumn.aio.client.AsyncClient.track` events from a background task.
+
+    The ``async`` counterpart of :class:`~autumn.tracker.Tracker`. :meth:`track` is a plain method that
+    only appends the event to an in-memory queue, so it must be called from the event loop
+    the tracker runs on. Up to ``concurrency`` events from a batch are sent at once.
+
+    The background task is started by the first call to :meth:`track` or :meth:`flush`, which also sends any
+    events replayed from a spool. As with :class:`~autumn.tracker.Tracker`, each event is written to the spool
+    before :meth:`track` returns, which happens on the event loop; prefer ``fsync="interval"`` so that
+    :meth:`track` does not wait for a disk flush. Acknowledgements are written on a worker thread, and errors
+    from them are passed to ``on_error``.
+
+    Example:
+
+    .. code-block:: python
+
+        from autumn import Autumn
+
+        async def main():
+            client = Autumn(token="your_api_key")
+            tracker = client.tracker(max_batch=200, flush_interval=0.5)
+
+            tracker.track("john_doe", "chat_messages", value=1)
+
+            await client.close()  # flushes the tracker
+    """
+
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+        max_attempts: int = 3,
+        concurrency: int = 10,
+        on_error: Optional[ErrorCallback] = None,
+        coalesce: bool = False,
+        check_cache: Optional[CheckCache] = None,
+        spool: Optional[Spool] = None,
+    ):
+        super().__init__(
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            max_queue=max_queue,
+            max_attempts=max_attempts,
+            on_error=on_error,
+            coalesce=coalesce,
+            check_cache=check_cache,
+            spool=spool,
+            retry_policy=http.retry_policy,
+        )
+        self._http = http
+        self._concurrency = concurrency
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._drained: Optional[asyncio.Event] = None
+        self._spool_executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def stats(self) -> TrackerStats:
+        """The current :class:`~autumn.tracker.TrackerStats`."""
+        return self._stats()
+
+    def _start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._drained = asyncio.Event()
+            if self._unfinished == 0:
+                self._drained.set()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _enqueue(self, event: _PendingEvent) -> Optional[str]:
+        self._start()
+        queued = self._admit(event)
+        if queued is None:
+            self._report(event, self._queue_full_error())
+            return None
+
+        self._drained.clear()  # type: ignore
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()  # type: ignore
+        return queued
+
+    def _ack(self, event: _PendingEvent) -> None:
+        # Acknowledgements may fsync or commit, so they run on a single
+        # thread instead of blocking the event loop. The event's append was
+        # written before track() returned, so the ack cannot overtake it.
+        if self._spool is None:
+            return
+        if self._spool_executor is None:
+            self._spool_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="autumn-spool"
+            )
+        future = asyncio.get_running_loop().run_in_executor(
+            self._spool_executor,
+            self._spool.ack,
+            [event.payload["idempotency_key"]],
+        )
+        future.add_done_callback(partial(self._spool_written, event))
+
+    def _spool_written(
+        self, event: _PendingEvent, future: asyncio.Future
+    ) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            self._report(event, future.exception())  # type: ignore
+
+    async def _shutdown_spool(self) -> None:
+        executor = self._spool_executor
+        if executor is None:
+            self._close_spool()
+            return
+
+        # Queued behind every pending write.
+        await asyncio.get_running_loop().run_in_executor(
+            executor, self._close_spool
+        )
+        executor.shutdown(wait=False)
+
+    def _ready(self) -> bool:
+        # A flush does not cut short the backoff of delayed events.
+        return (
+            self._closed
+            or (self._flush_requested and len(self._buffer) > 0)
+            or len(self._buffer) >= self.max_batch
+        )
+
+    async def _next_batch(self) -> Optional[List[_PendingEvent]]:
+        wakeup = self._wakeup
+        assert wakeup is not None
+
+        timeout = self.flush_interval
+        retry_wait = self._retry_wait()
+        if retry_wait is not None:
+            timeout = min(timeout, retry_wait)
+        if not self._ready() and timeout > 0:
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        wakeup.clear()
+
+        self._release_retries()
+        batch = self._buffer.take(self.max_batch)
+        if not batch and self._closed:
+            return None
+
+        self._in_flight += len(batch)
+        return batch
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def send(event: _PendingEvent) -> None:
+            async with semaphore:
+                await self._send(event)
+
+        while True:
+            batch = await self._next_batch()
+            if batch is None:
+                return
+
+            await asyncio.gather(*(send(event) for event in batch))
+
+    async def _send(self, event: _PendingEvent) -> None:
+        try:
+            await self._http.request(
+                "POST",
+                "/track",
+                TrackResponse,
+                retries=False,
+                json=event.payload,
+            )
+        except Exception as exc:
+            self._in_flight -= 1
+            event.attempts += 1
+            if self._retryable(exc) and event.attempts < self.max_attempts:
+                self._retry_later(event)
+                return
+
+            self._failed += event.count
+            self._finish()
+            self._give_up(event, exc)
+        else:
+            self._ack(event)
+            self._in_flight -= 1
+            self._sent += event.count
+            self._finish()
+
+    def _finish(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._flush_requested = False
+            self._drained.set()  # type: ignore
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send every queued event now and wait for them to finish.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            The maximum number of seconds to wait. ``None`` waits until the queue is empty.
+
+        Returns
+        -------
+        bool
+            Whether every event was either sent or given up on before the timeout.
+        """
+        if self._unfinished == 0:
+            return True
+
+        self._start()
+        self._flush_requested = True
+        self._wakeup.set()  # type: ignore
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)  # type: ignore
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Flush the queue and stop the background task.
+
+        Events waiting to be retried are sent without waiting out their backoff.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            The maximum number of seconds to wait for the queue to drain.
+        """
+        self._closed = True
+        await self.flush(timeout)
+        if self._task is None:
+            await self._shutdown_spool()
+            return
+
+        self._wakeup.set()  # type: ignore
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await self._shutdown_spool()
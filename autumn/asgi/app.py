@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypedDict
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    Optional,
+    TypedDict,
+)
 
 try:
-    from starlette.middleware import Middleware
-    from starlette.middleware.base import BaseHTTPMiddleware
     from starlette.responses import JSONResponse
     from starlette.routing import Route, Router
 except ImportError:
@@ -20,14 +28,18 @@ else:
     STARLETTE_INSTALLED = True
 
 from ..aio.client import AsyncClient
+from ..aio.tracker import AsyncTracker
+from ..cache import TTLCache
 from ..error import AutumnHTTPError
 from .routes.core import (
     attach_route,
     billing_portal_route,
     cancel_route,
+    check_batch_route,
     check_route,
     checkout_route,
     query_route,
+    track_batch_route,
     track_route,
 )
 from .routes.customers import create_customer_route, pricing_table_route
@@ -52,35 +64,136 @@ class AutumnIdentifyData(TypedDict):
     customer_data: _CustomerData
 
 
-class _StateMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, *, client, identify):
-        super().__init__(app)
-        self._client = client
+IdentifyFunc = Callable[["Request"], Coroutine[Any, Any, AutumnIdentifyData]]
+IdentifyCacheKeyFunc = Callable[["Request"], Optional[Hashable]]
+
+
+class _CachedIdentify:
+    def __init__(
+        self,
+        identify: IdentifyFunc,
+        key: IdentifyCacheKeyFunc,
+        cache: TTLCache[Hashable, AutumnIdentifyData],
+    ):
         self._identify = identify
+        self._key = key
+        self._cache = cache
+        self._pending: Dict[Hashable, asyncio.Task[AutumnIdentifyData]] = {}
 
-    async def dispatch(self, request: Request, call_next):
-        request.state.__autumn__ = {
-            "client": self._client,
-            "identify": self._identify,
-        }
-        return await call_next(request)
+    async def _load(
+        self, key: Hashable, request: Request
+    ) -> AutumnIdentifyData:
+        try:
+            data = await self._identify(request)
+            self._cache.set(key, data)
+            return data
+        finally:
+            del self._pending[key]
+
+    async def __call__(self, request: Request) -> AutumnIdentifyData:
+        key = self._key(request)
+        if key is None:
+            return await self._identify(request)
+
+        data = self._cache.get(key)
+        if data is not None:
+            return data
+
+        # A page load fires several requests at once. The first one to miss
+        # identifies the user and the others wait for its result.
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(
+                self._load(key, request)
+            )
+        return await asyncio.shield(task)
 
 
 class AutumnASGI:
+    """An ASGI app serving the routes used by the ``autumn-js`` frontend library.
+
+    Parameters
+    ----------
+    token: str
+        Your Autumn secret key.
+    identify: Callable[[Request], Coroutine[Any, Any, AutumnIdentifyData]]
+        Returns the customer making a request.
+    identify_cache_key: Optional[Callable[[Request], Optional[Hashable]]]
+        Returns a key, such as a session cookie or bearer token, under which the result of ``identify`` is cached.
+        Requests for which it returns ``None`` are always identified. Concurrent requests with the same key share
+        one ``identify`` call. ``None`` disables caching.
+    identify_cache: Optional[:class:`~autumn.cache.TTLCache`]
+        Where identities are cached. Defaults to 10,000 entries kept for 60 seconds. Pop a key from it to forget
+        an identity early, for example on logout. Unused without ``identify_cache_key``.
+    max_batch: int
+        The maximum number of items accepted by a batch route such as ``/check/batch/``.
+    batch_concurrency: int
+        The maximum number of upstream requests a single batch has in flight at once.
+    buffer_track: bool
+        Whether ``/track/`` and ``/track/batch/`` queue events in a background :class:`~autumn.aio.tracker.AsyncTracker`
+        and answer ``202 Accepted`` at once, instead of waiting for Autumn. Each accepted event is returned with
+        the code ``event_queued`` and the idempotency key of the request that will carry it as its ``id``. If the
+        queue is full, ``/track/`` answers ``503``. ``/track/batch/`` answers ``207`` when only some events were
+        queued, and ``400`` or ``503`` when none were. Events still queued are sent when :meth:`close` is awaited.
+    tracker_options: Optional[Dict[str, Any]]
+        Keyword arguments for :meth:`~autumn.aio.client.AsyncClient.tracker`, such as ``flush_interval`` or ``spool``.
+
+    Attributes
+    ----------
+    tracker: Optional[:class:`~autumn.aio.tracker.AsyncTracker`]
+        The tracker used when ``buffer_track`` is set.
+    """
+
     def __init__(
         self,
         token: str,
         *,
-        identify: Callable[[Request], Coroutine[Any, Any, AutumnIdentifyData]],
+        identify: IdentifyFunc,
+        identify_cache_key: Optional[IdentifyCacheKeyFunc] = None,
+        identify_cache: Optional[
+            TTLCache[Hashable, AutumnIdentifyData]
+        ] = None,
+        max_batch: int = 100,
+        batch_concurrency: int = 10,
+        buffer_track: bool = False,
+        tracker_options: Optional[Dict[str, Any]] = None,
     ):
         self._client = AsyncClient(token)
+        self.identify_cache = identify_cache
+        if identify_cache_key is not None:
+            if self.identify_cache is None:
+                self.identify_cache = TTLCache(maxsize=10_000, ttl=60.0)
+            identify = _CachedIdentify(
+                identify, identify_cache_key, self.identify_cache
+            )
         self._identify = identify
+        self.tracker: Optional[AsyncTracker] = None
+        if buffer_track:
+            self.tracker = self._client.tracker(**(tracker_options or {}))
+        # Routes read this through ``request.state.__autumn__``.
+        self._state = {
+            "client": self._client,
+            "identify": self._identify,
+            "max_batch": max_batch,
+            "batch_concurrency": batch_concurrency,
+            "tracker": self.tracker,
+        }
 
         router = Router(
             routes=[
                 Route("/attach/", attach_route, methods={"POST"}),
                 Route("/check/", check_route, methods={"POST"}),
+                Route(
+                    "/check/batch/",
+                    check_batch_route,
+                    methods={"POST"},
+                ),
                 Route("/track/", track_route, methods={"POST"}),
+                Route(
+                    "/track/batch/",
+                    track_batch_route,
+                    methods={"POST"},
+                ),
                 Route("/cancel/", cancel_route, methods={"POST"}),
                 Route("/query/", query_route, methods={"POST"}),
                 Route(
@@ -116,23 +229,17 @@ class AutumnASGI:
                     methods={"GET"},
                 ),
             ],
-            middleware=[
-                Middleware(
-                    _StateMiddleware,
-                    client=self._client,
-                    identify=self._identify,
-                )
-            ],
         )
         self._router = router
 
-    async def _handle_http_error(self, _: Request, exc: AutumnHTTPError):
-        return JSONResponse({"message": f"{exc.message} ({exc.code})"})
-
     async def close(self):
+        """Send any buffered track events, then close the underlying client."""
         await self._client.close()
 
     async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] in ("http", "websocket"):
+            scope.setdefault("state", {})["__autumn__"] = self._state
+
         try:
             await self._router(scope, receive, send)
         except AutumnHTTPError as exc:
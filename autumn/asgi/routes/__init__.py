@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Tuple
+import json as _json
+from typing import TYPE_CHECKING, Any, Iterable, Tuple, Union
 
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+from ...error import AutumnError
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
@@ -26,5 +29,38 @@ async def _extract(
     return (identify, client, json)
 
 
-def _build_response(response: BaseModel) -> JSONResponse:
-    return JSONResponse(response.model_dump(mode="json"))
+def _build_response(
+    response: BaseModel, *, status_code: int = 200
+) -> Response:
+    # Serialized once by pydantic, instead of being dumped to a dict and
+    # encoded again by JSONResponse.
+    return Response(
+        response.model_dump_json().encode(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _build_batch_response(
+    results: Iterable[Union[BaseModel, AutumnError]],
+    *,
+    status_code: int = 200,
+) -> Response:
+    # Each item is either a response or the error that replaced it, so one
+    # failed item does not fail the batch.
+    parts = []
+    for result in results:
+        if isinstance(result, AutumnError):
+            error = {"code": result.code, "message": result.message}
+            parts.append(_json.dumps({"error": error}).encode())
+        else:
+            parts.append(result.model_dump_json().encode())
+
+    body = b'{"results":[' + b",".join(parts) + b"]}"
+    return Response(
+        body, status_code=status_code, media_type="application/json"
+    )
+
+
+def _bad_request(detail: str) -> JSONResponse:
+    return JSONResponse({"detail": detail}, status_code=400)
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from starlette.responses import JSONResponse
+
+from ...error import AutumnError
 from ...models.meta import CustomerData
+from ...models.response import TrackResponse
 from ...utils import _build_payload as _build_kwargs
-from . import _build_response, _extract
+from . import (
+    _bad_request,
+    _build_batch_response,
+    _build_response,
+    _extract,
+)
 
 if TYPE_CHECKING:
+    from pydantic import BaseModel
     from starlette.requests import Request
 
+    from ...aio.client import AsyncClient
+    from ...aio.tracker import AsyncTracker
+
 
 async def attach_route(request: Request):
     identify, autumn, json = await _extract(request)
@@ -34,16 +47,182 @@ async def check_route(request: Request):
     return _build_response(response)
 
 
+def _batch_items(
+    json: Any, field: str, options: Dict[str, Any]
+) -> Union[List[Dict[str, Any]], JSONResponse]:
+    items = json.get(field) if isinstance(json, dict) else None
+    if not isinstance(items, list) or not all(
+        isinstance(item, dict) for item in items
+    ):
+        return _bad_request(f"Expected a list of {field} under '{field}'")
+    if len(items) > options["max_batch"]:
+        return _bad_request(
+            f"A batch may contain at most {options['max_batch']} {field}"
+        )
+    return items
+
+
+def _require_one_of(
+    kwargs: Dict[str, Any], *fields: str
+) -> Optional[AutumnError]:
+    if all(kwargs.get(field) is None for field in fields):
+        return AutumnError(
+            f"Either {' or '.join(fields)} must be provided", "invalid_inputs"
+        )
+    return None
+
+
+def _batch_calls(
+    autumn: AsyncClient,
+    method: str,
+    customer_id: str,
+    items: List[Dict[str, Any]],
+    *required: str,
+) -> List[Union[Dict[str, Any], AutumnError]]:
+    calls: List[Union[Dict[str, Any], AutumnError]] = []
+    for item in items:
+        kwargs = _build_kwargs(item, getattr(autumn, method))
+        kwargs["customer_id"] = customer_id
+        calls.append(_require_one_of(kwargs, *required) or kwargs)
+    return calls
+
+
+async def _map_batch(
+    autumn: AsyncClient,
+    method: str,
+    calls: List[Union[Dict[str, Any], AutumnError]],
+    options: Dict[str, Any],
+) -> List[Union[BaseModel, AutumnError]]:
+    # Items that failed validation keep their error and are not sent; the
+    # others are replaced by their outcome below.
+    results: List[Any] = list(calls)
+    pending = [i for i, call in enumerate(calls) if isinstance(call, dict)]
+
+    async for item in autumn.map(
+        method,
+        (calls[i] for i in pending),
+        concurrency=options["batch_concurrency"],
+        ordered=True,
+    ):
+        index = pending[item.index]
+        error = item.error
+        if error is None:
+            results[index] = item.result
+        elif isinstance(error, AutumnError):
+            results[index] = error
+        else:
+            # Anything else, such as a timeout, fails only its own item.
+            results[index] = AutumnError(
+                str(error) or type(error).__name__, "request_failed"
+            )
+    return results
+
+
+def _queue_track(
+    tracker: AsyncTracker, customer_id: str, event: Dict[str, Any]
+) -> Union[TrackResponse, AutumnError]:
+    kwargs = _build_kwargs(event, tracker.track)
+    kwargs["customer_id"] = customer_id
+    error = _require_one_of(kwargs, "feature_id", "event_name")
+    if error is not None:
+        return error
+
+    try:
+        key = tracker.track(**kwargs)
+    except AutumnError as exc:
+        return exc
+    if key is None:
+        return AutumnError(
+            f"The tracker queue is full ({tracker.max_queue} events).",
+            "tracker_queue_full",
+        )
+
+    return TrackResponse(
+        id=key,
+        code="event_queued",
+        customer_id=customer_id,
+        feature_id=kwargs.get("feature_id"),
+        event_name=kwargs.get("event_name"),
+    )
+
+
+def _queued_status(results: List[Union[TrackResponse, AutumnError]]) -> int:
+    errors = [result for result in results if isinstance(result, AutumnError)]
+    if not errors:
+        return 202
+    if len(errors) < len(results):
+        return 207
+    # Nothing was queued: a client error if every event was invalid,
+    # otherwise the tracker is the problem.
+    if all(error.code == "invalid_inputs" for error in errors):
+        return 400
+    return 503
+
+
+async def check_batch_route(request: Request):
+    identify, autumn, json = await _extract(request)
+    options = getattr(request.state, "__autumn__")
+
+    checks = _batch_items(json, "checks", options)
+    if isinstance(checks, JSONResponse):
+        return checks
+
+    calls = _batch_calls(
+        autumn,
+        "check",
+        identify["customer_id"],
+        checks,
+        "feature_id",
+        "product_id",
+    )
+    results = await _map_batch(autumn, "check", calls, options)
+    return _build_batch_response(results)
+
+
 async def track_route(request: Request):
     identify, autumn, json = await _extract(request)
 
     customer_id = identify["customer_id"]
+    tracker = getattr(request.state, "__autumn__").get("tracker")
+    if tracker is not None:
+        result = _queue_track(tracker, customer_id, json)
+        if isinstance(result, AutumnError):
+            return JSONResponse(
+                {"detail": str(result)}, status_code=_queued_status([result])
+            )
+        return _build_response(result, status_code=202)
+
     kwargs = _build_kwargs(json, autumn.track)
 
     response = await autumn.track(customer_id, **kwargs)
     return _build_response(response)
 
 
+async def track_batch_route(request: Request):
+    identify, autumn, json = await _extract(request)
+    options = getattr(request.state, "__autumn__")
+
+    events = _batch_items(json, "events", options)
+    if isinstance(events, JSONResponse):
+        return events
+
+    customer_id = identify["customer_id"]
+    tracker = options.get("tracker")
+    if tracker is not None:
+        queued = [
+            _queue_track(tracker, customer_id, event) for event in events
+        ]
+        return _build_batch_response(
+            queued, status_code=_queued_status(queued)
+        )
+
+    calls = _batch_calls(
+        autumn, "track", customer_id, events, "feature_id", "event_name"
+    )
+    results = await _map_batch(autumn, "track", calls, options)
+    return _build_batch_response(results)
+
+
 async def cancel_route(request: Request):
     identify, autumn, json = await _extract(request)
 
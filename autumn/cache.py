@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from .models.response import CheckResponse
+
+__all__ = ("TTLCache", "CheckCache")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_CheckKey = Tuple[
+    str, Optional[str], Optional[str], Optional[str], Optional[int]
+]
+
+
+class TTLCache(Generic[K, V]):
+    """A thread-safe, size-bounded cache whose entries expire after ``ttl`` seconds.
+
+    Once ``maxsize`` entries are stored, the least recently used one is evicted to make room.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of entries kept.
+    ttl: float
+        The number of seconds an entry is kept after it is stored.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value stored for ``key``, or ``None`` if there is none or it has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._removed(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` for ``key``, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self._added(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._removed(evicted)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove ``key`` from the cache, returning its value if it was stored."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._removed(key)
+            return entry[1]
+
+    def discard(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches ``predicate``, returning how many were removed."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+                self._removed(key)
+            return len(keys)
+
+    def _replace(
+        self,
+        update: Callable[[K, V], Optional[V]],
+        keys: Optional[Iterable[K]] = None,
+    ) -> None:
+        # Rewrites entries in place without extending their lifetime. An
+        # update returning ``None`` removes the entry. Only ``keys`` are
+        # visited, if given.
+        with self._lock:
+            if keys is None:
+                keys = self._entries
+            for key in list(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                updated = update(key, value)
+                if updated is None:
+                    del self._entries[key]
+                    self._removed(key)
+                elif updated is not value:
+                    self._entries[key] = (expires_at, updated)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._cleared()
+
+    # Hooks for subclasses that index entries. They are called with the
+    # lock held.
+
+    def _added(self, key: K) -> None:
+        pass
+
+    def _removed(self, key: K) -> None:
+        pass
+
+    def _cleared(self) -> None:
+        pass
+
+
+class _CustomerIndexedCache(TTLCache[_CheckKey, CheckResponse]):
+    # Keeps the keys of each customer's entries, so that a change for one
+    # customer does not scan the whole cache.
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._by_customer: Dict[str, Set[_CheckKey]] = {}
+
+    def _added(self, key: _CheckKey) -> None:
+        self._by_customer.setdefault(key[0], set()).add(key)
+
+    def _removed(self, key: _CheckKey) -> None:
+        keys = self._by_customer.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_customer[key[0]]
+
+    def _cleared(self) -> None:
+        self._by_customer.clear()
+
+    def _replace_customer(
+        self,
+        customer_id: str,
+        update: Callable[[_CheckKey, CheckResponse], Optional[CheckResponse]],
+    ) -> None:
+        # The set is copied under the lock by _replace.
+        self._replace(update, self._by_customer.get(customer_id, ()))
+
+    def _discard_customer(self, customer_id: str) -> None:
+        with self._lock:
+            for key in list(self._by_customer.get(customer_id, ())):
+                del self._entries[key]
+                self._removed(key)
+
+
+class CheckCache:
+    """Caches :meth:`~autumn.Client.check` responses for a short time.
+
+    Responses are keyed by ``(customer_id, feature_id, product_id, entity_id, required_balance)``.
+    Checks that send an event or ask for a preview always go to Autumn.
+
+    The cache is kept roughly in step with the client that owns it:
+
+    - ``check(send_event=True)`` and ``track()`` subtract the value used from the cached ``balance``
+      of every entry for that customer, feature and entity. An entry whose balance falls below its
+      ``required_balance`` is dropped, so the next check asks Autumn again.
+    - ``attach()``, ``cancel()`` and ``checkout()`` drop every entry for the customer.
+
+    Usage recorded elsewhere (by another process or from the dashboard) is only picked up once an entry expires,
+    so keep ``ttl`` short.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(
+            token="your_api_key",
+            check_cache=autumn.CheckCache(ttl=5.0),
+        )
+
+        # Only the first call goes to Autumn.
+        for _ in range(10):
+            client.check("john_doe", feature_id="chat_messages")
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of responses kept.
+    ttl: float
+        The number of seconds a response is kept.
+    """
+
+    def __init__(self, *, maxsize: int = 10_000, ttl: float = 5.0):
+        self._cache = _CustomerIndexedCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        # A response is only stored if no local change for its customer
+        # happened while it was in flight. Changes are stamped with a clock
+        # that ticks on each one; the stamps of the most recent ``maxsize``
+        # customers are kept, and older ones (and clear()) count as having
+        # happened at ``_floor``.
+        self._clock = 0
+        self._changes: OrderedDict[str, int] = OrderedDict()
+        self._floor = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of checks answered from the cache."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """The number of checks that had to ask Autumn."""
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _get(self, key: _CheckKey) -> Optional[CheckResponse]:
+        return self._cache.get(key)
+
+    def _put(
+        self, key: _CheckKey, generation: int, response: CheckResponse
+    ) -> CheckResponse:
+        with self._lock:
+            if self._changes.get(key[0], self._floor) <= generation:
+                self._cache.set(key, response)
+        return response
+
+    @property
+    def _current_generation(self) -> int:
+        with self._lock:
+            return self._clock
+
+    def _changed(self, customer_id: str) -> None:
+        # Must be called with the lock held.
+        self._clock += 1
+        self._changes[customer_id] = self._clock
+        self._changes.move_to_end(customer_id)
+        if len(self._changes) > self._cache.maxsize:
+            _, self._floor = self._changes.popitem(last=False)
+
+    def consume(
+        self,
+        customer_id: str,
+        feature_id: str,
+        value: float,
+        *,
+        entity_id: Optional[str] = None,
+    ) -> None:
+        """Subtract ``value`` from the cached balance of a customer's feature."""
+
+        def update(
+            key: _CheckKey, response: CheckResponse
+        ) -> Optional[CheckResponse]:
+            if key[1] != feature_id or key[3] != entity_id:
+                return response
+            if response.balance is None:
+                return response
+
+            balance = response.balance - value
+            if balance < (key[4] or 0):
+                return None
+            return response.model_copy(update={"balance": balance})
+
+        with self._lock:
+            self._changed(customer_id)
+            self._cache._replace_customer(customer_id, update)
+
+    def _record_usage(
+        self,
+        customer_id: str,
+        feature_id: Optional[str],
+        value: float,
+        entity_id: Optional[str],
+    ) -> None:
+        # Usage tracked by event name could affect any feature.
+        if feature_id is None:
+            self.invalidate(customer_id)
+        else:
+            self.consume(customer_id, feature_id, value, entity_id=entity_id)
+
+    def invalidate(self, customer_id: str) -> None:
+        """Drop every cached response for ``customer_id``."""
+        with self._lock:
+            self._changed(customer_id)
+            self._cache._discard_customer(customer_id)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._clock += 1
+            self._floor = self._clock
+            self._changes.clear()
+            self._cache.clear()
@@ -0,0 +1,175 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict
+
+from .error import AutumnCircuitOpenError
+from .utils import _endpoint
+
+__all__ = ("CircuitState", "CircuitBreaker")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    def __init__(self, window_size: int):
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probed_at = 0.0
+
+
+class CircuitBreaker:
+    """A circuit breaker keyed by API endpoint.
+
+    Each endpoint (the first segment of the request path, e.g. ``/check`` or ``/customers``) has its own circuit.
+    While a circuit is closed, the outcome of every attempt is recorded in a sliding window. Once at least
+    ``minimum_calls`` outcomes have been recorded and the share of failures reaches ``failure_rate_threshold``,
+    the circuit opens and requests to that endpoint fail immediately with :class:`~autumn.error.AutumnCircuitOpenError`.
+
+    After ``open_timeout`` seconds the circuit becomes half-open and lets ``half_open_max_calls`` probe requests through.
+    A successful probe closes the circuit; a failed one opens it again.
+
+    Connection errors, timeouts and 5xx responses count as failures. Every other response counts as a success.
+
+    A breaker is thread-safe and may be shared between several clients.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(
+            token="your_api_key",
+            circuit_breaker=autumn.CircuitBreaker(open_timeout=10.0),
+        )
+
+        try:
+            allowed = client.check("john_doe", feature_id="chat_messages").allowed
+        except autumn.AutumnCircuitOpenError:
+            allowed = True  # fail open while Autumn is unavailable
+
+    Parameters
+    ----------
+    failure_rate_threshold: float
+        The share of failed attempts, between 0 and 1, that opens the circuit.
+    minimum_calls: int
+        The number of attempts that must be recorded before the failure rate is evaluated.
+    window_size: int
+        The number of most recent attempts the failure rate is computed over.
+    open_timeout: float
+        The number of seconds a circuit stays open before a probe request is allowed through.
+    half_open_max_calls: int
+        The number of concurrent probe requests allowed while the circuit is half-open.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 50,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_size = window_size
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit(self.window_size)
+        return circuit
+
+    def state(self, path: str) -> CircuitState:
+        """Return the state of the circuit guarding ``path``."""
+        with self._lock:
+            circuit = self._circuit(_endpoint(path))
+            if (
+                circuit.state is CircuitState.OPEN
+                and time.monotonic() - circuit.opened_at >= self.open_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def before_request(self, path: str) -> None:
+        """Raise :class:`~autumn.error.AutumnCircuitOpenError` if the circuit for ``path`` does not allow a request."""
+        endpoint = _endpoint(path)
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state is CircuitState.CLOSED:
+                return
+
+            now = time.monotonic()
+            if circuit.state is CircuitState.OPEN:
+                waited = now - circuit.opened_at
+                if waited < self.open_timeout:
+                    raise AutumnCircuitOpenError(
+                        f"Circuit for {endpoint} is open",
+                        "circuit_open",
+                        endpoint=endpoint,
+                        retry_after=self.open_timeout - waited,
+                    )
+
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes = 0
+
+            # A probe that never reported back (e.g. it raised an unexpected
+            # exception) must not wedge the circuit half-open forever.
+            if now - circuit.probed_at >= self.open_timeout:
+                circuit.probes = 0
+
+            if circuit.probes >= self.half_open_max_calls:
+                raise AutumnCircuitOpenError(
+                    f"Circuit for {endpoint} is half-open and waiting on a probe",
+                    "circuit_open",
+                    endpoint=endpoint,
+                    retry_after=0.0,
+                )
+            circuit.probes += 1
+            circuit.probed_at = now
+
+    def record_success(self, path: str) -> None:
+        """Record a successful attempt against ``path``."""
+        with self._lock:
+            circuit = self._circuit(_endpoint(path))
+            if circuit.state is not CircuitState.CLOSED:
+                circuit.state = CircuitState.CLOSED
+                circuit.outcomes.clear()
+                circuit.probes = 0
+
+            circuit.outcomes.append(True)
+
+    def record_failure(self, path: str) -> None:
+        """Record a failed attempt against ``path``, opening its circuit if the threshold is reached."""
+        with self._lock:
+            circuit = self._circuit(_endpoint(path))
+            if circuit.state is not CircuitState.CLOSED:
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+                return
+
+            circuit.outcomes.append(False)
+            total = len(circuit.outcomes)
+            if total < self.minimum_calls:
+                return
+
+            failures = total - sum(circuit.outcomes)
+            if failures / total >= self.failure_rate_threshold:
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.outcomes.clear()
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
+from .cache import CheckCache
+from .circuit import CircuitBreaker
 from .customers import Customers
 from .entities import Entities
+from .evaluator import EntitlementEvaluator
 from .features import Features
 from .http import HTTPClient
+from .lease import LeaseErrorCallback, Leaser
 from .models.response import (
     AttachResponse,
     CancelResponse,
@@ -15,7 +31,12 @@ from .models.response import (
     TrackResponse,
 )
 from .products import Products
-from .utils import _build_payload
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .spool import Spool
+from .timeouts import Timeout, _deadline_at, _remaining
+from .tracker import ErrorCallback, Tracker
+from .utils import _build_payload, _then
 
 if TYPE_CHECKING:
     from .models.features import Feature
@@ -23,6 +44,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Client",)
 
+_UNSCHEDULABLE = frozenset({"close", "map", "submit"})
+
 
 class Client:
     """
@@ -73,9 +96,32 @@ class Client:
     token: str
         The API key to use for authentication.
     max_retries: int
-        The maximum number of retries to attempt for failed requests.
+        The maximum number of retries to attempt for failed requests. Ignored when ``retry_policy`` is given.
+    retry_policy: Optional[:class:`~autumn.retry.RetryPolicy`]
+        Controls backoff, which failures are retried and the retry budget. Share one policy between clients to share its budget.
     base_url: Optional[str]
         The base URL of the Autumn API. This is useful when you are self-hosting Autumn and need to point to your own instance.
+    pool_connections: int
+        The number of per-host connection pools to cache.
+    pool_maxsize: int
+        The maximum number of connections kept open per host. Set this to at least the number of threads sharing the client.
+    pool_block: bool
+        Whether to wait for a free connection when the pool is exhausted, instead of opening a throwaway one.
+    keepalive_timeout: Optional[float]
+        The number of seconds a connection may sit idle in the pool before it is closed and replaced. ``None`` keeps connections indefinitely.
+    timeout: Optional[:class:`~autumn.timeouts.Timeout`]
+        The connect and read timeouts applied to each attempt. Defaults to 5 seconds to connect and 30 seconds to read.
+    endpoint_timeouts: Optional[Dict[str, :class:`~autumn.timeouts.Timeout`]]
+        Timeouts for specific endpoints, keyed by path (e.g. ``"/check"``). The longest matching path prefix is used.
+    circuit_breaker: Optional[:class:`~autumn.circuit.CircuitBreaker`]
+        A circuit breaker that fails requests to a degraded endpoint immediately with :class:`~autumn.error.AutumnCircuitOpenError`.
+    check_cache: Optional[:class:`~autumn.cache.CheckCache`]
+        A cache that answers repeated :meth:`check` calls locally for a short time.
+    single_flight: bool
+        Whether identical ``GET`` requests (same path and parameters) that are in flight at the same time share one
+        upstream call. Every caller then receives the same model instance, so do not mutate it.
+    rate_limiter: Optional[:class:`~autumn.ratelimit.RateLimiter`]
+        A limiter that paces every attempt, including retries, and slows down when Autumn answers ``429``.
 
     Attributes
     ----------
@@ -87,6 +133,10 @@ class Client:
         An interface to Autumn's product API.
     entities: :class:`~autumn.entities.Entities`
         An interface to Autumn's entities API.
+    http: :class:`~autumn.http.HTTPClient`
+        The underlying HTTP client. Call :meth:`~autumn.http.HTTPClient.pool_stats` to inspect connection pool usage.
+    check_cache: Optional[:class:`~autumn.cache.CheckCache`]
+        The check cache, if one was given.
     """
 
     def __init__(
@@ -95,18 +145,246 @@ class Client:
         *,
         base_url: Optional[str] = None,
         max_retries: int = 5,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        timeout: Optional[Timeout] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeout]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        check_cache: Optional[CheckCache] = None,
+        single_flight: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         from . import BASE_URL, VERSION
 
         _base_url = base_url or BASE_URL
         _base_url = _base_url.rstrip("/")
 
-        attempts = max_retries + 1  # account for the original request
-        self.http = HTTPClient(_base_url, VERSION, token, attempts=attempts)
+        retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.http = HTTPClient(
+            _base_url,
+            VERSION,
+            token,
+            retry_policy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_timeout=keepalive_timeout,
+            timeout=timeout,
+            endpoint_timeouts=endpoint_timeouts,
+            circuit_breaker=circuit_breaker,
+            single_flight=single_flight,
+            rate_limiter=rate_limiter,
+        )
         self.customers = Customers(self.http)
         self.features = Features(self.http)
         self.products = Products(self.http)
         self.entities = Entities(self.http)
+        self.check_cache = check_cache
+        self._trackers: List[Any] = []
+        self._leasers: List[Any] = []
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._max_workers = pool_maxsize
+
+    def tracker(
+        self,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+        max_attempts: int = 3,
+        concurrency: int = 10,
+        on_error: Optional[ErrorCallback] = None,
+        coalesce: bool = False,
+        spool: Optional[Spool] = None,
+    ) -> Tracker:
+        """Create a buffered tracker that sends usage events in the background.
+
+        Use this instead of :meth:`track` on hot paths, where waiting on the network for every event is too slow.
+        See :class:`~autumn.tracker.Tracker`.
+
+        Parameters
+        ----------
+        max_batch: int
+            The number of queued events that triggers an immediate send.
+        flush_interval: float
+            The maximum number of seconds an event waits in the queue before it is sent.
+        max_queue: int
+            The maximum number of queued events. Events tracked while the queue is full are dropped and passed to ``on_error``.
+        max_attempts: int
+            The number of times an event is sent before it is given up on. The client's retry policy
+            is not applied on top of this, but its backoff is waited out between attempts.
+        concurrency: int
+            The maximum number of events sent at once.
+        on_error: Optional[Callable[[Dict[str, Any], BaseException], None]]
+            Called from a background thread with the event payload and the exception, for each event that is dropped or given up on.
+        coalesce: bool
+            Whether to add plain increments to a queued event for the same customer, feature and entity
+            instead of sending each one. This sends at most one ``/track`` request per key every ``flush_interval`` seconds.
+        spool: Optional[:class:`~autumn.spool.Spool`]
+            A durable journal, such as :class:`~autumn.spool.FileSpool`, that every event is written to before it is queued.
+            Events left in it by a previous process are sent again. The tracker closes the spool when it is closed.
+
+        Returns
+        -------
+        :class:`~autumn.tracker.Tracker`
+            The tracker. It is closed, and its queue flushed, when :meth:`close` is called.
+        """
+        tracker = Tracker(
+            self.http,
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            max_queue=max_queue,
+            max_attempts=max_attempts,
+            concurrency=concurrency,
+            on_error=on_error,
+            coalesce=coalesce,
+            check_cache=self.check_cache,
+            spool=spool,
+        )
+        self._trackers.append(tracker)
+        return tracker
+
+    def leaser(
+        self,
+        *,
+        chunk: int = 100,
+        ttl: float = 30.0,
+        on_error: Optional[LeaseErrorCallback] = None,
+    ) -> Leaser:
+        """Create a leaser that answers usage checks locally against balance reserved in chunks.
+
+        Use this for high-frequency metered features, where even a cached :meth:`check` goes stale too quickly.
+        See :class:`~autumn.lease.Leaser`.
+
+        Parameters
+        ----------
+        chunk: int
+            The amount of balance reserved at a time, per customer and feature.
+        ttl: float
+            The number of seconds a lease is used for before its unused part is handed back and a new one reserved.
+        on_error: Optional[Callable[[:class:`~autumn.lease.Lease`, BaseException], None]]
+            Called with the lease and the exception for each lease that could not be handed back on close.
+
+        Returns
+        -------
+        :class:`~autumn.lease.Leaser`
+            The leaser. Its leases are released when :meth:`close` is called.
+        """
+        leaser = Leaser(self, chunk=chunk, ttl=ttl, on_error=on_error)
+        self._leasers.append(leaser)
+        return leaser
+
+    def _resolve_method(self, name: str) -> Any:
+        # Methods that manage the client itself cannot be called through
+        # submit() or map(): close() would shut down the pool running it.
+        if name in _UNSCHEDULABLE:
+            raise AttributeError(f"{name!r} cannot be scheduled")
+
+        target: Any = self
+        for part in name.split("."):
+            if part.startswith("_"):
+                raise AttributeError(f"{name!r} is not a public method")
+            target = getattr(target, part)
+        return target
+
+    def submit(self, method: str, /, **kwargs: Any) -> Future:
+        """Call a client method in a background thread.
+
+        The threads share this client's connection pool. There are at most ``pool_maxsize`` of them,
+        so submitted calls never wait on a connection. The pool is started by the first call.
+
+        Example:
+
+        .. code-block:: python
+
+            import autumn
+
+            client = autumn.Client(token="your_api_key", pool_maxsize=20)
+            futures = [
+                client.submit("check", customer_id=id, feature_id="seats")
+                for id in customer_ids
+            ]
+            results = [future.result() for future in futures]
+
+        Parameters
+        ----------
+        method: str
+            The name of the method to call, such as ``"check"`` or ``"customers.get"``.
+        **kwargs: Any
+            The arguments to call it with.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            A future for the method's return value.
+        """
+        func = self._resolve_method(method)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="autumn-submit",
+                )
+            return self._executor.submit(func, **kwargs)
+
+    def warmup(self, connections: int = 10):
+        """Open keep-alive connections to Autumn before the first request needs them.
+
+        Call this at startup so that the first requests do not pay for DNS resolution and the TCP and TLS handshakes.
+        With :class:`~autumn.aio.client.AsyncClient` this must be awaited, and it also creates the HTTP session.
+
+        Example:
+
+        .. code-block:: python
+
+            import autumn
+
+            client = autumn.Client(token="your_api_key", pool_maxsize=20)
+            client.warmup(connections=20)
+
+        Parameters
+        ----------
+        connections: int
+            The number of connections to open. Capped at the size of the connection pool.
+        """
+        return self.http.warmup(connections)
+
+    def close(self):
+        """Wait for submitted calls, release any leases, flush and stop any trackers, then close the underlying HTTP session."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        # Each stage runs even if an earlier one raises, so that trackers are
+        # always flushed and the session is always closed.
+        try:
+            for leaser in self._leasers:
+                leaser.close()
+        finally:
+            self._leasers.clear()
+            try:
+                for tracker in self._trackers:
+                    tracker.close()
+            finally:
+                self._trackers.clear()
+                self.http.close()
+
+    def _invalidating(self, customer_id: str, result: Any) -> Any:
+        cache = self.check_cache
+        if cache is None:
+            return result
+
+        def invalidate(response: Any) -> Any:
+            cache.invalidate(customer_id)
+            return response
+
+        return _then(result, invalidate)
 
     def checkout(
         self,
@@ -121,6 +399,7 @@ class Client:
         customer_data: Optional[CustomerData] = None,
         checkout_session_params: Optional[Dict[str, Any]] = None,
         reward: Optional[Union[str, List[str]]] = None,
+        deadline: Optional[float] = None,
     ) -> CheckoutResponse:
         """Checkout a customer for a product.
 
@@ -142,12 +421,20 @@ class Client:
             The customer data to checkout.
         reward: Optional[str | List[str]]
             The reward to checkout. Can pass in an array too.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
         """
 
-        payload = _build_payload(locals(), self.checkout)
-        return self.http.request(
-            "POST", "/checkout", CheckoutResponse, json=payload
+        payload = _build_payload(locals(), self.checkout, ignore={"deadline"})
+        result = self.http.request(
+            "POST",
+            "/checkout",
+            CheckoutResponse,
+            json=payload,
+            deadline=deadline,
         )
+        return self._invalidating(customer_id, result)
 
     def attach(
         self,
@@ -164,6 +451,7 @@ class Client:
         free_trial: Optional[bool] = None,
         options: Optional[List[FeatureOptions]] = None,
         reward: Optional[str | List[str]] = None,
+        deadline: Optional[float] = None,
     ) -> AttachResponse:
         """Attach a customer to a product.
 
@@ -195,6 +483,9 @@ class Client:
             The options to attach.
         reward: Optional[str | List[str]]
             The reward to attach. Can pass in an array too.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
         Returns
         -------
         :class:`~autumn.models.response.AttachResponse`
@@ -208,10 +499,11 @@ class Client:
             product_id is not None and product_ids is not None
         ), "Only one of product_id or product_ids must be provided"
 
-        payload = _build_payload(locals(), self.attach)
-        return self.http.request(
-            "POST", "/attach", AttachResponse, json=payload
+        payload = _build_payload(locals(), self.attach, ignore={"deadline"})
+        result = self.http.request(
+            "POST", "/attach", AttachResponse, json=payload, deadline=deadline
         )
+        return self._invalidating(customer_id, result)
 
     def check(
         self,
@@ -224,6 +516,7 @@ class Client:
         with_preview: bool = False,
         entity_id: Optional[str] = None,
         customer_data: Optional[CustomerData] = None,
+        deadline: Optional[float] = None,
     ) -> CheckResponse:
         """Check if a customer has access to a product or feature.
 
@@ -249,6 +542,9 @@ class Client:
             If using entity balances (eg, seats), the entity ID to check access for.
         customer_data: Optional[CustomerData]
             Additional customer properties. These will be used if the customer's properties are not already set.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
 
         Returns
         -------
@@ -260,8 +556,108 @@ class Client:
             product_id is not None or feature_id is not None
         ), "Either product_id or feature_id must be provided"
 
-        payload = _build_payload(locals(), self.check)
-        return self.http.request("POST", "/check", CheckResponse, json=payload)
+        cache = self.check_cache
+        if cache is not None and not send_event and not with_preview:
+            key = (
+                customer_id,
+                feature_id,
+                product_id,
+                entity_id,
+                required_balance,
+            )
+            cached = cache._get(key)
+            if cached is not None:
+                return self.http.resolved(cached)
+
+            store = partial(cache._put, key, cache._current_generation)
+        else:
+            store = None
+
+        payload = _build_payload(locals(), self.check, ignore={"deadline"})
+        result = self.http.request(
+            "POST", "/check", CheckResponse, json=payload, deadline=deadline
+        )
+        if store is not None:
+            return _then(result, store)
+        if cache is not None and send_event and feature_id is not None:
+            value = 1 if required_balance is None else required_balance
+
+            def consume(response: CheckResponse) -> CheckResponse:
+                if response.allowed:
+                    cache.consume(
+                        customer_id, feature_id, value, entity_id=entity_id
+                    )
+                return response
+
+            return _then(result, consume)
+        return result
+
+    def check_many(
+        self,
+        customer_id: str,
+        feature_ids: Iterable[str],
+        *,
+        entity_id: Optional[str] = None,
+        required_balance: Optional[int] = 1,
+        send_event: bool = False,
+        local: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, CheckResponse]:
+        """Check if a customer has access to several features.
+
+        The checks are made one after another over the same pooled connection. :class:`~autumn.aio.client.AsyncClient`
+        makes them concurrently instead.
+
+        Parameters
+        ----------
+        customer_id: str
+            The ID of the customer to check.
+        feature_ids: Iterable[str]
+            The IDs of the features to check.
+        entity_id: Optional[str]
+            If using entity balances (eg, seats), the entity ID to check access for.
+        required_balance: Optional[int]
+            The required balance for each feature.
+        send_event: bool
+            Whether to record a usage event for each feature. Cannot be combined with ``local``.
+        local: bool
+            Whether to fetch the customer (or entity) once and answer every check from it with an
+            :class:`~autumn.evaluator.EntitlementEvaluator`, instead of making one ``/check`` call per feature.
+        deadline: Optional[float]
+            The total number of seconds all the checks may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
+
+        Returns
+        -------
+        Dict[str, :class:`~autumn.models.response.CheckResponse`]
+            The response for each feature, keyed by feature ID.
+        """
+        if local:
+            assert not send_event, "send_event cannot be used with local"
+            owner = self._entitlement_owner(customer_id, entity_id)
+            return EntitlementEvaluator(owner).check_many(
+                feature_ids, required_balance=required_balance
+            )
+
+        deadline_at = _deadline_at(deadline)
+        return {
+            feature_id: self.check(
+                customer_id,
+                feature_id=feature_id,
+                required_balance=required_balance,
+                send_event=send_event,
+                entity_id=entity_id,
+                deadline=_remaining(deadline_at, "POST", "/check"),
+            )
+            for feature_id in feature_ids
+        }
+
+    def _entitlement_owner(
+        self, customer_id: str, entity_id: Optional[str]
+    ) -> Any:
+        if entity_id is not None:
+            return self.entities.get(customer_id, entity_id)
+        return self.customers.get(customer_id)
 
     def track(
         self,
@@ -274,6 +670,7 @@ class Client:
         idempotency_key: Optional[str] = None,
         properties: Optional[Dict[str, Any]] = None,
         customer_data: Optional[CustomerData] = None,
+        deadline: Optional[float] = None,
     ) -> TrackResponse:
         """
         Track a feature usage.
@@ -298,6 +695,9 @@ class Client:
             Additional properties to track.
         customer_data: Optional[CustomerData]
             Additional customer properties. These will be used if the customer's properties are not already set.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
 
         Returns
         -------
@@ -307,8 +707,19 @@ class Client:
         assert (
             feature_id or event_name
         ), "Either feature_id or event_name must be provided"
-        payload = _build_payload(locals(), self.track)
-        return self.http.request("POST", "/track", TrackResponse, json=payload)
+        payload = _build_payload(locals(), self.track, ignore={"deadline"})
+        result = self.http.request(
+            "POST", "/track", TrackResponse, json=payload, deadline=deadline
+        )
+        cache = self.check_cache
+        if cache is None:
+            return result
+
+        def consume(response: TrackResponse) -> TrackResponse:
+            cache._record_usage(customer_id, feature_id, value, entity_id)
+            return response
+
+        return _then(result, consume)
 
     def query(
         self,
@@ -316,6 +727,7 @@ class Client:
         feature_id: Union[str, List[str]],
         *,
         range: Literal["24h", "7d", "30d", "90d", "last_cycle"] = "30d",
+        deadline: Optional[float] = None,
     ) -> QueryResponse:
         """
         Query usage analytics for a customer on a specific feature.
@@ -328,14 +740,19 @@ class Client:
             The ID of the feature you want to query analytics for.
         range: Literal["24h", "7d", "30d", "90d", "last_cycle"]
             Analytics time period.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
 
         Returns
         -------
         :class:`~autumn.models.response.QueryResponse`
             The response from the API.
         """
-        payload = _build_payload(locals(), self.query)
-        return self.http.request("POST", "/query", QueryResponse, json=payload)
+        payload = _build_payload(locals(), self.query, ignore={"deadline"})
+        return self.http.request(
+            "POST", "/query", QueryResponse, json=payload, deadline=deadline
+        )
 
     def cancel(
         self,
@@ -344,6 +761,7 @@ class Client:
         *,
         entity_id: Optional[str] = None,
         cancel_immediately: bool = False,
+        deadline: Optional[float] = None,
     ) -> CancelResponse:
         """Cancel a product for a customer.
 
@@ -357,16 +775,21 @@ class Client:
             The ID of the entity to cancel the product for.
         cancel_immediately: bool
             Whether to cancel the product immediately. If false, the product will be cancelled at the end of the billing cycle.
+        deadline: Optional[float]
+            The total number of seconds the call may take, including retries and the backoff between them.
+            If the remaining time cannot cover another attempt, :class:`~autumn.error.AutumnTimeoutError` is raised.
 
         Returns
         -------
         :class:`~autumn.models.response.CancelResponse`
             The response from the API.
         """
-        payload = _build_payload(locals(), self.cancel)
-        return self.http.request(
+        payload = _build_payload(locals(), self.cancel, ignore={"deadline"})
+        result = self.http.request(
             "POST",
             "/cancel",
             CancelResponse,
             json=payload,
+            deadline=deadline,
         )
+        return self._invalidating(customer_id, result)
@@ -0,0 +1,47 @@
+"""JSON encoding for request bodies and decoding for error bodies.
+
+``orjson`` is used when it is installed, then ``msgspec``, falling back to
+the standard library. Install the ``speedups`` extra to get ``orjson``.
+Response bodies are validated straight from bytes by pydantic and never pass
+through this module.
+"""
+
+import json
+from typing import Any, Callable, Tuple, Type
+
+__all__ = ("BACKEND", "DecodeError", "dumps", "loads")
+
+_Backend = Tuple[
+    Callable[[Any], bytes], Callable[[bytes], Any], Tuple[Type[Exception], ...]
+]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load_backend(name: str) -> _Backend:
+    # Returns ``(dumps, loads, DecodeError)``. Raises ``ImportError`` if the
+    # backend is not installed.
+    if name == "orjson":
+        import orjson
+
+        return orjson.dumps, orjson.loads, (orjson.JSONDecodeError,)
+    if name == "msgspec":
+        import msgspec
+
+        # ``msgspec.DecodeError`` is not a ``ValueError``.
+        return (
+            msgspec.json.encode,
+            msgspec.json.decode,
+            (msgspec.DecodeError, ValueError),
+        )
+    return _json_dumps, json.loads, (ValueError,)
+
+
+for BACKEND in ("orjson", "msgspec", "json"):
+    try:
+        dumps, loads, DecodeError = _load_backend(BACKEND)
+    except ImportError:
+        continue
+    break
@@ -2,7 +2,12 @@ from typing import Any, List
 
 from typing_extensions import Self
 
-__all__ = ("AutumnError", "AutumnValidationError")
+__all__ = (
+    "AutumnError",
+    "AutumnValidationError",
+    "AutumnTimeoutError",
+    "AutumnCircuitOpenError",
+)
 
 
 class AutumnError(Exception):
@@ -81,3 +86,47 @@ class AutumnHTTPError(AutumnError):
     def attach_body(self, body: Any) -> Self:
         self.body = body
         return self
+
+
+class AutumnTimeoutError(AutumnError):
+    """
+    Exception raised when a request's deadline runs out before it could complete.
+
+    The exception that caused the final attempt to fail, if any, is available as ``__cause__``.
+
+    Attributes
+    ----------
+    message: str
+        The error message.
+    code: str
+        The error code. This is always ``"deadline_exceeded"``.
+    """
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message, code)
+
+
+class AutumnCircuitOpenError(AutumnError):
+    """
+    Exception raised without contacting the API because the circuit breaker for the endpoint is open.
+
+    See :class:`~autumn.circuit.CircuitBreaker`.
+
+    Attributes
+    ----------
+    message: str
+        The error message.
+    code: str
+        The error code. This is always ``"circuit_open"``.
+    endpoint: str
+        The endpoint whose circuit is open, e.g. ``"/check"``.
+    retry_after: float
+        The number of seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(
+        self, message: str, code: str, *, endpoint: str, retry_after: float
+    ):
+        super().__init__(message, code)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, Optional, Union
+
+from .models.customers import (
+    Customer,
+    CustomerFeature,
+    FeatureType,
+    ProductStatus,
+)
+from .models.entities import Entity
+from .models.response import CheckResponse
+
+__all__ = ("EntitlementEvaluator",)
+
+_ACTIVE_STATUSES = frozenset({ProductStatus.ACTIVE, ProductStatus.TRIALING})
+# Feature types that are either granted or not, with no balance to spend.
+_UNMETERED_TYPES = frozenset({FeatureType.BOOLEAN, FeatureType.STATIC})
+
+
+class EntitlementEvaluator:
+    """Answers :meth:`~autumn.Client.check` questions locally from a fetched :class:`~autumn.models.customers.Customer`.
+
+    One ``customers.get`` call is enough to gate any number of features, instead of one ``/check`` call each.
+    The answers are only as fresh as the customer object, and no usage is recorded.
+
+    - Boolean and static features are allowed if the customer has them.
+    - Unlimited features are always allowed.
+    - Metered features are allowed if their ``balance`` covers ``required_balance``. Once a single-use feature's
+      ``next_reset_at`` has passed, its balance is taken to have been reset to ``included_usage``.
+    - Products are allowed if the customer has them with an ``active`` or ``trialing`` status.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(token="your_api_key")
+        evaluator = autumn.EntitlementEvaluator(client.customers.get("john_doe"))
+
+        flags = evaluator.check_many(["chat_messages", "exports", "sso"])
+        if flags["exports"].allowed:
+            ...
+
+    Parameters
+    ----------
+    customer: Union[:class:`~autumn.models.customers.Customer`, :class:`~autumn.models.entities.Entity`]
+        The customer to answer for. Pass an entity, fetched with ``entities.get``, to answer for its balances instead.
+    """
+
+    def __init__(self, customer: Union[Customer, Entity]):
+        self.customer = customer
+
+    @property
+    def _customer_id(self) -> str:
+        if isinstance(self.customer, Entity):
+            return self.customer.customer_id
+        return self.customer.id or ""
+
+    @staticmethod
+    def _now_ms() -> float:
+        return time.time() * 1000
+
+    def _balance(self, feature: CustomerFeature) -> Optional[float]:
+        if (
+            feature.type is FeatureType.SINGLE_USE
+            and feature.next_reset_at is not None
+            and feature.included_usage is not None
+            and self._now_ms() >= feature.next_reset_at
+        ):
+            return feature.included_usage
+        return feature.balance
+
+    def _check_feature(
+        self, feature_id: str, required_balance: float
+    ) -> CheckResponse:
+        feature = self.customer.features.get(feature_id)
+        if feature is None:
+            return CheckResponse(
+                allowed=False,
+                customer_id=self._customer_id,
+                code="feature_not_found",
+                feature_id=feature_id,
+            )
+
+        balance = self._balance(feature)
+        if feature.unlimited or feature.type in _UNMETERED_TYPES:
+            allowed = True
+        elif balance is None:
+            # A feature without a type or a balance is treated as a plain grant.
+            allowed = feature.type is None
+        else:
+            allowed = balance >= required_balance
+
+        return CheckResponse(
+            allowed=allowed,
+            customer_id=self._customer_id,
+            code="feature_found",
+            balance=None if feature.unlimited else balance,
+            feature_id=feature_id,
+        )
+
+    def _check_product(self, product_id: str) -> CheckResponse:
+        for product in self.customer.products:
+            if product.id == product_id:
+                return CheckResponse(
+                    allowed=product.status in _ACTIVE_STATUSES,
+                    customer_id=self._customer_id,
+                    code="product_found",
+                    product_id=product_id,
+                    status=product.status.value,
+                )
+
+        return CheckResponse(
+            allowed=False,
+            customer_id=self._customer_id,
+            code="product_not_found",
+            product_id=product_id,
+        )
+
+    def check(
+        self,
+        *,
+        feature_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        required_balance: Optional[float] = 1,
+    ) -> CheckResponse:
+        """Check if the customer has access to a product or feature.
+
+        You must pass either ``product_id`` or ``feature_id``.
+
+        Parameters
+        ----------
+        feature_id: Optional[str]
+            The ID of the feature to check.
+        product_id: Optional[str]
+            The ID of the product to check.
+        required_balance: Optional[float]
+            The balance a metered feature must have.
+
+        Returns
+        -------
+        :class:`~autumn.models.response.CheckResponse`
+            The same shape of response as :meth:`autumn.Client.check`.
+        """
+        assert (
+            product_id is not None or feature_id is not None
+        ), "Either product_id or feature_id must be provided"
+
+        if product_id is not None:
+            return self._check_product(product_id)
+
+        assert feature_id is not None
+        if required_balance is None:
+            required_balance = 1
+        return self._check_feature(feature_id, required_balance)
+
+    def check_many(
+        self,
+        feature_ids: Iterable[str],
+        *,
+        required_balance: Optional[float] = 1,
+    ) -> Dict[str, CheckResponse]:
+        """Check several features at once.
+
+        Parameters
+        ----------
+        feature_ids: Iterable[str]
+            The IDs of the features to check.
+        required_balance: Optional[float]
+            The balance each metered feature must have.
+
+        Returns
+        -------
+        Dict[str, :class:`~autumn.models.response.CheckResponse`]
+            The response for each feature, keyed by feature ID.
+        """
+        return {
+            feature_id: self.check(
+                feature_id=feature_id, required_balance=required_balance
+            )
+            for feature_id in feature_ids
+        }
@@ -1,12 +1,33 @@
 import sys
 import time
-from typing import Dict, Type, TypeVar
+from typing import Dict, Optional, Tuple, Type, TypeVar
 
 import requests
 from pydantic import BaseModel
 
-from .error import AutumnError, AutumnHTTPError
-from .utils import ExponentialBackoff, _build_model, _check_response
+from .circuit import CircuitBreaker
+from .error import AutumnError
+from .pool import PooledAdapter, PoolStats
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import _flight_key, _SingleFlight
+from .timeouts import (
+    DEFAULT_TIMEOUT,
+    Timeout,
+    _check_deadline,
+    _clamp,
+    _deadline_at,
+    _deadline_exceeded,
+    _remaining,
+    _select_timeout,
+)
+from .utils import (
+    _build_model_json,
+    _check_raw_response,
+    _decode_error,
+    _encode_body,
+    _http_error,
+)
 
 __all__ = ("HTTPClient",)
 
@@ -18,13 +39,43 @@ class _RetryRequestError(Exception):
 
 
 class HTTPClient:
-    def __init__(self, base_url: str, version: str, token: str, attempts: int):
+    def __init__(
+        self,
+        base_url: str,
+        version: str,
+        token: str,
+        retry_policy: RetryPolicy,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        timeout: Optional[Timeout] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeout]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        single_flight: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.base_url = base_url
         self.version = version
         self.session = requests.Session()
 
+        self._adapter = PooledAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_timeout=keepalive_timeout,
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
         self._headers = self._build_headers(token)
-        self.attempts = attempts
+        self.retry_policy = retry_policy
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self._single_flight = _SingleFlight() if single_flight else None
 
     @staticmethod
     def _build_url(base_url: str, version: str, path: str) -> str:
@@ -48,11 +99,53 @@ class HTTPClient:
         }
         return headers
 
+    def _attempt_timeout(
+        self, path: str, remaining: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        timeout = _select_timeout(path, self.timeout, self.endpoint_timeouts)
+        return (
+            _clamp(timeout.connect, remaining),
+            _clamp(timeout.read, remaining),
+        )
+
     def request(
         self,
         method: str,
         path: str,
         type_: Type[T],
+        *,
+        deadline: Optional[float] = None,
+        retries: bool = True,
+        **kwargs,
+    ) -> T:
+        if self._single_flight is not None:
+            key = _flight_key(method, path, type_, kwargs)
+            if key is not None:
+                return self._single_flight.do(
+                    key,
+                    lambda: self._request(
+                        method,
+                        path,
+                        type_,
+                        deadline=deadline,
+                        retries=retries,
+                        **kwargs,
+                    ),
+                    deadline,
+                )
+
+        return self._request(
+            method, path, type_, deadline=deadline, retries=retries, **kwargs
+        )
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        type_: Type[T],
+        *,
+        deadline: Optional[float] = None,
+        retries: bool = True,
         **kwargs,
     ) -> T:
         if self.session is None:
@@ -62,36 +155,144 @@ class HTTPClient:
             )
 
         url = self._build_url(self.base_url, self.version, path)
+        _encode_body(kwargs)
 
-        max_attempts = self.attempts
-        backoff = ExponentialBackoff()
-        for attempt in range(max_attempts):
+        deadline_at = _deadline_at(deadline)
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter
+        if policy.budget is not None:
+            policy.budget.deposit()
+
+        retry = 0
+        while True:
+            remaining = _remaining(deadline_at, method, path)
+            if limiter is not None:
+                wait = limiter._reserve(path, remaining)
+                if wait is None:
+                    raise _deadline_exceeded(method, path)
+                if wait > 0:
+                    time.sleep(wait)
+                    remaining = _remaining(deadline_at, method, path)
+
+            if breaker is not None:
+                breaker.before_request(path)
+
+            status = retry_after = None
             try:
                 resp = self.session.request(
-                    method, url, headers=self._headers, **kwargs
+                    method,
+                    url,
+                    headers=self._headers,
+                    timeout=self._attempt_timeout(path, remaining),
+                    **kwargs,
                 )
-                if 500 <= resp.status_code <= 504:
+                if resp.status_code in policy.retry_statuses:
+                    status = resp.status_code
+                    retry_after = resp.headers.get("Retry-After")
                     raise _RetryRequestError()
 
-                data = resp.json()
+                raw = resp.content
             except (
                 _RetryRequestError,
                 OSError,
                 requests.ConnectionError,
                 requests.ConnectTimeout,
-            ):
-                if attempt == max_attempts - 1:
-                    raise
+            ) as exc:
+                if limiter is not None and status == 429:
+                    limiter.record_throttle(path)
+                if breaker is not None:
+                    if status is None or status >= 500:
+                        breaker.record_failure(path)
+                    else:
+                        breaker.record_success(path)
 
-                time.sleep(backoff.bedtime)
-                backoff.tick()
+                # Callers that retry on their own, such as trackers, opt out
+                # so that attempts do not multiply.
+                delay = (
+                    policy._next_delay(
+                        method, retry, status=status, retry_after=retry_after
+                    )
+                    if retries
+                    else None
+                )
+                if delay is None:
+                    if status is None:
+                        raise
+                    raise _http_error(
+                        status, _decode_error(resp.content)
+                    ) from None
+
+                _check_deadline(deadline_at, delay, method, path, exc)
+                time.sleep(delay)
+                retry += 1
             else:
-                _check_response(resp.status_code, data)
-                return _build_model(type_, data)
+                if limiter is not None:
+                    limiter.record_success(path)
+                if breaker is not None:
+                    breaker.record_success(path)
+
+                _check_raw_response(resp.status_code, raw)
+                return _build_model_json(type_, raw)
+
+    def resolved(self, value: T) -> T:
+        """Return ``value`` the way :meth:`request` returns a response, for results served without a request."""
+        return value
+
+    def warmup(self, connections: int = 10) -> None:
+        """Open keep-alive connections to the API ahead of traffic.
+
+        Each connection resolves DNS and completes the TCP and TLS handshakes, then waits in the pool for a request.
+        Connections that are already open count towards ``connections``.
+
+        Parameters
+        ----------
+        connections: int
+            The number of connections to have open. Capped at ``pool_maxsize``.
+        """
+        # Look the pool up the way requests does, so proxies and TLS settings
+        # select the same pool that later requests will use.
+        request = requests.Request("GET", self.base_url).prepare()
+        settings = self.session.merge_environment_settings(
+            request.url, {}, None, None, None
+        )
+        pool = self._adapter.get_connection_with_tls_context(
+            request,
+            settings["verify"],
+            proxies=settings["proxies"],
+            cert=settings["cert"],
+        )
+        connect_timeout = self.timeout.connect
+        count = min(connections, self._adapter._pool_maxsize)
+
+        # Every connection is checked out at once, so the pool cannot hand the
+        # same one out twice.
+        conns = []
+        try:
+            for _ in range(count):
+                conn = pool._get_conn()
+                conns.append(conn)
+                if conn.sock is None:
+                    conn.timeout = connect_timeout
+                    conn.connect()
+        except BaseException:
+            for conn in conns:
+                if conn.sock is None:
+                    conn.close()
+            raise
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+
+    def pool_stats(self) -> PoolStats:
+        """Return a snapshot of the connection pool.
 
-        # We should never get here. This is to appease type checkers.
-        msg = f"Max retries reached for {method} {path}"
-        raise AutumnHTTPError(msg, "max_retries_reached", 500)
+        Returns
+        -------
+        :class:`~autumn.pool.PoolStats`
+            Counters describing connection usage since the client was created.
+        """
+        return self._adapter.stats()
 
     def close(self):
         if self.session is not None:
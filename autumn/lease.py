@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .error import AutumnError
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .models.response import CheckResponse
+
+__all__ = ("Lease", "Leaser")
+
+_LeaseKey = Tuple[str, str, Optional[str]]
+
+
+class Lease:
+    """A chunk of a customer's balance for one feature, reserved ahead of use.
+
+    Attributes
+    ----------
+    id: str
+        A unique ID for the lease. Returning unused allowance is idempotent on it.
+    customer_id: str
+        The ID of the customer the balance was reserved from.
+    feature_id: str
+        The ID of the feature the balance was reserved for.
+    entity_id: Optional[str]
+        The ID of the entity the balance was reserved for, if any.
+    granted: int
+        The amount reserved.
+    used: int
+        The amount used so far.
+    expires_at: float
+        When the lease expires, as a :func:`time.monotonic` timestamp.
+    """
+
+    __slots__ = (
+        "id",
+        "customer_id",
+        "feature_id",
+        "entity_id",
+        "granted",
+        "used",
+        "expires_at",
+    )
+
+    def __init__(
+        self,
+        customer_id: str,
+        feature_id: str,
+        entity_id: Optional[str],
+        granted: int,
+        expires_at: float,
+    ):
+        self.id = uuid.uuid4().hex
+        self.customer_id = customer_id
+        self.feature_id = feature_id
+        self.entity_id = entity_id
+        self.granted = granted
+        self.used = 0
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        return (
+            f"<Lease customer_id={self.customer_id!r} feature_id={self.feature_id!r}"
+            f" used={self.used}/{self.granted}>"
+        )
+
+    @property
+    def remaining(self) -> int:
+        """The amount that can still be used."""
+        return self.granted - self.used
+
+    @property
+    def expired(self) -> bool:
+        """Whether the lease has expired."""
+        return time.monotonic() >= self.expires_at
+
+    def _take(self, value: int) -> bool:
+        if self.expired or self.remaining < value:
+            return False
+
+        self.used += value
+        return True
+
+
+LeaseErrorCallback = Callable[["Lease", BaseException], None]
+
+
+class _BaseLeaser:
+    def __init__(
+        self,
+        *,
+        chunk: int,
+        ttl: float,
+        on_error: Optional[LeaseErrorCallback] = None,
+    ):
+        self.chunk = chunk
+        self.ttl = ttl
+        self.on_error = on_error
+
+        self._leases: Dict[_LeaseKey, Lease] = {}
+        self._closed = False
+
+    def lease(
+        self,
+        customer_id: str,
+        feature_id: str,
+        *,
+        entity_id: Optional[str] = None,
+    ) -> Optional[Lease]:
+        """Return the current lease for a customer's feature, if there is one."""
+        return self._leases.get((customer_id, feature_id, entity_id))
+
+    def _report(self, lease: Lease, exc: BaseException) -> None:
+        if self.on_error is None:
+            return
+
+        try:
+            self.on_error(lease, exc)
+        except Exception:
+            pass
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise AutumnError("The leaser has been closed.", "leaser_closed")
+
+    def _reserve_kwargs(self, key: _LeaseKey, amount: int) -> Dict[str, Any]:
+        customer_id, feature_id, entity_id = key
+        return {
+            "customer_id": customer_id,
+            "feature_id": feature_id,
+            "entity_id": entity_id,
+            "required_balance": amount,
+            "send_event": True,
+        }
+
+    @staticmethod
+    def _fallback_amount(
+        response: CheckResponse, amount: int, value: int
+    ) -> Optional[int]:
+        # A full chunk was refused, but the customer may still have enough
+        # balance left for this call. Reserve whatever is left instead.
+        if response.allowed or response.balance is None:
+            return None
+
+        balance = int(response.balance)
+        if value <= balance < amount:
+            return balance
+        return None
+
+    def _grant(
+        self, key: _LeaseKey, response: CheckResponse, amount: int
+    ) -> Optional[Lease]:
+        if not response.allowed:
+            return None
+
+        customer_id, feature_id, entity_id = key
+        lease = Lease(
+            customer_id,
+            feature_id,
+            entity_id,
+            amount,
+            time.monotonic() + self.ttl,
+        )
+        self._leases[key] = lease
+        return lease
+
+    @staticmethod
+    def _release_kwargs(lease: Lease) -> Optional[Dict[str, Any]]:
+        unused = lease.remaining
+        if unused <= 0:
+            return None
+
+        # Spend it all locally first, so the allowance cannot be used after
+        # it has been handed back.
+        lease.used = lease.granted
+        return {
+            "customer_id": lease.customer_id,
+            "feature_id": lease.feature_id,
+            "value": -unused,
+            "entity_id": lease.entity_id,
+            "idempotency_key": f"lease-{lease.id}-release",
+        }
+
+
+class Leaser(_BaseLeaser):
+    """Answers usage checks locally against balance reserved from Autumn in chunks.
+
+    The first :meth:`check` for a customer's feature reserves ``chunk`` of its balance with
+    ``check(required_balance=chunk, send_event=True)``. Later checks are deducted from that lease
+    in-process until it is used up or ``ttl`` seconds have passed. At that point the unused part is
+    handed back with a negative ``track`` and a new chunk is reserved. If a full chunk is not available,
+    whatever balance is left is reserved instead.
+
+    Usage is therefore recorded upstream ahead of time, by at most ``chunk`` per customer and feature for each
+    process, and reconciled when the lease is released. Use a larger chunk for fewer round trips, or a smaller one
+    to keep balances seen by other processes closer to the truth.
+
+    Create one with :meth:`autumn.Client.leaser`. Leasers are closed along with the client that created them.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(token="your_api_key")
+        leaser = client.leaser(chunk=50, ttl=30.0)
+
+        if leaser.check("john_doe", "api_calls"):
+            ...  # allowed, and one unit of usage recorded
+
+        client.close()  # returns unused allowance
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        chunk: int = 100,
+        ttl: float = 30.0,
+        on_error: Optional[LeaseErrorCallback] = None,
+    ):
+        super().__init__(chunk=chunk, ttl=ttl, on_error=on_error)
+        self._client = client
+        self._lock = threading.Lock()
+        self._key_locks: Dict[_LeaseKey, threading.Lock] = {}
+
+    def _key_lock(self, key: _LeaseKey) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def check(
+        self,
+        customer_id: str,
+        feature_id: str,
+        *,
+        value: int = 1,
+        entity_id: Optional[str] = None,
+    ) -> bool:
+        """Use ``value`` of a customer's feature, reserving more balance first if needed.
+
+        This only makes requests when the current lease cannot cover ``value``.
+
+        Parameters
+        ----------
+        customer_id: str
+            The ID of the customer.
+        feature_id: str
+            The ID of the feature.
+        value: int
+            The amount to use.
+        entity_id: Optional[str]
+            If using entity balances (eg, seats), the entity ID to use the balance of.
+
+        Returns
+        -------
+        bool
+            Whether the customer had enough balance. If ``True``, the usage has been recorded.
+
+        Raises
+        ------
+        :class:`~autumn.error.AutumnError`
+            The leaser has been closed.
+        """
+        self._check_open()
+        key = (customer_id, feature_id, entity_id)
+        with self._key_lock(key):
+            lease = self._leases.get(key)
+            if lease is not None:
+                if lease._take(value):
+                    return True
+                self._release(lease)
+
+            lease = self._reserve(key, value)
+            return lease is not None and lease._take(value)
+
+    def _reserve(self, key: _LeaseKey, value: int) -> Optional[Lease]:
+        amount = max(self.chunk, value)
+        response = self._client.check(**self._reserve_kwargs(key, amount))
+
+        fallback = self._fallback_amount(response, amount, value)
+        if fallback is not None:
+            amount = fallback
+            response = self._client.check(**self._reserve_kwargs(key, amount))
+
+        return self._grant(key, response, amount)
+
+    def _release(self, lease: Lease) -> None:
+        key = (lease.customer_id, lease.feature_id, lease.entity_id)
+        if self._leases.get(key) is lease:
+            del self._leases[key]
+
+        kwargs = self._release_kwargs(lease)
+        if kwargs is not None:
+            self._client.track(**kwargs)
+
+    def release(
+        self,
+        customer_id: str,
+        feature_id: str,
+        *,
+        entity_id: Optional[str] = None,
+    ) -> None:
+        """Hand the unused part of a customer's lease back to Autumn."""
+        key = (customer_id, feature_id, entity_id)
+        with self._key_lock(key):
+            lease = self._leases.get(key)
+            if lease is not None:
+                self._release(lease)
+
+    def close(self) -> None:
+        """Release every lease.
+
+        Allowance that cannot be handed back, because Autumn answered with an error or could not be reached,
+        is lost. Each such lease is passed to ``on_error`` with the exception.
+        """
+        self._closed = True
+        leases: List[Lease] = list(self._leases.values())
+        for lease in leases:
+            try:
+                self.release(
+                    lease.customer_id,
+                    lease.feature_id,
+                    entity_id=lease.entity_id,
+                )
+            except (AutumnError, requests.RequestException, OSError) as exc:
+                self._report(lease, exc)
@@ -0,0 +1,192 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+
+__all__ = ("PoolStats",)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """A snapshot of the sync client's connection pool.
+
+    Retrieve one with :meth:`autumn.http.HTTPClient.pool_stats`.
+
+    Attributes
+    ----------
+    in_use: int
+        The number of connections currently checked out by a request.
+    idle: int
+        The number of open connections waiting in the pool.
+    created: int
+        The total number of connections opened.
+    reused: int
+        The total number of times a pooled connection was handed out again.
+    expired: int
+        The total number of idle connections closed for exceeding the keep-alive timeout.
+    wait_time: float
+        The total time, in seconds, spent waiting for a free connection.
+    """
+
+    in_use: int
+    idle: int
+    created: int
+    reused: int
+    expired: int
+    wait_time: float
+
+
+class _PoolCounters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+        self.expired = 0
+        self.wait_time = 0.0
+
+
+class _TrackedPoolMixin:
+    _autumn_counters: _PoolCounters
+    _autumn_keepalive: Optional[float]
+
+    def _new_conn(self):
+        conn = super()._new_conn()  # type: ignore
+        with self._autumn_counters.lock:
+            self._autumn_counters.created += 1
+        return conn
+
+    def _get_conn(self, timeout=None):
+        counters = self._autumn_counters
+        start = time.monotonic()
+        conn = super()._get_conn(timeout)  # type: ignore
+        waited = time.monotonic() - start
+
+        last_used = getattr(conn, "_autumn_last_used", None)
+        expired = (
+            last_used is not None
+            and self._autumn_keepalive is not None
+            and start - last_used > self._autumn_keepalive
+        )
+        if expired:
+            conn.close()
+            conn = self._new_conn()
+
+        with counters.lock:
+            counters.in_use += 1
+            counters.wait_time += waited
+            if expired:
+                counters.expired += 1
+            elif last_used is not None:
+                counters.reused += 1
+
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._autumn_last_used = time.monotonic()
+
+        with self._autumn_counters.lock:
+            self._autumn_counters.in_use -= 1
+
+        super()._put_conn(conn)  # type: ignore
+
+    def _idle_count(self) -> int:
+        pool = self.pool  # type: ignore
+        if pool is None:
+            return 0
+        return sum(1 for conn in list(pool.queue) if conn is not None)
+
+
+class _TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _TrackedPoolManager(PoolManager):
+    def __init__(
+        self,
+        counters: _PoolCounters,
+        keepalive_timeout: Optional[float],
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.pool_classes_by_scheme = {
+            "http": _TrackedHTTPConnectionPool,
+            "https": _TrackedHTTPSConnectionPool,
+        }
+        self._autumn_counters = counters
+        self._autumn_keepalive = keepalive_timeout
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool._autumn_counters = self._autumn_counters  # type: ignore
+        pool._autumn_keepalive = self._autumn_keepalive  # type: ignore
+        return pool
+
+
+class PooledAdapter(HTTPAdapter):
+    """A :class:`requests.adapters.HTTPAdapter` that records pool statistics
+    and closes connections that have been idle for longer than ``keepalive_timeout``.
+
+    .. warning::
+        This class is not intended for public use. It is used internally by the :class:`autumn.Client` class.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keepalive_timeout: Optional[float] = None,
+    ):
+        # ``HTTPAdapter.__init__`` calls ``init_poolmanager``, so these must exist first.
+        self._counters = _PoolCounters()
+        self._keepalive_timeout = keepalive_timeout
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs
+    ):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        self.poolmanager = _TrackedPoolManager(
+            self._counters,
+            self._keepalive_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def stats(self) -> PoolStats:
+        idle = 0
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            if isinstance(pool, _TrackedPoolMixin):
+                idle += pool._idle_count()
+
+        counters = self._counters
+        with counters.lock:
+            return PoolStats(
+                in_use=counters.in_use,
+                idle=idle,
+                created=counters.created,
+                reused=counters.reused,
+                expired=counters.expired,
+                wait_time=counters.wait_time,
+            )
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from .utils import _endpoint
+
+__all__ = ("RateLimiter",)
+
+# Several 429s usually arrive from the same burst. Only the first one in
+# this window lowers the rate, so one burst does not collapse it.
+_DECREASE_COOLDOWN = 1.0
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.decreased_at = float("-inf")
+
+
+class RateLimiter:
+    """A token bucket that paces requests and adapts its rate to ``429`` responses.
+
+    Each attempt takes a token. Tokens refill at the current rate, up to ``burst``. When none are left, callers
+    wait their turn, in order, instead of failing. The rate follows AIMD: it is multiplied by ``decrease_factor``
+    when Autumn answers ``429 Too Many Requests``, and grows by roughly ``increase`` requests per second for every
+    second of successful traffic.
+
+    A limiter is thread-safe and may be shared between several clients, so that they share the same budget.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(
+            token="your_api_key",
+            rate_limiter=autumn.RateLimiter(rate=100.0, max_rate=500.0),
+        )
+
+    Parameters
+    ----------
+    rate: float
+        The initial number of requests per second.
+    burst: float
+        The number of requests that may be sent at once after a quiet period.
+    min_rate: float
+        The rate is never lowered below this.
+    max_rate: Optional[float]
+        The rate is never raised above this. ``None`` means no limit.
+    increase: float
+        How much the rate grows, in requests per second, over each second of successful requests.
+    decrease_factor: float
+        What the rate is multiplied by after a ``429``.
+    per_endpoint: bool
+        Whether each endpoint (the first segment of the request path, e.g. ``/check``) gets its own bucket.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 50.0,
+        burst: float = 10.0,
+        min_rate: float = 1.0,
+        max_rate: Optional[float] = None,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        per_endpoint: bool = False,
+    ):
+        self.initial_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.per_endpoint = per_endpoint
+
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, path: str) -> _Bucket:
+        key = _endpoint(path) if self.per_endpoint else "/"
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(
+                self.initial_rate, self.burst
+            )
+        return bucket
+
+    def rate(self, path: str = "/") -> float:
+        """Return the current rate, in requests per second, for ``path``."""
+        with self._lock:
+            return self._bucket(path).rate
+
+    def _reserve(
+        self, path: str, max_wait: Optional[float]
+    ) -> Optional[float]:
+        # Returns how long to wait before sending, or ``None`` if the wait would
+        # exceed ``max_wait``. Tokens may go negative: each missing token is a
+        # caller already queued, so later callers wait behind it.
+        with self._lock:
+            bucket = self._bucket(path)
+            now = time.monotonic()
+            bucket.tokens = min(
+                self.burst,
+                bucket.tokens + (now - bucket.updated_at) * bucket.rate,
+            )
+            bucket.updated_at = now
+
+            wait = (
+                0.0
+                if bucket.tokens >= 1
+                else (1 - bucket.tokens) / bucket.rate
+            )
+            if max_wait is not None and wait > max_wait:
+                return None
+
+            bucket.tokens -= 1
+            return wait
+
+    def record_success(self, path: str) -> None:
+        """Record a successful response from ``path``, raising the rate a little."""
+        with self._lock:
+            bucket = self._bucket(path)
+            # At full utilisation this adds ``increase`` per second.
+            rate = bucket.rate + self.increase / bucket.rate
+            if self.max_rate is not None:
+                rate = min(rate, self.max_rate)
+            bucket.rate = rate
+
+    def record_throttle(self, path: str) -> None:
+        """Record a ``429`` response from ``path``, lowering the rate."""
+        with self._lock:
+            bucket = self._bucket(path)
+            now = time.monotonic()
+            if now - bucket.decreased_at < _DECREASE_COOLDOWN:
+                return
+
+            bucket.decreased_at = now
+            bucket.rate = max(
+                self.min_rate, bucket.rate * self.decrease_factor
+            )
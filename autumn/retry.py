@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+__all__ = ("RetryBudget", "RetryPolicy")
+
+
+class RetryBudget:
+    """A token bucket that limits how many retries a client may issue.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one.
+    The bucket also refills at ``min_per_second`` tokens per second so that
+    a quiet client can still retry occasional failures. When the bucket is
+    empty, failed requests are not retried. This stops a brownout upstream
+    from being amplified by every caller retrying at once.
+
+    A budget is thread-safe and may be shared between several clients.
+
+    Parameters
+    ----------
+    ratio: float
+        The number of retries earned per request. ``0.2`` allows at most one retry for every five requests, on average.
+    min_per_second: float
+        The number of retries earned per second, regardless of traffic.
+    capacity: float
+        The maximum number of retries that can be banked.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        capacity: float = 10.0,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.min_per_second
+        )
+
+    def deposit(self) -> None:
+        """Record a request, earning ``ratio`` tokens."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend a token on a retry.
+
+        Returns
+        -------
+        bool
+            Whether a token was available. If ``False``, the retry must not be attempted.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+    @property
+    def available(self) -> float:
+        """The number of retries currently banked."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+def _default_budget() -> RetryBudget:
+    return RetryBudget()
+
+
+@dataclass
+class RetryPolicy:
+    """Controls when and how failed requests are retried.
+
+    Backoff uses "full jitter": the delay before retry ``n`` is drawn uniformly
+    from ``[0, min(max_delay, base_delay * 2 ** n)]``.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        policy = autumn.RetryPolicy(
+            max_retries=3,
+            max_delay=2.0,
+            retry_methods=frozenset({"GET"}),
+        )
+        client = autumn.Client(token="your_api_key", retry_policy=policy)
+
+    Attributes
+    ----------
+    max_retries: int
+        The maximum number of retries after the original request.
+    base_delay: float
+        The backoff, in seconds, before the first retry.
+    max_delay: float
+        The maximum backoff, in seconds, between two attempts.
+    retry_statuses: FrozenSet[int]
+        The HTTP status codes that are retried.
+    retry_methods: FrozenSet[str]
+        The HTTP methods that are retried. Remove ``"POST"`` if duplicated writes are unacceptable to you.
+    respect_retry_after: bool
+        Whether to wait for the duration given by a ``Retry-After`` header on ``429`` and ``503`` responses.
+    max_retry_after: float
+        The longest ``Retry-After`` value, in seconds, that will be honored. Longer values are clamped.
+    budget: Optional[:class:`RetryBudget`]
+        The retry budget shared by every request using this policy. ``None`` disables the budget.
+    """
+
+    max_retries: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset(
+        {"GET", "POST", "PUT", "PATCH", "DELETE"}
+    )
+    respect_retry_after: bool = True
+    max_retry_after: float = 30.0
+    budget: Optional[RetryBudget] = field(default_factory=_default_budget)
+
+    def __post_init__(self):
+        self._rand = random.Random()
+
+    def backoff(self, retry: int) -> float:
+        """Return a jittered backoff, in seconds, for the given retry number (starting at 0)."""
+        ceiling = min(self.max_delay, self.base_delay * 2**retry)
+        return self._rand.uniform(0, ceiling)
+
+    def _retry_after(
+        self, status: Optional[int], header: Optional[str]
+    ) -> Optional[float]:
+        if (
+            not self.respect_retry_after
+            or header is None
+            or status not in (429, 503)
+        ):
+            return None
+
+        try:
+            seconds = float(header)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                return None
+            seconds = retry_at.timestamp() - time.time()
+
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def _next_delay(
+        self,
+        method: str,
+        retry: int,
+        *,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        # ``None`` means the failure is final.
+        if retry >= self.max_retries:
+            return None
+        if method.upper() not in self.retry_methods:
+            return None
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        delay = self.backoff(retry)
+        server_delay = self._retry_after(status, retry_after)
+        if server_delay is not None:
+            delay = max(delay, server_delay)
+        return delay
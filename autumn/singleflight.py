@@ -0,0 +1,114 @@
+import asyncio
+import json
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .timeouts import _deadline_exceeded
+
+R = TypeVar("R")
+
+# Methods whose identical in-flight requests can safely share one response.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+_FlightKey = Tuple[str, str, Any, str]
+
+
+def _flight_key(
+    method: str, path: str, type_: Any, kwargs: Dict[str, Any]
+) -> Optional[_FlightKey]:
+    method = method.upper()
+    if method not in _IDEMPOTENT_METHODS:
+        return None
+
+    # ``type_`` is part of the key so that callers only ever share a model of
+    # the type they asked for.
+    options = json.dumps(kwargs, sort_keys=True, default=str)
+    return (method, path, type_, options)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared = 0
+
+    def do(
+        self, key: _FlightKey, func: Callable[[], R], timeout: Optional[float]
+    ) -> R:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise _deadline_exceeded(key[0], key[1])
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+class _AsyncSingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.shared = 0
+
+    def _forget(self, key: _FlightKey, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    async def do(
+        self,
+        key: _FlightKey,
+        func: Callable[[], Awaitable[R]],
+        timeout: Optional[float],
+    ) -> R:
+        task = self._calls.get(key)
+        if task is None:
+            # The request runs in its own task, so a caller that gives up or
+            # is cancelled does not cancel it for everyone else.
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            if task.done():
+                raise
+            raise _deadline_exceeded(key[0], key[1]) from None
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Literal
+
+from .error import AutumnError
+
+__all__ = ("Spool", "FileSpool", "SQLiteSpool")
+
+FsyncPolicy = Literal["always", "interval", "never"]
+_FSYNC_POLICIES = ("always", "interval", "never")
+
+
+def _check_fsync(fsync: str) -> None:
+    if fsync not in _FSYNC_POLICIES:
+        raise AutumnError(
+            f"fsync must be one of {', '.join(_FSYNC_POLICIES)}, not {fsync!r}",
+            "invalid_spool_option",
+        )
+
+
+class Spool(ABC):
+    """A durable journal of tracked events that have not been acknowledged by Autumn yet.
+
+    A tracker created with a spool writes every event to it before :meth:`~autumn.tracker.Tracker.track` returns,
+    and acknowledges it once Autumn has accepted or rejected it. Events still in the spool when
+    a tracker is created, for example after a crash, are sent again with their original idempotency keys.
+
+    Events given up on because Autumn could not be reached are left in the spool. With
+    :class:`~autumn.aio.tracker.AsyncTracker`, :meth:`append` and :meth:`merge` run on the event loop and
+    :meth:`ack` runs on a worker thread.
+
+    Events are identified by their idempotency key. Subclass this to store them somewhere else.
+    """
+
+    @abstractmethod
+    def append(self, event_id: str, payload: Dict[str, Any]) -> None:
+        """Record a new event."""
+
+    @abstractmethod
+    def merge(self, event_id: str, value: float) -> None:
+        """Record that ``value`` was added to a recorded event's ``value`` by coalescing."""
+
+    @abstractmethod
+    def ack(self, event_ids: Iterable[str]) -> None:
+        """Forget events that no longer need to be sent."""
+
+    @abstractmethod
+    def pending(self) -> List[Dict[str, Any]]:
+        """Return the payload of every recorded event that has not been acknowledged, oldest first."""
+
+    def close(self) -> None:
+        """Release any resources held by the spool."""
+
+
+class FileSpool(Spool):
+    """A spool backed by an append-only JSON Lines file.
+
+    Each event, coalesced increment and acknowledgement is appended as one line. Once acknowledged lines outnumber
+    both the pending events and ``compact_threshold``, the file is rewritten with only the pending events.
+    A line torn by a crash mid-write is ignored when the file is read back.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(token="your_api_key")
+        tracker = client.tracker(spool=autumn.FileSpool("/var/lib/myapp/autumn.jsonl"))
+
+    Parameters
+    ----------
+    path: str
+        The path of the journal file. It is created if it does not exist.
+    fsync: Literal["always", "interval", "never"]
+        When to flush writes to disk. ``"always"`` survives power loss but costs a disk flush per event.
+        ``"interval"`` flushes at most every ``fsync_interval`` seconds, and ``"never"`` leaves it to the OS.
+        Every policy survives the process being killed.
+    fsync_interval: float
+        The number of seconds between disk flushes with the ``"interval"`` policy.
+    compact_threshold: int
+        The minimum number of acknowledged lines before the file is compacted.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fsync: FsyncPolicy = "always",
+        fsync_interval: float = 1.0,
+        compact_threshold: int = 1000,
+    ):
+        _check_fsync(fsync)
+        self.path = path
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.Lock()
+        self._dead = 0
+        self._events = self._load()
+        self._synced_at = time.monotonic()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        events: Dict[str, Dict[str, Any]] = {}
+        try:
+            file = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return events
+
+        with file:
+            for line in file:
+                self._dead += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                op = record.get("op")
+                if op == "add":
+                    events[record["id"]] = record["payload"]
+                elif op == "merge" and record["id"] in events:
+                    events[record["id"]]["value"] += record["value"]
+                elif op == "ack":
+                    events.pop(record["id"], None)
+
+        self._dead -= len(events)
+        return events
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        self._file.write(
+            "".join(json.dumps(record) + "\n" for record in records)
+        )
+        self._file.flush()
+
+        now = time.monotonic()
+        if self.fsync == "always" or (
+            self.fsync == "interval"
+            and now - self._synced_at >= self.fsync_interval
+        ):
+            os.fsync(self._file.fileno())
+            self._synced_at = now
+
+    def append(self, event_id: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._events[event_id] = dict(payload)
+            self._write([{"op": "add", "id": event_id, "payload": payload}])
+
+    def merge(self, event_id: str, value: float) -> None:
+        with self._lock:
+            event = self._events.get(event_id)
+            if event is None:
+                return
+
+            event["value"] += value
+            self._write([{"op": "merge", "id": event_id, "value": value}])
+
+    def ack(self, event_ids: Iterable[str]) -> None:
+        with self._lock:
+            records = []
+            for event_id in event_ids:
+                if self._events.pop(event_id, None) is not None:
+                    records.append({"op": "ack", "id": event_id})
+            if not records:
+                return
+
+            self._write(records)
+            self._dead += len(records)
+            if self._dead >= self.compact_threshold and self._dead >= len(
+                self._events
+            ):
+                self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            for event_id, payload in self._events.items():
+                record = {"op": "add", "id": event_id, "payload": payload}
+                tmp.write(json.dumps(record) + "\n")
+            tmp.flush()
+            os.fsync(tmp.fileno())
+
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._dead = 0
+
+    def pending(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(payload) for payload in self._events.values()]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if self.fsync != "never":
+                os.fsync(self._file.fileno())
+            self._file.close()
+
+
+class SQLiteSpool(Spool):
+    """A spool backed by a SQLite database.
+
+    Events are rows that are deleted when acknowledged, so the database never needs compacting beyond
+    SQLite's own page reuse. The database runs in WAL mode.
+
+    Parameters
+    ----------
+    path: str
+        The path of the database file. It is created if it does not exist.
+    fsync: Literal["always", "interval", "never"]
+        How durable each write is. ``"always"`` uses ``synchronous=FULL``, ``"interval"`` uses ``synchronous=NORMAL``
+        (a power loss may lose the last transactions, but never corrupts the database) and ``"never"`` uses
+        ``synchronous=OFF``. Every policy survives the process being killed.
+    """
+
+    _SYNCHRONOUS = {"always": "FULL", "interval": "NORMAL", "never": "OFF"}
+
+    def __init__(self, path: str, *, fsync: FsyncPolicy = "always"):
+        _check_fsync(fsync)
+        self.path = path
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={self._SYNCHRONOUS[fsync]}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " id TEXT NOT NULL UNIQUE,"
+            " payload TEXT NOT NULL,"
+            " delta REAL NOT NULL DEFAULT 0"
+            ")"
+        )
+        self._db.commit()
+
+    def append(self, event_id: str, payload: Dict[str, Any]) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO events (id, payload) VALUES (?, ?)",
+                (event_id, json.dumps(payload)),
+            )
+
+    def merge(self, event_id: str, value: float) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE events SET delta = delta + ? WHERE id = ?",
+                (value, event_id),
+            )
+
+    def ack(self, event_ids: Iterable[str]) -> None:
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM events WHERE id = ?",
+                [(event_id,) for event_id in event_ids],
+            )
+
+    def pending(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT payload, delta FROM events ORDER BY seq"
+            ).fetchall()
+
+        events = []
+        for raw, delta in rows:
+            payload = json.loads(raw)
+            if delta:
+                total = payload.get("value", 1) + delta
+                payload["value"] = int(total) if total.is_integer() else total
+            events.append(payload)
+        return events
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
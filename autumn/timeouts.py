@@ -0,0 +1,101 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .error import AutumnTimeoutError
+
+__all__ = ("Timeout",)
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Connect and read timeouts for a single HTTP attempt.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(
+            token="your_api_key",
+            timeout=autumn.Timeout(connect=3.0, read=10.0),
+            endpoint_timeouts={
+                "/check": autumn.Timeout(connect=0.5, read=1.0),
+                "/checkout": autumn.Timeout(connect=3.0, read=30.0),
+            },
+        )
+
+    Attributes
+    ----------
+    connect: Optional[float]
+        The number of seconds to wait for a connection to be established. ``None`` waits forever.
+    read: Optional[float]
+        The number of seconds to wait for the server to send data. ``None`` waits forever.
+    """
+
+    connect: Optional[float] = 5.0
+    read: Optional[float] = 30.0
+
+
+DEFAULT_TIMEOUT = Timeout()
+
+
+def _select_timeout(
+    path: str, default: Timeout, overrides: Dict[str, Timeout]
+) -> Timeout:
+    # The longest matching prefix wins, so "/customers" can cover
+    # "/customers/{id}" while "/customers/{id}/billing_portal" stays overridable.
+    best = None
+    for prefix in overrides:
+        if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+            if best is None or len(prefix) > len(best):
+                best = prefix
+
+    return default if best is None else overrides[best]
+
+
+def _deadline_exceeded(method: str, path: str) -> AutumnTimeoutError:
+    return AutumnTimeoutError(
+        f"Deadline exceeded for {method} {path}", "deadline_exceeded"
+    )
+
+
+def _deadline_at(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return time.monotonic() + deadline
+
+
+def _remaining(
+    deadline_at: Optional[float], method: str, path: str
+) -> Optional[float]:
+    if deadline_at is None:
+        return None
+
+    remaining = deadline_at - time.monotonic()
+    if remaining <= 0:
+        raise _deadline_exceeded(method, path)
+    return remaining
+
+
+def _check_deadline(
+    deadline_at: Optional[float],
+    delay: float,
+    method: str,
+    path: str,
+    exc: BaseException,
+) -> None:
+    # Sleeping past the deadline only to fail afterwards wastes the caller's budget.
+    if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+        raise _deadline_exceeded(method, path) from exc
+
+
+def _clamp(
+    value: Optional[float], remaining: Optional[float]
+) -> Optional[float]:
+    if remaining is None:
+        return value
+    if value is None:
+        return remaining
+    return min(value, remaining)
@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .error import AutumnError, AutumnHTTPError
+from .models.response import TrackResponse
+from .utils import _build_payload
+
+if TYPE_CHECKING:
+    from .cache import CheckCache
+    from .http import HTTPClient
+    from .models.meta import CustomerData
+    from .retry import RetryPolicy
+    from .spool import Spool
+
+__all__ = ("Tracker", "TrackerStats")
+
+ErrorCallback = Callable[[Dict[str, Any], BaseException], None]
+_CoalesceKey = Tuple[str, str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class TrackerStats:
+    """A snapshot of a tracker's queue.
+
+    Attributes
+    ----------
+    queue_depth: int
+        The number of requests waiting to be sent, including requests queued for a retry.
+    in_flight: int
+        The number of requests currently being sent.
+    enqueued: int
+        The total number of events accepted by :meth:`Tracker.track`.
+    sent: int
+        The total number of events acknowledged by Autumn.
+    retried: int
+        The total number of times a request was queued again after a failed send.
+    failed: int
+        The total number of events given up on. Each request was passed to ``on_error``.
+    dropped: int
+        The total number of events rejected because the queue was full. Each was passed to ``on_error``.
+    coalesced: int
+        The total number of events that were added to the ``value`` of an event already in the queue
+        instead of being sent on their own. Always ``0`` unless the tracker was created with ``coalesce=True``.
+    replayed: int
+        The number of events read back from the spool when the tracker was created.
+    """
+
+    queue_depth: int
+    in_flight: int
+    enqueued: int
+    sent: int
+    retried: int
+    failed: int
+    dropped: int
+    coalesced: int = 0
+    replayed: int = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """The average number of events sent per ``/track`` request. ``1.0`` when nothing was coalesced."""
+        requests = self.enqueued - self.coalesced
+        if requests <= 0:
+            return 1.0
+        return self.enqueued / requests
+
+
+class _PendingEvent:
+    __slots__ = ("payload", "attempts", "count", "key")
+
+    def __init__(
+        self, payload: Dict[str, Any], key: Optional[_CoalesceKey] = None
+    ):
+        self.payload = payload
+        self.attempts = 0
+        # The number of ``track`` calls folded into this request.
+        self.count = 1
+        self.key = key
+
+
+class _EventBuffer:
+    def __init__(self):
+        self._events: Deque[_PendingEvent] = deque()
+        # Queued events that later events with the same key can be added to.
+        # An event leaves this map as soon as it is taken for sending, so its
+        # payload is never changed while a request for it is in flight.
+        self._open: Dict[_CoalesceKey, _PendingEvent] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, event: _PendingEvent) -> None:
+        self._events.append(event)
+        if event.key is not None and event.attempts == 0:
+            self._open[event.key] = event
+
+    def merge(self, event: _PendingEvent) -> Optional[_PendingEvent]:
+        target = self._open.get(event.key)  # type: ignore[arg-type]
+        if target is not None:
+            target.payload["value"] += event.payload["value"]
+            target.count += event.count
+        return target
+
+    def take(self, limit: int) -> List[_PendingEvent]:
+        events = self._events
+        batch = [events.popleft() for _ in range(min(limit, len(events)))]
+        if self._open:
+            for event in batch:
+                if event.key is not None:
+                    self._open.pop(event.key, None)
+        return batch
+
+
+class _BaseTracker(ABC):
+    def __init__(
+        self,
+        *,
+        max_batch: int,
+        flush_interval: float,
+        max_queue: int,
+        max_attempts: int,
+        on_error: Optional[ErrorCallback],
+        coalesce: bool = False,
+        check_cache: Optional[CheckCache] = None,
+        spool: Optional[Spool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.max_attempts = max_attempts
+        self.on_error = on_error
+        self.coalesce = coalesce
+        self._check_cache = check_cache
+
+        self._buffer = _EventBuffer()
+        # Events waiting out their backoff before they are sent again, as a
+        # heap of (ready_at, sequence, event).
+        self._delayed: List[Tuple[float, int, _PendingEvent]] = []
+        self._sequence = itertools.count()
+        self._retry_policy = retry_policy
+        self._closed = False
+        self._flush_requested = False
+
+        self._unfinished = 0
+        self._in_flight = 0
+        self._enqueued = 0
+        self._sent = 0
+        self._retried = 0
+        self._failed = 0
+        self._dropped = 0
+        self._coalesced = 0
+
+        self._spool = spool
+        self._replayed = 0
+        if spool is not None:
+            self._replay(spool)
+
+    def _replay(self, spool: Spool) -> None:
+        # Replayed events keep their idempotency keys, so any that did reach
+        # Autumn before the process died are deduplicated upstream.
+        for payload in spool.pending():
+            self._buffer.append(_PendingEvent(payload))
+            self._replayed += 1
+            self._unfinished += 1
+
+    def track(
+        self,
+        customer_id: str,
+        feature_id: Optional[str] = None,
+        *,
+        value: int = 1,
+        entity_id: Optional[str] = None,
+        event_name: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        properties: Optional[Dict[str, Any]] = None,
+        customer_data: Optional[CustomerData] = None,
+    ) -> Optional[str]:
+        """Queue a usage event. This never blocks on the network.
+
+        Takes the same arguments as :meth:`autumn.Client.track`. If ``idempotency_key`` is not given,
+        one is generated so that the event can be retried safely.
+
+        If the tracker coalesces events, an event with only a ``value`` for a ``feature_id`` (and optionally an
+        ``entity_id``) is added to a queued event for the same customer, feature and entity, if there is one.
+        Events with an ``event_name``, ``idempotency_key``, ``properties`` or ``customer_data`` are always sent on their own.
+
+        Returns
+        -------
+        Optional[str]
+            The idempotency key of the request that will carry the event, which is that of the queued event
+            it was added to if it was coalesced. ``None`` if the queue was full and the event was dropped.
+
+        Raises
+        ------
+        :class:`~autumn.error.AutumnError`
+            The tracker has been closed.
+        """
+        assert (
+            feature_id or event_name
+        ), "Either feature_id or event_name must be provided"
+
+        key: Optional[_CoalesceKey] = None
+        if (
+            self.coalesce
+            and feature_id is not None
+            and event_name is None
+            and idempotency_key is None
+            and properties is None
+            and customer_data is None
+        ):
+            key = (customer_id, feature_id, entity_id)
+
+        if idempotency_key is None:
+            idempotency_key = uuid.uuid4().hex
+
+        payload = _build_payload(locals(), _BaseTracker.track)
+        return self._enqueue(_PendingEvent(payload, key))
+
+    @abstractmethod
+    def _enqueue(self, event: _PendingEvent) -> Optional[str]: ...
+
+    def _admit(self, event: _PendingEvent) -> Optional[str]:
+        # Must be called with the tracker's lock held, if it has one. Returns
+        # the idempotency key the event was queued under, or None if the
+        # queue was full.
+        if self._closed:
+            raise AutumnError("The tracker has been closed.", "tracker_closed")
+
+        target = None
+        if event.key is not None:
+            target = self._buffer.merge(event)
+
+        if target is not None:
+            if self._spool is not None:
+                self._spool.merge(
+                    target.payload["idempotency_key"], event.payload["value"]
+                )
+            self._enqueued += 1
+            self._coalesced += 1
+            queued = target
+        elif self._queue_depth() >= self.max_queue:
+            self._dropped += 1
+            return None
+        else:
+            if self._spool is not None:
+                self._spool.append(
+                    event.payload["idempotency_key"], event.payload
+                )
+            self._buffer.append(event)
+            self._enqueued += 1
+            self._unfinished += 1
+            queued = event
+
+        if self._check_cache is not None:
+            payload = event.payload
+            self._check_cache._record_usage(
+                payload["customer_id"],
+                payload.get("feature_id"),
+                payload.get("value", 1),
+                payload.get("entity_id"),
+            )
+        return queued.payload["idempotency_key"]
+
+    def _retryable(self, exc: BaseException) -> bool:
+        # Client errors will fail the same way every time.
+        if isinstance(exc, AutumnHTTPError):
+            return exc.status_code == 429 or exc.status_code >= 500
+        return True
+
+    def _retry_later(self, event: _PendingEvent) -> None:
+        # Must be called with the tracker's lock held, if it has one. The
+        # backoff grows with the event's attempts rather than resetting on
+        # each flush, so max_attempts is spread over an outage instead of
+        # being spent within a second of it starting.
+        delay = 0.0
+        if self._retry_policy is not None:
+            delay = self._retry_policy.backoff(event.attempts - 1)
+        heapq.heappush(
+            self._delayed,
+            (time.monotonic() + delay, next(self._sequence), event),
+        )
+        self._retried += 1
+
+    def _retry_wait(self) -> Optional[float]:
+        # The number of seconds until the next delayed event may be sent.
+        if not self._delayed:
+            return None
+        return self._delayed[0][0] - time.monotonic()
+
+    def _release_retries(self) -> None:
+        # Once the tracker is closed, delayed events are sent straight away.
+        now = time.monotonic()
+        while self._delayed and (self._closed or self._delayed[0][0] <= now):
+            self._buffer.append(heapq.heappop(self._delayed)[2])
+
+    def _queue_depth(self) -> int:
+        return len(self._buffer) + len(self._delayed)
+
+    def _give_up(self, event: _PendingEvent, exc: BaseException) -> None:
+        # An event Autumn rejected is forgotten. One that failed only because
+        # Autumn could not be reached stays in the spool, so it is sent again
+        # by the next tracker that opens it.
+        if not self._retryable(exc):
+            self._ack(event)
+        self._report(event, exc)
+
+    def _ack(self, event: _PendingEvent) -> None:
+        if self._spool is not None:
+            self._spool.ack([event.payload["idempotency_key"]])
+
+    def _close_spool(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+
+    def _report(self, event: _PendingEvent, exc: BaseException) -> None:
+        if self.on_error is None:
+            return
+
+        try:
+            self.on_error(event.payload, exc)
+        except Exception:
+            pass
+
+    def _queue_full_error(self) -> AutumnError:
+        return AutumnError(
+            f"The tracker queue is full ({self.max_queue} events).",
+            "tracker_queue_full",
+        )
+
+    def _stats(self) -> TrackerStats:
+        return TrackerStats(
+            queue_depth=self._queue_depth(),
+            in_flight=self._in_flight,
+            enqueued=self._enqueued,
+            sent=self._sent,
+            retried=self._retried,
+            failed=self._failed,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            replayed=self._replayed,
+        )
+
+
+class Tracker(_BaseTracker):
+    """Sends :meth:`~autumn.Client.track` events from a background thread.
+
+    :meth:`track` only appends the event to an in-memory queue. A daemon thread sends queued events
+    once ``max_batch`` of them are waiting or ``flush_interval`` seconds have passed, whichever comes first,
+    with up to ``concurrency`` events from a batch in flight at once.
+    Failed sends are queued again, with the same idempotency key, up to ``max_attempts`` times. These are the
+    only retries: the client's :class:`~autumn.retry.RetryPolicy` is not applied on top of them, but its
+    ``base_delay`` and ``max_delay`` set the jittered backoff before each one. :meth:`flush` waits out the backoff.
+
+    With a :class:`~autumn.spool.Spool`, every event is written to disk before :meth:`track` returns and removed
+    once it has been sent or rejected by Autumn. Events given up on because Autumn could not be reached, and events
+    left by a previous process, stay in the spool and are sent again when the next tracker using it is created.
+
+    With ``coalesce=True``, plain increments for the same customer, feature and entity that arrive while an
+    earlier one is still queued are added to its ``value``, so they are sent as a single ``/track`` request.
+    The window is therefore ``flush_interval``. Totals are exact; :attr:`TrackerStats.coalescing_ratio`
+    reports how many events each request carried on average.
+
+    Create one with :meth:`autumn.Client.tracker`. Trackers are closed along with the client that created them.
+
+    Example:
+
+    .. code-block:: python
+
+        import autumn
+
+        client = autumn.Client(token="your_api_key")
+        tracker = client.tracker(max_batch=200, flush_interval=0.5)
+
+        tracker.track("john_doe", "chat_messages", value=1)
+
+        print(tracker.stats.queue_depth)
+        tracker.close()
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+        max_attempts: int = 3,
+        concurrency: int = 10,
+        on_error: Optional[ErrorCallback] = None,
+        coalesce: bool = False,
+        check_cache: Optional[CheckCache] = None,
+        spool: Optional[Spool] = None,
+    ):
+        super().__init__(
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            max_queue=max_queue,
+            max_attempts=max_attempts,
+            on_error=on_error,
+            coalesce=coalesce,
+            check_cache=check_cache,
+            spool=spool,
+            retry_policy=http.retry_policy,
+        )
+        self._http = http
+        self._concurrency = concurrency
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="autumn-tracker", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def stats(self) -> TrackerStats:
+        """The current :class:`TrackerStats`."""
+        with self._cond:
+            return self._stats()
+
+    def _enqueue(self, event: _PendingEvent) -> Optional[str]:
+        with self._cond:
+            queued = self._admit(event)
+            if len(self._buffer) >= self.max_batch:
+                self._cond.notify_all()
+
+        if queued is None:
+            self._report(event, self._queue_full_error())
+        return queued
+
+    def _ready(self) -> bool:
+        # A flush does not cut short the backoff of delayed events.
+        return (
+            self._closed
+            or (self._flush_requested and len(self._buffer) > 0)
+            or len(self._buffer) >= self.max_batch
+        )
+
+    def _next_batch(self) -> Optional[List[_PendingEvent]]:
+        with self._cond:
+            deadline = time.monotonic() + self.flush_interval
+            while not self._ready():
+                remaining = deadline - time.monotonic()
+                retry_wait = self._retry_wait()
+                if retry_wait is not None:
+                    remaining = min(remaining, retry_wait)
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            self._release_retries()
+            batch = self._buffer.take(self.max_batch)
+            if not batch and self._closed:
+                return None
+
+            self._in_flight += len(batch)
+            return batch
+
+    def _run(self) -> None:
+        # The spool is closed by this thread, so that a close() that timed
+        # out cannot pull it out from under an in-flight send.
+        executor = ThreadPoolExecutor(
+            max_workers=self._concurrency,
+            thread_name_prefix="autumn-tracker-send",
+        )
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+
+                # Waiting for the whole batch bounds the number of requests
+                # in flight, like the async tracker's gather.
+                for _ in executor.map(self._send, batch):
+                    pass
+        finally:
+            executor.shutdown(wait=True)
+            self._close_spool()
+
+    def _send(self, event: _PendingEvent) -> None:
+        try:
+            self._http.request(
+                "POST",
+                "/track",
+                TrackResponse,
+                retries=False,
+                json=event.payload,
+            )
+        except Exception as exc:
+            event.attempts += 1
+            retry = self._retryable(exc) and event.attempts < self.max_attempts
+            with self._cond:
+                self._in_flight -= 1
+                if retry:
+                    self._retry_later(event)
+                    return
+                self._failed += event.count
+                self._finish()
+
+            self._give_up(event, exc)
+        else:
+            self._ack(event)
+            with self._cond:
+                self._in_flight -= 1
+                self._sent += event.count
+                self._finish()
+
+    def _finish(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._flush_requested = False
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send every queued event now and wait for them to finish.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            The maximum number of seconds to wait. ``None`` waits until the queue is empty.
+
+        Returns
+        -------
+        bool
+            Whether every event was either sent or given up on before the timeout.
+        """
+        with self._cond:
+            if self._unfinished == 0:
+                return True
+
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._unfinished == 0, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush the queue and stop the background thread.
+
+        Events waiting to be retried are sent without waiting out their backoff.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            The maximum number of seconds to wait for the queue to drain.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        self.flush(timeout)
+        self._thread.join(timeout)
@@ -1,12 +1,15 @@
-import random
+import inspect
 import re
-from typing import Any, Callable, Dict, Set, Type, TypeVar
+from types import CodeType
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+from . import codec
 from .error import AutumnHTTPError, AutumnValidationError
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 
 _CONV_RE = re.compile(r"_([a-z])")
@@ -16,8 +19,13 @@ def _snake_to_camel(snake_str: str) -> str:
     return _CONV_RE.sub(lambda match: match.group(1).upper(), snake_str)
 
 
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
 def _decompose_value(value: Any) -> Any:
-    if isinstance(value, BaseModel):
+    if type(value) in _SCALAR_TYPES:
+        return value
+    elif isinstance(value, BaseModel):
         return value.model_dump()
     elif isinstance(value, (list, tuple, set)):
         return [_decompose_value(item) for item in value]
@@ -25,77 +33,124 @@ def _decompose_value(value: Any) -> Any:
     return value
 
 
+_PayloadPlan = Tuple[Tuple[str, Optional[str]], ...]
+_PAYLOAD_PLANS: Dict[CodeType, _PayloadPlan] = {}
+
+
+def _payload_plan(method: Callable) -> _PayloadPlan:
+    # Bound methods are recreated on every attribute access, but they all
+    # share the underlying function's code object, so that is the cache key.
+    code = method.__code__
+    plan = _PAYLOAD_PLANS.get(code)
+    if plan is None:
+        argcount = code.co_argcount + code.co_kwonlyargcount
+        steps = []
+        for param in code.co_varnames[:argcount]:
+            if param == "self":
+                continue
+
+            camel = _snake_to_camel(param)
+            steps.append((param, camel if camel != param else None))
+
+        plan = _PAYLOAD_PLANS[code] = tuple(steps)
+
+    return plan
+
+
 def _build_payload(
     scope: Dict[str, Any], method: Callable, *, ignore: Set[str] = set()
 ) -> Dict[str, Any]:
-    params = method.__code__.co_varnames
-
-    camel_to_snake_param_map = {}
-    for p in params:
-        camel_case = _snake_to_camel(p)
-        if camel_case != p:
-            camel_to_snake_param_map[camel_case] = p
-
     payload: Dict[str, Any] = {}
 
-    for key, value in scope.items():
-        payload_param = key
-        if payload_param in camel_to_snake_param_map:
-            payload_param = camel_to_snake_param_map[payload_param]
+    for param, camel in _payload_plan(method):
+        value = scope.get(param)
+        if value is None and camel is not None:
+            value = scope.get(camel)
 
-        if (
-            payload_param != "self"
-            and (payload_param in params)
-            and (payload_param not in ignore)
-            and (value is not None)
-        ):
-            payload[payload_param] = _decompose_value(value)
+        if value is not None and param not in ignore:
+            payload[param] = _decompose_value(value)
 
     return payload
 
 
+def _endpoint(path: str) -> str:
+    # The first path segment, e.g. "/customers" for "/customers/cus_1".
+    return "/" + path.lstrip("/").split("/", 1)[0]
+
+
+def _validation_error(
+    exc: ValidationError, received: Any
+) -> AutumnValidationError:
+    errors = exc.errors()
+    error_message = errors[0]["msg"]
+    error_path = errors[0]["loc"]
+    error_code = errors[0]["type"]
+
+    err = AutumnValidationError(
+        f"{error_message} at {error_path} with code {error_code}",
+        "validation_error",
+    )
+    err.add_note("Received response: " + str(received))
+    return err
+
+
 def _build_model(model: Type[T], data: Dict[str, Any]) -> T:
     try:
         return model.model_validate(data)
     except ValidationError as e:
-        errors = e.errors()
-        error_message = errors[0]["msg"]
-        error_path = errors[0]["loc"]
-        error_code = errors[0]["type"]
+        raise _validation_error(e, data)
+
+
+def _build_model_json(model: Type[T], raw: bytes) -> T:
+    # Validating the bytes directly skips building an intermediate dict.
+    try:
+        return model.model_validate_json(raw or b"{}")
+    except ValidationError as e:
+        raise _validation_error(e, raw.decode(errors="replace"))
 
-        err = AutumnValidationError(
-            f"{error_message} at {error_path} with code {error_code}",
-            "validation_error",
-        )
-        err.add_note("Received response: " + str(data))
-        raise err
+
+def _http_error(status_code: int, data: Dict[str, Any]) -> AutumnHTTPError:
+    message = data.get("message", "No error message provided.")
+    code = data.get("code", "unknown_error")
+    return AutumnHTTPError(
+        message,
+        code,
+        status_code,
+    )
 
 
 def _check_response(status_code: int, data: Dict[str, Any]) -> None:
     if not 200 <= status_code < 300:
-        message = data.get("message", "No error message provided.")
-        code = data.get("code", "unknown_error")
-        raise AutumnHTTPError(
-            message,
-            code,
-            status_code,
-        )
-
-
-class ExponentialBackoff:
-    def __init__(self):
-        rand = random.Random()
-        rand.seed()
-
-        self._rand = rand
-        self._base = 2
-        self._state = 0
-
-    def tick(self):
-        self._state += 1
-
-    @property
-    def bedtime(self):
-        raw_time = self._base**self._state
-        jitter = self._rand.uniform(0, 1)
-        return raw_time + jitter
+        raise _http_error(status_code, data)
+
+
+def _decode_error(raw: bytes) -> Dict[str, Any]:
+    try:
+        data = codec.loads(raw)
+    except codec.DecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _check_raw_response(status_code: int, raw: bytes) -> None:
+    if not 200 <= status_code < 300:
+        raise _http_error(status_code, _decode_error(raw))
+
+
+def _encode_body(kwargs: Dict[str, Any]) -> None:
+    if "json" in kwargs:
+        kwargs["data"] = codec.dumps(kwargs.pop("json"))
+
+
+def _then(result: Any, callback: Callable[[Any], R]) -> Any:
+    # Client methods return whatever the HTTP client returns: a model for the
+    # sync client, a coroutine for the async one. This runs ``callback`` on
+    # the eventual value while keeping that shape.
+    if inspect.isawaitable(result):
+
+        async def chain() -> R:
+            return callback(await result)
+
+        return chain()
+
+    return callback(result)
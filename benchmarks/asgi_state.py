@@ -0,0 +1,98 @@
+"""Micro-benchmark for how :class:`autumn.asgi.AutumnASGI` hands its state to the routes.
+
+Compares writing the state into the ASGI scope directly, as ``AutumnASGI.__call__`` does, against the
+previous implementation, which ran every request through a Starlette ``BaseHTTPMiddleware``.
+Requests to ``POST /check/`` are driven through the app in-process, with the upstream call stubbed out.
+
+Run with ``python benchmarks/asgi_state.py``. Requires ``starlette``.
+"""
+
+import asyncio
+import time
+
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Route, Router
+
+from autumn.asgi import AutumnASGI
+from autumn.asgi.routes.core import check_route
+from autumn.models.response import CheckResponse
+
+NUMBER = 20_000
+ROUNDS = 5
+
+BODY = b'{"feature_id": "messages"}'
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "POST",
+    "scheme": "http",
+    "path": "/check/",
+    "raw_path": b"/check/",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"content-type", b"application/json")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("testserver", 80),
+}
+
+
+class _StateMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, *, state):
+        super().__init__(app)
+        self._state = state
+
+    async def dispatch(self, request, call_next):
+        request.state.__autumn__ = self._state
+        return await call_next(request)
+
+
+async def _identify(request):
+    return {"customer_id": "user_123", "customer_data": {}}
+
+
+async def _request(method, path, type_, **kwargs):
+    return CheckResponse(allowed=True, code="ok", customer_id="user_123")
+
+
+async def _receive():
+    return {"type": "http.request", "body": BODY, "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def _rate(app):
+    best = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            await app(dict(SCOPE), _receive, _send)
+        best = max(best, NUMBER / (time.perf_counter() - start))
+    return best
+
+
+async def main():
+    app = AutumnASGI("sk_test", identify=_identify)
+    app._client.http.request = _request
+
+    middleware = Router(
+        routes=[Route("/check/", check_route, methods={"POST"})],
+        middleware=[Middleware(_StateMiddleware, state=app._state)],
+    )
+
+    before = await _rate(middleware)
+    after = await _rate(app)
+    print(
+        f"BaseHTTPMiddleware {before:9,.0f} req/s"
+        f"  scope injection {after:9,.0f} req/s"
+        f"  ({after / before:.1f}x)"
+    )
+
+    await app.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
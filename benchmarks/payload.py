@@ -0,0 +1,88 @@
+"""Micro-benchmark for building request payloads.
+
+Compares the cached per-method plan used by :func:`autumn.utils._build_payload`
+against the previous implementation, which re-derived the parameter list and
+camelCase map from the method's code object on every call.
+
+Run with ``python benchmarks/payload.py``.
+"""
+
+import timeit
+
+from autumn.client import Client
+from autumn.utils import _build_payload, _decompose_value, _snake_to_camel
+
+NUMBER = 200_000
+
+
+def _uncached_build_payload(scope, method, *, ignore=set()):
+    params = method.__code__.co_varnames
+
+    camel_to_snake_param_map = {}
+    for p in params:
+        camel_case = _snake_to_camel(p)
+        if camel_case != p:
+            camel_to_snake_param_map[camel_case] = p
+
+    payload = {}
+    for key, value in scope.items():
+        payload_param = camel_to_snake_param_map.get(key, key)
+        if (
+            payload_param != "self"
+            and payload_param in params
+            and payload_param not in ignore
+            and value is not None
+        ):
+            payload[payload_param] = _decompose_value(value)
+
+    return payload
+
+
+def main():
+    client = Client(token="sk_test")
+    check_scope = {
+        "self": client,
+        "customer_id": "user_123",
+        "product_id": None,
+        "feature_id": "messages",
+        "required_balance": 1,
+        "send_event": False,
+        "with_preview": False,
+        "entity_id": None,
+        "customer_data": None,
+        "deadline": None,
+    }
+    track_scope = {
+        "self": client,
+        "customer_id": "user_123",
+        "feature_id": "messages",
+        "value": 1,
+        "entity_id": None,
+        "event_name": None,
+        "idempotency_key": None,
+        "properties": None,
+        "customer_data": None,
+        "deadline": None,
+    }
+
+    for name, scope in (("check", check_scope), ("track", track_scope)):
+        method = getattr(client, name)
+        before = timeit.timeit(
+            lambda: _uncached_build_payload(
+                scope, method, ignore={"deadline"}
+            ),
+            number=NUMBER,
+        )
+        after = timeit.timeit(
+            lambda: _build_payload(scope, method, ignore={"deadline"}),
+            number=NUMBER,
+        )
+        print(
+            f"{name:<6} uncached {before / NUMBER * 1e6:6.2f}us"
+            f"  cached {after / NUMBER * 1e6:6.2f}us"
+            f"  ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from autumn.aio.client import AsyncClient
+from autumn.error import AutumnHTTPError
+
+
+async def _echo(value, delay=0.0):
+    await asyncio.sleep(delay)
+    if value < 0:
+        raise ValueError(value)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_map_collects_errors():
+    client = AsyncClient(token="sk_test")
+
+    calls = [{"value": 1}, {"value": -1}, {"value": 2}]
+    results = [item async for item in client.map(_echo, calls, ordered=True)]
+
+    assert [item.index for item in results] == [0, 1, 2]
+    assert [item.ok for item in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].unwrap() == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_map_completion_order_and_concurrency():
+    client = AsyncClient(token="sk_test")
+    running = 0
+    peak = 0
+
+    async def call(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running -= 1
+        return value
+
+    calls = ({"value": value} for value in range(5))
+    results = [
+        item.result async for item in client.map(call, calls, concurrency=5)
+    ]
+
+    assert results == [4, 3, 2, 1, 0]
+    assert peak == 5
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_map_is_capped_by_connection_limit():
+    client = AsyncClient(token="sk_test", limit=2)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async for _ in client.map(call, [{}] * 10, concurrency=50):
+        pass
+
+    assert peak == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_map_client_method(autumn_server):
+    autumn_server.default = (400, {"message": "bad", "code": "invalid"})
+    client = AsyncClient(token="sk_test", base_url=autumn_server.url)
+
+    calls = [{"customer_id": "user_123", "feature_id": "messages"}]
+    results = [item async for item in client.map("check", calls)]
+
+    assert isinstance(results[0].error, AutumnHTTPError)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_map_resolves_method_names(autumn_server):
+    autumn_server.default = (404, {"message": "missing", "code": "not_found"})
+    client = AsyncClient(token="sk_test", base_url=autumn_server.url)
+
+    calls = [{"customer_id": "user_123"}]
+    results = [item async for item in client.map("customers.get", calls)]
+
+    assert isinstance(results[0].error, AutumnHTTPError)
+    assert autumn_server.requests[0][1] == "/v1/customers/user_123"
+
+    for name in ("close", "_request", "http._session"):
+        with pytest.raises(AttributeError):
+            client.map(name, calls)
+
+    await client.close()
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from autumn.aio.client import AsyncClient
+from autumn.aio.limits import AdaptiveConcurrencyLimit
+from autumn.error import AutumnTimeoutError
+from autumn.retry import RetryPolicy
+
+
+async def _saturate(limit, rtt, n):
+    # Keeps every slot busy, completing one request at a time.
+    for _ in range(n):
+        while limit.stats().in_flight < limit.limit:
+            assert await limit._acquire(None)
+        limit._release(rtt)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat():
+    limit = AdaptiveConcurrencyLimit(initial_limit=2, max_limit=50)
+    await _saturate(limit, 0.01, 50)
+    assert limit.limit > 10
+
+    stats = limit.stats()
+    assert stats.rtt == pytest.approx(0.01)
+    assert stats.baseline_rtt == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_limit_does_not_grow_when_underused():
+    limit = AdaptiveConcurrencyLimit(initial_limit=10)
+    for _ in range(50):
+        assert await limit._acquire(None)
+        limit._release(0.01)
+    assert limit.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_limit_shrinks_when_latency_rises():
+    limit = AdaptiveConcurrencyLimit(initial_limit=20, min_limit=2)
+    await _saturate(limit, 0.01, 10)
+    grown = limit.limit
+
+    await _saturate(limit, 0.1, 30)
+    assert limit.limit < grown / 2
+
+
+@pytest.mark.asyncio
+async def test_drop_backs_off():
+    limit = AdaptiveConcurrencyLimit(initial_limit=10, backoff=0.5)
+    await limit._acquire(None)
+    limit._release(dropped=True)
+    assert limit.limit == 5
+
+    # Cancelled attempts do not move the limit.
+    await limit._acquire(None)
+    limit._release()
+    assert limit.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_in_order():
+    limit = AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+    order = []
+
+    async def call(name):
+        await limit._acquire(None)
+        order.append(name)
+        await asyncio.sleep(0.01)
+        limit._release(0.01)
+
+    first = asyncio.ensure_future(call("a"))
+    await asyncio.sleep(0)
+    rest = [asyncio.ensure_future(call(name)) for name in "bc"]
+    await asyncio.sleep(0)
+    assert limit.stats().queued == 2
+
+    await asyncio.gather(first, *rest)
+    assert order == ["a", "b", "c"]
+
+    stats = limit.stats()
+    assert stats.acquired == 3
+    assert stats.total_queue_wait > 0.01
+
+
+@pytest.mark.asyncio
+async def test_acquire_gives_up_at_deadline():
+    limit = AdaptiveConcurrencyLimit(initial_limit=1)
+    await limit._acquire(None)
+
+    assert not await limit._acquire(0.01)
+    assert limit.stats().queued == 0
+
+    limit._release()
+    assert limit.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_releases_slots(autumn_server):
+    autumn_server.responses = [(503, {"message": "down"})]
+    autumn_server.default = (
+        200,
+        {"allowed": True, "customer_id": "user_123", "code": "ok"},
+    )
+    limit = AdaptiveConcurrencyLimit(initial_limit=10, backoff=0.5)
+
+    async with AsyncClient(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=RetryPolicy(max_retries=1, base_delay=0),
+        concurrency_limit=limit,
+    ) as client:
+        await client.check("user_123", feature_id="messages")
+
+    stats = limit.stats()
+    assert stats.limit == 5
+    assert stats.in_flight == 0
+    assert stats.acquired == 2
+    assert stats.rtt is not None
+
+
+@pytest.mark.asyncio
+async def test_client_deadline_while_queued(autumn_server):
+    limit = AdaptiveConcurrencyLimit(initial_limit=1)
+    await limit._acquire(None)
+
+    async with AsyncClient(
+        token="sk_test", base_url=autumn_server.url, concurrency_limit=limit
+    ) as client:
+        with pytest.raises(AutumnTimeoutError):
+            await client.check(
+                "user_123", feature_id="messages", deadline=0.05
+            )
+
+    assert autumn_server.requests == []
+    assert limit.stats().in_flight == 1
@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+
+from autumn.spool import FileSpool, Spool
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_flush(autumn_server, make_async_client):
+    client = make_async_client()
+    tracker = client.tracker(max_batch=100, flush_interval=60)
+
+    for _ in range(5):
+        tracker.track("user_123", "messages", value=2)
+
+    assert tracker.stats.queue_depth == 5
+    assert await tracker.flush(timeout=5)
+    assert tracker.stats.sent == 5
+    assert len(autumn_server.requests) == 5
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_close_flushes(autumn_server, make_async_client):
+    autumn_server.responses = [(500, {"message": "oops"})]
+    client = make_async_client()
+    tracker = client.tracker(flush_interval=0.01)
+
+    tracker.track("user_123", "messages", idempotency_key="evt_1")
+    await client.close()
+
+    stats = tracker.stats
+    assert stats.sent == 1
+    assert stats.retried == 1
+    assert stats.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_backs_off_between_attempts(
+    autumn_server, make_async_client
+):
+    autumn_server.responses = [(503, {"message": "unavailable"})]
+    client = make_async_client()
+    client.http.retry_policy.backoff = lambda retry: 0.3
+    tracker = client.tracker(flush_interval=0.01)
+
+    tracker.track("user_123", "messages")
+    assert not await tracker.flush(timeout=0.2)
+    assert len(autumn_server.requests) == 1
+
+    assert await tracker.flush(timeout=5)
+    assert len(autumn_server.requests) == 2
+    assert tracker.stats.sent == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_replays_spool(tmp_path, make_async_client):
+    path = str(tmp_path / "events.jsonl")
+    spool = FileSpool(path)
+    spool.append(
+        "evt_1",
+        {
+            "customer_id": "user_123",
+            "feature_id": "messages",
+            "value": 1,
+            "idempotency_key": "evt_1",
+        },
+    )
+    spool.close()
+
+    client = make_async_client()
+    tracker = client.tracker(spool=FileSpool(path))
+
+    assert await tracker.flush(timeout=5)
+    assert tracker.stats.sent == 1
+    await client.close()
+
+    spool = FileSpool(path)
+    assert spool.pending() == []
+    spool.close()
+
+
+class _RecordingSpool(Spool):
+    def __init__(self):
+        self.calls = []
+
+    def _record(self, name):
+        self.calls.append((name, threading.current_thread()))
+
+    def append(self, event_id, payload):
+        self._record("append")
+
+    def merge(self, event_id, value):
+        self._record("merge")
+
+    def ack(self, event_ids):
+        self._record("ack")
+
+    def pending(self):
+        return []
+
+    def close(self):
+        self._record("close")
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_spools_before_returning(
+    tmp_path, make_async_client
+):
+    path = str(tmp_path / "events.jsonl")
+    client = make_async_client()
+    tracker = client.tracker(flush_interval=60, spool=FileSpool(path))
+
+    tracker.track("user_123", "messages", idempotency_key="evt_1")
+
+    reader = FileSpool(path)
+    assert [event["idempotency_key"] for event in reader.pending()] == [
+        "evt_1"
+    ]
+    reader.close()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_tracker_acks_spool_off_loop(make_async_client):
+    spool = _RecordingSpool()
+    client = make_async_client()
+    tracker = client.tracker(flush_interval=60, coalesce=True, spool=spool)
+
+    tracker.track("user_123", "messages")
+    tracker.track("user_123", "messages")
+    await client.close()
+
+    assert [name for name, _ in spool.calls] == [
+        "append",
+        "merge",
+        "ack",
+        "close",
+    ]
+    threads = [thread for _, thread in spool.calls]
+    assert threads[:2] == [threading.main_thread()] * 2
+    assert threading.main_thread() not in threads[2:]
@@ -0,0 +1,77 @@
+import pytest
+
+from autumn.aio.client import AsyncClient
+from autumn.aio.http import create_connector
+from autumn.error import AutumnHTTPError
+from autumn.models.response import CheckResponse
+
+
+@pytest.mark.asyncio
+async def test_connector_options():
+    client = AsyncClient(
+        token="sk_test", limit=7, limit_per_host=3, keepalive_timeout=2.0
+    )
+    session = client.http._create_session()
+
+    assert session.connector.limit == 7
+    assert session.connector.limit_per_host == 3
+
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_connector_survives_client_close():
+    connector = create_connector(limit=10)
+    first = AsyncClient(token="sk_test", connector=connector)
+    second = AsyncClient(token="sk_test", connector=connector)
+
+    first.http.session = first.http._create_session()
+    second.http.session = second.http._create_session()
+    assert first.http.session.connector is second.http.session.connector
+
+    await first.close()
+    assert not connector.closed
+
+    await second.close()
+    assert not connector.closed
+
+    await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_request_roundtrip(autumn_server):
+    autumn_server.responses = [
+        (200, {"allowed": True, "code": "ok", "customer_id": "user_123"}),
+        (400, {"message": "bad", "code": "invalid_inputs"}),
+    ]
+
+    async with AsyncClient(
+        token="sk_test", base_url=autumn_server.url
+    ) as client:
+        response = await client.check("user_123", feature_id="messages")
+        assert isinstance(response, CheckResponse)
+        assert response.allowed
+
+        with pytest.raises(AutumnHTTPError) as exc_info:
+            await client.check("user_123", feature_id="messages")
+        assert exc_info.value.code == "invalid_inputs"
+
+    _, path, body = autumn_server.requests[0]
+    assert path == "/v1/check"
+    assert body["feature_id"] == "messages"
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_connections(autumn_server):
+    async with AsyncClient(
+        token="sk_test", base_url=autumn_server.url, limit=2
+    ) as client:
+        await client.warmup(connections=5)
+
+        assert client.http.session is not None
+        assert [path for _, path, _ in autumn_server.requests] == ["/", "/"]
+        connector = client.http.session.connector
+        assert sum(len(conns) for conns in connector._conns.values()) == 2
+
+        await client.track("user_123", "messages")
+        assert sum(len(conns) for conns in connector._conns.values()) == 2
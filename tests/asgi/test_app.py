@@ -0,0 +1,338 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from autumn.asgi import AutumnASGI
+from autumn.error import AutumnHTTPError
+from autumn.models.response import CheckResponse, TrackResponse
+
+DUMMY_CUSTOMER_ID = "user_123"
+DUMMY_IDENTIFY_RETURN_VALUE = {
+    "customer_id": DUMMY_CUSTOMER_ID,
+    "customer_data": {},
+}
+
+
+async def _call(app, method, path, payload=None, headers=()):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), *headers],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    status = messages[0]["status"]
+    content = b"".join(m.get("body", b"") for m in messages[1:])
+    return status, json.loads(content) if content else None
+
+
+def _make_app(response=None, identify=None, **kwargs):
+    identify = identify or AsyncMock(return_value=DUMMY_IDENTIFY_RETURN_VALUE)
+    app = AutumnASGI("sk_test", identify=identify, **kwargs)
+    app._client.http.request = AsyncMock(return_value=response)  # type: ignore
+    return app
+
+
+@pytest.mark.asyncio
+async def test_app_injects_state():
+    response = CheckResponse(
+        allowed=True, code="ok", customer_id=DUMMY_CUSTOMER_ID
+    )
+    identify = AsyncMock(return_value=DUMMY_IDENTIFY_RETURN_VALUE)
+    app = _make_app(response, identify)
+
+    status, data = await _call(
+        app, "POST", "/check/", {"feature_id": "messages"}
+    )
+
+    assert status == 200
+    assert data["allowed"] is True
+    identify.assert_awaited_once()
+    _, kwargs = app._client.http.request.call_args
+    assert kwargs["json"]["feature_id"] == "messages"
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_app_maps_http_errors():
+    app = _make_app()
+    app._client.http.request.side_effect = AutumnHTTPError(
+        "not found", "customer_not_found", 404
+    )
+
+    status, data = await _call(
+        app, "POST", "/check/", {"feature_id": "messages"}
+    )
+
+    assert status == 404
+    assert "customer_not_found" in data["detail"]
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_identify_cache():
+    response = CheckResponse(
+        allowed=True, code="ok", customer_id=DUMMY_CUSTOMER_ID
+    )
+    calls = []
+
+    async def identify(request):
+        calls.append(request.cookies.get("session"))
+        await asyncio.sleep(0.01)
+        return DUMMY_IDENTIFY_RETURN_VALUE
+
+    app = _make_app(
+        response,
+        identify,
+        identify_cache_key=lambda request: request.cookies.get("session"),
+    )
+    alice = [(b"cookie", b"session=alice")]
+    payload = {"feature_id": "messages"}
+
+    # Concurrent requests from one session share a single identify call.
+    results = await asyncio.gather(
+        *(_call(app, "POST", "/check/", payload, alice) for _ in range(3))
+    )
+    assert [status for status, _ in results] == [200, 200, 200]
+    await _call(app, "POST", "/check/", payload, alice)
+    assert calls == ["alice"]
+
+    await _call(app, "POST", "/check/", payload, [(b"cookie", b"session=bob")])
+    await _call(app, "POST", "/check/", payload)
+    await _call(app, "POST", "/check/", payload)
+    assert calls == ["alice", "bob", None, None]
+
+    app.identify_cache.pop("alice")
+    await _call(app, "POST", "/check/", payload, alice)
+    assert calls[-1] == "alice"
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_check_batch():
+    async def request(method, path, type_, **kwargs):
+        feature_id = kwargs["json"].get("feature_id")
+        if feature_id == "missing":
+            raise AutumnHTTPError("not found", "feature_not_found", 404)
+        return CheckResponse(
+            allowed=feature_id == "messages",
+            code="ok",
+            customer_id=kwargs["json"]["customer_id"],
+            feature_id=feature_id,
+        )
+
+    identify = AsyncMock(return_value=DUMMY_IDENTIFY_RETURN_VALUE)
+    app = _make_app(identify=identify, batch_concurrency=2)
+    app._client.http.request = request
+
+    checks = [
+        {"featureId": "messages"},
+        {"feature_id": "missing"},
+        {"feature_id": "seats", "customer_id": "someone_else"},
+    ]
+    status, data = await _call(
+        app, "POST", "/check/batch/", {"checks": checks}
+    )
+
+    assert status == 200
+    first, second, third = data["results"]
+    assert first["allowed"] is True
+    assert first["feature_id"] == "messages"
+    assert second == {
+        "error": {"code": "feature_not_found", "message": "not found"}
+    }
+    assert third["allowed"] is False
+    assert third["customer_id"] == DUMMY_CUSTOMER_ID
+    identify.assert_awaited_once()
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_check_batch_rejects_bad_input():
+    app = _make_app(max_batch=2)
+
+    status, _ = await _call(app, "POST", "/check/batch/", {"checks": "x"})
+    assert status == 400
+    status, data = await _call(
+        app, "POST", "/check/batch/", {"checks": [{}, {}, {}]}
+    )
+    assert status == 400
+    assert "at most 2" in data["detail"]
+    app._client.http.request.assert_not_called()
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_check_batch_isolates_item_failures():
+    async def request(method, path, type_, **kwargs):
+        if kwargs["json"]["feature_id"] == "slow":
+            raise asyncio.TimeoutError()
+        return CheckResponse(
+            allowed=True, code="ok", customer_id=DUMMY_CUSTOMER_ID
+        )
+
+    app = _make_app()
+    app._client.http.request = request
+
+    checks = [{"feature_id": "slow"}, {"value": 1}, {"feature_id": "messages"}]
+    status, data = await _call(
+        app, "POST", "/check/batch/", {"checks": checks}
+    )
+
+    assert status == 200
+    timeout, malformed, ok = data["results"]
+    assert timeout["error"]["code"] == "request_failed"
+    assert malformed["error"]["code"] == "invalid_inputs"
+    assert ok["allowed"] is True
+
+    await app.close()
+
+
+def _track_response(method, path, type_, **kwargs):
+    body = kwargs["json"]
+    return TrackResponse(
+        id="evt_" + body["feature_id"],
+        code="success",
+        customer_id=body["customer_id"],
+        feature_id=body["feature_id"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_batch():
+    app = _make_app()
+    app._client.http.request.side_effect = _track_response
+
+    events = [{"feature_id": "messages"}, {"featureId": "seats", "value": 2}]
+    status, data = await _call(
+        app, "POST", "/track/batch/", {"events": events}
+    )
+
+    assert status == 200
+    assert [r["id"] for r in data["results"]] == ["evt_messages", "evt_seats"]
+    _, kwargs = app._client.http.request.call_args_list[1]
+    assert kwargs["json"]["value"] == 2
+
+    app._client.http.request.side_effect = ConnectionResetError("reset")
+    status, data = await _call(
+        app, "POST", "/track/batch/", {"events": [{"feature_id": "x"}, {}]}
+    )
+    assert status == 200
+    assert data["results"] == [
+        {"error": {"code": "request_failed", "message": "reset"}},
+        {
+            "error": {
+                "code": "invalid_inputs",
+                "message": "Either feature_id or event_name must be provided",
+            }
+        },
+    ]
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_track():
+    app = _make_app(buffer_track=True, tracker_options={"flush_interval": 10})
+    app._client.http.request.side_effect = _track_response
+
+    status, data = await _call(
+        app, "POST", "/track/", {"feature_id": "messages"}
+    )
+    assert status == 202
+    assert data["code"] == "event_queued"
+    assert data["customer_id"] == DUMMY_CUSTOMER_ID
+
+    events = [{"feature_id": "seats"}, {"value": 1}]
+    status, batch = await _call(
+        app, "POST", "/track/batch/", {"events": events}
+    )
+    assert status == 207
+    queued, invalid = batch["results"]
+    assert queued["code"] == "event_queued"
+    assert invalid["error"]["code"] == "invalid_inputs"
+
+    status, _ = await _call(
+        app, "POST", "/track/batch/", {"events": [{"value": 1}]}
+    )
+    assert status == 400
+    status, _ = await _call(app, "POST", "/track/", {"value": 1})
+    assert status == 400
+
+    app._client.http.request.assert_not_called()
+    await app.close()
+
+    sent = [
+        kwargs["json"] for _, kwargs in app._client.http.request.call_args_list
+    ]
+    assert sorted(event["feature_id"] for event in sent) == [
+        "messages",
+        "seats",
+    ]
+    assert data["id"] in {event["idempotency_key"] for event in sent}
+
+
+@pytest.mark.asyncio
+async def test_buffered_track_queue_full():
+    app = _make_app(
+        buffer_track=True,
+        tracker_options={"max_queue": 1, "flush_interval": 10},
+    )
+    app._client.http.request.side_effect = _track_response
+
+    status, _ = await _call(app, "POST", "/track/", {"feature_id": "messages"})
+    assert status == 202
+    status, data = await _call(app, "POST", "/track/", {"feature_id": "seats"})
+    assert status == 503
+    assert "tracker_queue_full" in data["detail"]
+
+    await app.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_track_coalesces():
+    app = _make_app(
+        buffer_track=True,
+        tracker_options={"flush_interval": 10, "coalesce": True},
+    )
+    app._client.http.request.side_effect = _track_response
+
+    ids = []
+    for _ in range(3):
+        status, data = await _call(
+            app, "POST", "/track/", {"feature_id": "messages"}
+        )
+        assert status == 202
+        ids.append(data["id"])
+
+    assert len(set(ids)) == 1
+    assert app.tracker.stats.coalesced == 2
+    await app.close()
+
+    [(_, kwargs)] = app._client.http.request.call_args_list
+    assert kwargs["json"]["value"] == 3
+    assert kwargs["json"]["idempotency_key"] == ids[0]
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 from pydantic import BaseModel
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from typing import Optional
 
 from autumn.asgi.routes import core
@@ -65,7 +65,8 @@ async def test_attach_route_with_product_id():
 
     response = await core.attach_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
+    assert response.headers["content-type"] == "application/json"
 
 
 @pytest.mark.asyncio
@@ -84,7 +85,7 @@ async def test_attach_route_with_product_id_camel_case():
 
     response = await core.attach_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -103,7 +104,7 @@ async def test_attach_route_with_product_ids():
 
     response = await core.attach_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -122,7 +123,7 @@ async def test_attach_route_with_product_ids_camel_case():
 
     response = await core.attach_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -153,7 +154,7 @@ async def test_check_route_with_product_id():
 
     response = await core.check_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -171,7 +172,7 @@ async def test_check_route_with_product_id_camel_case():
 
     response = await core.check_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -189,7 +190,7 @@ async def test_check_route_with_feature_id():
 
     response = await core.check_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -207,7 +208,7 @@ async def test_check_route_with_feature_id_camel_case():
 
     response = await core.check_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -238,7 +239,7 @@ async def test_track_route_with_feature_id():
 
     response = await core.track_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -256,7 +257,7 @@ async def test_track_route_with_feature_id_camel_case():
 
     response = await core.track_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -274,7 +275,7 @@ async def test_track_route_with_event_name():
 
     response = await core.track_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
@@ -292,7 +293,7 @@ async def test_track_route_with_event_name_camel_case():
 
     response = await core.track_route(request)  # type: ignore
 
-    assert isinstance(response, JSONResponse)
+    assert isinstance(response, Response)
 
 
 @pytest.mark.asyncio
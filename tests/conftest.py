@@ -0,0 +1,107 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autumn.aio.client import AsyncClient
+from autumn.client import Client
+from autumn.retry import RetryPolicy
+
+
+class MockAutumnServer(ThreadingHTTPServer):
+    """A local HTTP server that replays queued ``(status, body[, headers])`` responses.
+
+    Once the queue is drained, ``default`` is served for every request.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.responses = []
+        self.default = (
+            200,
+            {"id": "evt_123", "code": "success", "customer_id": "user_123"},
+        )
+        self.requests = []
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: MockAutumnServer
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append(
+            (self.command, self.path, json.loads(body) if body else None)
+        )
+
+        if self.server.delay:
+            threading.Event().wait(self.server.delay)
+
+        if self.server.responses:
+            status, data, *extra = self.server.responses.pop(0)
+        else:
+            status, data, *extra = self.server.default
+
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        for name, value in (extra[0] if extra else {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def autumn_server():
+    server = MockAutumnServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_client(autumn_server):
+    """Build a :class:`~autumn.Client` for ``autumn_server`` that does not retry.
+
+    Keyword arguments are passed on to the client.
+    """
+
+    def make(**kwargs):
+        return Client(
+            token="sk_test",
+            base_url=autumn_server.url,
+            retry_policy=RetryPolicy(max_retries=0),
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_async_client(autumn_server):
+    """The :class:`~autumn.aio.client.AsyncClient` counterpart of ``make_client``."""
+
+    def make(**kwargs):
+        return AsyncClient(
+            token="sk_test",
+            base_url=autumn_server.url,
+            retry_policy=RetryPolicy(max_retries=0),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,163 @@
+import time
+
+import pytest
+
+from autumn.cache import CheckCache, TTLCache
+from autumn.models.response import CheckResponse
+
+CHECK = {
+    "allowed": True,
+    "customer_id": "user_123",
+    "code": "feature_found",
+    "feature_id": "messages",
+    "balance": 5,
+}
+ATTACH = {
+    "customer_id": "user_123",
+    "product_ids": ["pro"],
+    "code": "attached",
+    "message": "ok",
+}
+
+
+def test_ttl_cache_expires_and_evicts():
+    cache = TTLCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_check_is_served_from_cache(autumn_server, make_client):
+    autumn_server.default = (200, CHECK)
+    cache = CheckCache(ttl=60)
+    client = make_client(check_cache=cache)
+
+    for _ in range(3):
+        assert client.check("user_123", feature_id="messages").balance == 5
+    client.check("user_123", feature_id="messages", required_balance=2)
+
+    assert len(autumn_server.requests) == 2
+    assert cache.hits == 2
+
+    client.close()
+
+
+def test_track_decrements_cached_balance(autumn_server, make_client):
+    autumn_server.default = (200, CHECK)
+    cache = CheckCache(ttl=60)
+    client = make_client(check_cache=cache)
+
+    client.check("user_123", feature_id="messages", required_balance=3)
+    autumn_server.default = (
+        200,
+        {"id": "evt_1", "code": "success", "customer_id": "user_123"},
+    )
+    client.track("user_123", "messages", value=2)
+
+    response = client.check(
+        "user_123", feature_id="messages", required_balance=3
+    )
+    assert response.balance == 3
+    assert len(autumn_server.requests) == 2
+
+    # The balance would fall below the required balance, so ask Autumn again.
+    client.track("user_123", "messages", value=1)
+    autumn_server.default = (200, CHECK)
+    client.check("user_123", feature_id="messages", required_balance=3)
+    assert len(autumn_server.requests) == 4
+
+    client.close()
+
+
+def test_attach_invalidates_customer(autumn_server, make_client):
+    autumn_server.default = (200, CHECK)
+    cache = CheckCache(ttl=60)
+    client = make_client(check_cache=cache)
+
+    client.check("user_123", feature_id="messages")
+    autumn_server.responses = [(200, ATTACH)]
+    client.attach("user_123", product_id="pro")
+    assert len(cache) == 0
+
+    client.check("user_123", feature_id="messages")
+    assert len(autumn_server.requests) == 3
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_check_cache(autumn_server, make_async_client):
+    autumn_server.default = (200, CHECK)
+    cache = CheckCache(ttl=60)
+    client = make_async_client(
+        check_cache=cache,
+    )
+
+    first = await client.check("user_123", feature_id="messages")
+    second = await client.check("user_123", feature_id="messages")
+    assert first == second
+    assert len(autumn_server.requests) == 1
+
+    await client.check("user_123", feature_id="messages", send_event=True)
+    cached = await client.check("user_123", feature_id="messages")
+    assert cached.balance == 4
+    assert len(autumn_server.requests) == 2
+
+    await client.close()
+
+
+def _response(customer_id, balance=5):
+    return CheckResponse.model_validate(
+        {**CHECK, "customer_id": customer_id, "balance": balance}
+    )
+
+
+def test_in_flight_checks_are_only_discarded_for_changed_customers():
+    cache = CheckCache(ttl=60)
+    alice = ("alice", "messages", None, None, None)
+    bob = ("bob", "messages", None, None, None)
+
+    alice_started = cache._current_generation
+    bob_started = cache._current_generation
+    cache.consume("bob", "messages", 1)
+
+    cache._put(alice, alice_started, _response("alice"))
+    cache._put(bob, bob_started, _response("bob"))
+    assert cache._get(alice) is not None
+    assert cache._get(bob) is None
+
+    # A check started after the change is stored.
+    cache._put(bob, cache._current_generation, _response("bob"))
+    assert cache._get(bob) is not None
+
+    started = cache._current_generation
+    cache.clear()
+    cache._put(alice, started, _response("alice"))
+    assert len(cache) == 0
+
+
+def test_consume_and_invalidate_only_touch_the_customer():
+    cache = CheckCache(maxsize=2, ttl=60)
+    keys = [(c, "messages", None, None, None) for c in ("a", "b", "c")]
+    for key in keys:
+        cache._put(key, cache._current_generation, _response(key[0]))
+
+    # "a" was evicted, and the index forgot it along with its entry.
+    assert cache._get(keys[0]) is None
+    assert set(cache._cache._by_customer) == {"b", "c"}
+
+    cache.consume("b", "messages", 2)
+    assert cache._get(keys[1]).balance == 3
+    assert cache._get(keys[2]).balance == 5
+
+    cache.invalidate("c")
+    assert cache._get(keys[2]) is None
+    assert set(cache._cache._by_customer) == {"b"}
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from autumn.circuit import CircuitBreaker, CircuitState
+from autumn.client import Client
+from autumn.error import AutumnCircuitOpenError, AutumnHTTPError
+from autumn.retry import RetryPolicy
+
+
+def test_circuit_opens_on_failure_rate():
+    breaker = CircuitBreaker(
+        failure_rate_threshold=0.5, minimum_calls=4, window_size=4
+    )
+
+    breaker.record_success("/check")
+    breaker.record_failure("/check")
+    breaker.record_success("/check")
+    assert breaker.state("/check") is CircuitState.CLOSED
+
+    breaker.record_failure("/check")
+    assert breaker.state("/check") is CircuitState.OPEN
+    assert breaker.state("/track") is CircuitState.CLOSED
+
+    with pytest.raises(AutumnCircuitOpenError) as exc_info:
+        breaker.before_request("/check")
+    assert exc_info.value.endpoint == "/check"
+
+
+def test_circuits_are_keyed_by_endpoint():
+    breaker = CircuitBreaker(minimum_calls=1)
+
+    breaker.record_failure("/customers/cus_1")
+    assert (
+        breaker.state("/customers/cus_2/billing_portal") is CircuitState.OPEN
+    )
+
+
+def test_half_open_probe():
+    breaker = CircuitBreaker(minimum_calls=1, open_timeout=0.05)
+    breaker.record_failure("/check")
+
+    time.sleep(0.06)
+    assert breaker.state("/check") is CircuitState.HALF_OPEN
+
+    breaker.before_request("/check")
+    with pytest.raises(AutumnCircuitOpenError):
+        breaker.before_request("/check")
+
+    breaker.record_failure("/check")
+    assert breaker.state("/check") is CircuitState.OPEN
+
+    time.sleep(0.06)
+    breaker.before_request("/check")
+    breaker.record_success("/check")
+    assert breaker.state("/check") is CircuitState.CLOSED
+
+
+def test_open_circuit_fails_fast(autumn_server):
+    autumn_server.default = (503, {"message": "unavailable"})
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+        circuit_breaker=CircuitBreaker(minimum_calls=3),
+    )
+
+    with pytest.raises(AutumnCircuitOpenError):
+        client.check("user_123", feature_id="messages")
+    assert len(autumn_server.requests) == 3
+
+    with pytest.raises(AutumnCircuitOpenError):
+        client.check("user_123", feature_id="messages")
+    assert len(autumn_server.requests) == 3
+
+
+def test_client_errors_do_not_open_circuit(autumn_server):
+    autumn_server.default = (404, {"message": "not found"})
+    breaker = CircuitBreaker(minimum_calls=1)
+    client = Client(
+        token="sk_test", base_url=autumn_server.url, circuit_breaker=breaker
+    )
+
+    with pytest.raises(AutumnHTTPError):
+        client.check("user_123", feature_id="messages")
+
+    assert breaker.state("/check") is CircuitState.CLOSED
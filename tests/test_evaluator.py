@@ -0,0 +1,144 @@
+import time
+
+import pytest
+
+from autumn.evaluator import EntitlementEvaluator
+from autumn.models.customers import Customer
+
+
+def _customer(**features):
+    return Customer.model_validate(
+        {
+            "id": "user_123",
+            "created_at": 0,
+            "env": "sandbox",
+            "metadata": {},
+            "products": [
+                {"id": "pro", "status": "active", "started_at": 0},
+                {"id": "legacy", "status": "expired", "started_at": 0},
+            ],
+            "features": {
+                feature_id: {"id": feature_id, "name": feature_id, **data}
+                for feature_id, data in features.items()
+            },
+        }
+    )
+
+
+def test_feature_semantics():
+    past = int(time.time() * 1000) - 1000
+    evaluator = EntitlementEvaluator(
+        _customer(
+            sso={"type": "boolean"},
+            messages={"type": "single_use", "balance": 2},
+            seats={"type": "continuous_use", "balance": 0},
+            exports={"type": "single_use", "unlimited": True},
+            credits={
+                "type": "single_use",
+                "balance": 0,
+                "included_usage": 100,
+                "next_reset_at": past,
+            },
+        )
+    )
+
+    results = evaluator.check_many(
+        ["sso", "messages", "seats", "exports", "credits", "missing"]
+    )
+    assert {key: value.allowed for key, value in results.items()} == {
+        "sso": True,
+        "messages": True,
+        "seats": False,
+        "exports": True,
+        "credits": True,
+        "missing": False,
+    }
+    assert results["credits"].balance == 100
+    assert results["missing"].code == "feature_not_found"
+
+    assert not evaluator.check(
+        feature_id="messages", required_balance=3
+    ).allowed
+
+
+def test_product_status():
+    evaluator = EntitlementEvaluator(_customer())
+
+    assert evaluator.check(product_id="pro").allowed
+    assert not evaluator.check(product_id="legacy").allowed
+    assert evaluator.check(product_id="enterprise").code == "product_not_found"
+
+
+CUSTOMER = {
+    "id": "user_123",
+    "created_at": 0,
+    "env": "sandbox",
+    "metadata": {},
+    "products": [],
+    "features": {
+        "sso": {"id": "sso", "name": "SSO", "type": "boolean"},
+        "messages": {
+            "id": "messages",
+            "name": "Messages",
+            "type": "single_use",
+            "balance": 0,
+        },
+    },
+}
+
+
+def test_check_many_local_fetches_once(autumn_server, make_client):
+    autumn_server.default = (200, CUSTOMER)
+    client = make_client()
+
+    results = client.check_many("user_123", ["sso", "messages"], local=True)
+
+    assert results["sso"].allowed
+    assert not results["messages"].allowed
+    assert [path for _, path, _ in autumn_server.requests] == [
+        "/v1/customers/user_123"
+    ]
+
+    client.close()
+
+
+def test_check_many_remote(autumn_server, make_client):
+    autumn_server.default = (
+        200,
+        {"allowed": True, "customer_id": "user_123", "code": "ok"},
+    )
+    client = make_client()
+
+    results = client.check_many("user_123", ["a", "b", "c"])
+
+    assert list(results) == ["a", "b", "c"]
+    assert [body["feature_id"] for _, _, body in autumn_server.requests] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_check_many_is_concurrent(
+    autumn_server, make_async_client
+):
+    autumn_server.default = (
+        200,
+        {"allowed": True, "customer_id": "user_123", "code": "ok"},
+    )
+    autumn_server.delay = 0.2
+    client = make_async_client()
+
+    started = time.monotonic()
+    results = await client.check_many(
+        "user_123", [f"feature_{i}" for i in range(5)], concurrency=5
+    )
+
+    assert time.monotonic() - started < 0.8
+    assert all(result.allowed for result in results.values())
+    assert len(autumn_server.requests) == 5
+
+    await client.close()
@@ -17,4 +17,19 @@ def test_build_kwargs():
 
     kwargs = _build_kwargs(json_data, _temp_method)
     
-    _temp_method(**kwargs)
\ No newline at end of file
+    _temp_method(**kwargs)
+
+def _temp_method_with_locals(customer_id: str, *, entity_id=None):
+    payload = None
+    return payload
+
+
+def test_build_kwargs_ignores_locals_and_caches_plan():
+    from autumn.utils import _PAYLOAD_PLANS
+
+    scope = {"customerId": "cus_id", "entity_id": "ent_id", "payload": 1}
+
+    kwargs = _build_kwargs(scope, _temp_method_with_locals)
+
+    assert kwargs == {"customer_id": "cus_id", "entity_id": "ent_id"}
+    assert _temp_method_with_locals.__code__ in _PAYLOAD_PLANS
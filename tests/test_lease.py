@@ -0,0 +1,176 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+import requests
+
+from autumn.error import AutumnError
+
+ALLOWED = {"allowed": True, "customer_id": "user_123", "code": "ok"}
+TRACKED = {"id": "evt_1", "code": "success", "customer_id": "user_123"}
+
+
+def test_leaser_answers_locally_until_exhausted(autumn_server, make_client):
+    autumn_server.default = (200, ALLOWED)
+    client = make_client()
+    leaser = client.leaser(chunk=5)
+
+    assert all(leaser.check("user_123", "messages") for _ in range(5))
+    assert len(autumn_server.requests) == 1
+    _, path, body = autumn_server.requests[0]
+    assert path == "/v1/check"
+    assert body["required_balance"] == 5
+    assert body["send_event"] is True
+
+    assert leaser.check("user_123", "messages", value=2)
+    assert len(autumn_server.requests) == 2
+    assert leaser.lease("user_123", "messages").remaining == 3
+
+    autumn_server.default = (200, TRACKED)
+    client.close()
+
+    _, path, body = autumn_server.requests[-1]
+    assert path == "/v1/track"
+    assert body["value"] == -3
+
+
+def test_leaser_falls_back_to_remaining_balance(autumn_server, make_client):
+    autumn_server.responses = [
+        (200, {**ALLOWED, "allowed": False, "balance": 2}),
+        (200, {**ALLOWED, "balance": 0}),
+    ]
+    client = make_client()
+    leaser = client.leaser(chunk=10)
+
+    assert leaser.check("user_123", "messages")
+    assert [
+        body["required_balance"] for _, _, body in autumn_server.requests
+    ] == [
+        10,
+        2,
+    ]
+    assert leaser.lease("user_123", "messages").granted == 2
+
+    autumn_server.default = (200, TRACKED)
+    client.close()
+
+
+def test_leaser_denies_without_balance(autumn_server, make_client):
+    autumn_server.default = (200, {**ALLOWED, "allowed": False, "balance": 0})
+    client = make_client()
+    leaser = client.leaser(chunk=10)
+
+    assert not leaser.check("user_123", "messages")
+    assert leaser.lease("user_123", "messages") is None
+
+    client.close()
+
+
+def test_expired_lease_is_renewed(autumn_server, make_client):
+    autumn_server.default = (200, ALLOWED)
+    client = make_client()
+    leaser = client.leaser(chunk=5, ttl=0.05)
+
+    assert leaser.check("user_123", "messages")
+    time.sleep(0.06)
+    autumn_server.responses = [(200, TRACKED)]
+    assert leaser.check("user_123", "messages")
+
+    paths = [path for _, path, _ in autumn_server.requests]
+    assert paths == ["/v1/check", "/v1/track", "/v1/check"]
+
+    autumn_server.default = (200, TRACKED)
+    client.close()
+
+
+def test_close_survives_unreachable_upstream(autumn_server, make_client):
+    autumn_server.default = (200, ALLOWED)
+    client = make_client()
+    errors = []
+    leaser = client.leaser(
+        chunk=5, on_error=lambda lease, exc: errors.append(exc)
+    )
+    tracker = client.tracker(flush_interval=60)
+    assert leaser.check("user_123", "messages")
+
+    def unreachable(*args, **kwargs):
+        raise requests.ConnectionError("unreachable")
+
+    client.http.request = unreachable  # type: ignore
+    tracker.track("user_123", "messages")
+    client.close()
+
+    assert isinstance(errors[0], requests.ConnectionError)
+    assert tracker.stats.failed == 1
+    with pytest.raises(AutumnError):
+        tracker.track("user_123", "messages")
+
+
+@pytest.mark.asyncio
+async def test_async_leaser(autumn_server, make_async_client):
+    autumn_server.default = (200, ALLOWED)
+    client = make_async_client()
+    leaser = client.leaser(chunk=3)
+
+    for _ in range(3):
+        assert await leaser.check("user_123", "messages")
+    assert len(autumn_server.requests) == 1
+
+    await client.close()
+    assert len(autumn_server.requests) == 1  # nothing left to hand back
+
+
+@pytest.mark.asyncio
+async def test_async_close_survives_unreachable_upstream(
+    autumn_server, make_async_client
+):
+    autumn_server.default = (200, ALLOWED)
+    client = make_async_client()
+    errors = []
+    leaser = client.leaser(
+        chunk=5, on_error=lambda lease, exc: errors.append(exc)
+    )
+    tracker = client.tracker(flush_interval=60)
+    assert await leaser.check("user_123", "messages")
+
+    async def unreachable(*args, **kwargs):
+        raise aiohttp.ClientConnectionError("unreachable")
+
+    client.http.request = unreachable  # type: ignore
+    tracker.track("user_123", "messages")
+    await client.close()
+
+    assert isinstance(errors[0], aiohttp.ClientError)
+    assert tracker.stats.failed == 1
+
+    errors.clear()
+    client = make_async_client()
+    leaser = client.leaser(
+        chunk=5, on_error=lambda lease, exc: errors.append(exc)
+    )
+    assert await leaser.check("user_123", "messages")
+
+    async def timeout(*args, **kwargs):
+        raise asyncio.TimeoutError()
+
+    client.http.request = timeout  # type: ignore
+    await client.close()
+    assert isinstance(errors[0], asyncio.TimeoutError)
+
+
+def test_close_runs_every_stage(make_client):
+    client = make_client()
+    leaser = client.leaser()
+    tracker = client.tracker(flush_interval=60)
+
+    def broken():
+        raise RuntimeError("broken")
+
+    leaser.close = broken  # type: ignore
+    with pytest.raises(RuntimeError):
+        client.close()
+
+    with pytest.raises(AutumnError):
+        tracker.track("user_123", "messages")
+    assert client._leasers == [] and client._trackers == []
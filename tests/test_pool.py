@@ -0,0 +1,55 @@
+import time
+
+from autumn.client import Client
+from autumn.models.response import TrackResponse
+
+
+def test_pool_stats_reuse(autumn_server):
+    client = Client(token="sk_test", base_url=autumn_server.url)
+
+    for _ in range(3):
+        response = client.track("user_123", "messages")
+        assert isinstance(response, TrackResponse)
+
+    stats = client.http.pool_stats()
+    assert stats.created == 1
+    assert stats.reused == 2
+    assert stats.in_use == 0
+    assert stats.idle == 1
+
+    client.http.close()
+
+
+def test_pool_keepalive_timeout(autumn_server):
+    client = Client(
+        token="sk_test", base_url=autumn_server.url, keepalive_timeout=0
+    )
+
+    client.track("user_123", "messages")
+    time.sleep(0.01)
+    client.track("user_123", "messages")
+
+    stats = client.http.pool_stats()
+    assert stats.created == 2
+    assert stats.expired == 1
+    assert stats.reused == 0
+
+    client.http.close()
+
+
+def test_warmup_opens_connections(autumn_server):
+    client = Client(token="sk_test", base_url=autumn_server.url)
+    client.warmup(connections=3)
+
+    stats = client.http.pool_stats()
+    assert stats.created == 3
+    assert stats.idle == 3
+    assert stats.in_use == 0
+    assert autumn_server.requests == []
+
+    # Already open connections count towards the total.
+    client.warmup(connections=3)
+    client.track("user_123", "messages")
+    assert client.http.pool_stats().created == 3
+
+    client.close()
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from autumn.client import Client
+from autumn.error import AutumnTimeoutError
+from autumn.ratelimit import RateLimiter
+from autumn.retry import RetryPolicy
+
+
+def test_burst_then_queue():
+    limiter = RateLimiter(rate=10.0, burst=2.0)
+
+    assert limiter._reserve("/check", None) == 0
+    assert limiter._reserve("/check", None) == 0
+    first = limiter._reserve("/check", None)
+    second = limiter._reserve("/check", None)
+
+    assert first == pytest.approx(0.1, abs=0.01)
+    assert second == pytest.approx(0.2, abs=0.01)
+    # A caller that cannot wait that long is turned away without a token.
+    assert limiter._reserve("/check", 0.05) is None
+
+
+def test_aimd():
+    limiter = RateLimiter(rate=10.0, min_rate=4.0, max_rate=10.5)
+
+    limiter.record_throttle("/check")
+    assert limiter.rate() == 5.0
+    limiter.record_throttle("/check")  # same burst, ignored
+    assert limiter.rate() == 5.0
+
+    for _ in range(100):
+        limiter.record_success("/check")
+    assert limiter.rate() == 10.5
+
+
+def test_per_endpoint_buckets():
+    limiter = RateLimiter(rate=10.0, per_endpoint=True)
+    limiter.record_throttle("/check")
+
+    assert limiter.rate("/check") == 5.0
+    assert limiter.rate("/customers/cus_1") == 10.0
+
+
+def test_client_paces_and_backs_off(autumn_server):
+    autumn_server.responses = [(429, {"message": "slow down"})]
+    autumn_server.default = (
+        200,
+        {"allowed": True, "customer_id": "user_123", "code": "ok"},
+    )
+    limiter = RateLimiter(rate=20.0, burst=1.0)
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=RetryPolicy(max_retries=1, base_delay=0),
+        rate_limiter=limiter,
+    )
+
+    started = time.monotonic()
+    client.check("user_123", feature_id="messages")
+
+    # The retry after the 429 waited for a token at the halved rate.
+    assert time.monotonic() - started >= 0.09
+    assert len(autumn_server.requests) == 2
+    assert limiter.rate() > 10.0
+
+    with pytest.raises(AutumnTimeoutError):
+        for _ in range(5):
+            client.check("user_123", feature_id="messages", deadline=0.01)
+
+    client.close()
@@ -1,9 +1,17 @@
 import pytest
 
+from autumn import codec
 from autumn.models.customers import CustomerFeature, ProductItemInterval
 from autumn.customers import Customers
 from autumn.error import AutumnValidationError, AutumnHTTPError
-from autumn.utils import _build_model, _build_payload, _decompose_value, _check_response
+from autumn.utils import (
+    _build_model,
+    _build_model_json,
+    _build_payload,
+    _check_raw_response,
+    _check_response,
+    _decompose_value,
+)
 
 
 def test_decompose_value_singular():
@@ -100,3 +108,40 @@ def test_check_response():
 
     with pytest.raises(AutumnHTTPError):
         _check_response(301, data)
+
+
+def test_model_build_json():
+    raw = b'{"id": "mock_id", "name": "John Doe", "interval": "hour"}'
+
+    feature = _build_model_json(CustomerFeature, raw)
+    assert feature.interval == ProductItemInterval.HOUR
+
+    with pytest.raises(AutumnValidationError):
+        _build_model_json(CustomerFeature, b'{"id": "mock_id"')
+
+
+def test_check_raw_response():
+    _check_raw_response(200, b"not json")
+
+    with pytest.raises(AutumnHTTPError) as exc_info:
+        _check_raw_response(404, b'{"message": "missing", "code": "not_found"}')
+    assert exc_info.value.code == "not_found"
+
+    with pytest.raises(AutumnHTTPError) as exc_info:
+        _check_raw_response(400, b"<html>bad gateway</html>")
+    assert exc_info.value.code == "unknown_error"
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_non_json_error_body(monkeypatch, backend):
+    try:
+        _, loads, decode_error = codec._load_backend(backend)
+    except ImportError:
+        pytest.skip(f"{backend} is not installed")
+    monkeypatch.setattr(codec, "loads", loads)
+    monkeypatch.setattr(codec, "DecodeError", decode_error)
+
+    with pytest.raises(AutumnHTTPError) as exc_info:
+        _check_raw_response(502, b"<html>502 Bad Gateway</html>")
+    assert exc_info.value.status_code == 502
+    assert exc_info.value.code == "unknown_error"
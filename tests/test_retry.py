@@ -0,0 +1,102 @@
+import pytest
+
+from autumn.client import Client
+from autumn.error import AutumnHTTPError
+from autumn.models.response import TrackResponse
+from autumn.retry import RetryBudget, RetryPolicy
+
+
+def _fast_policy(**kwargs):
+    return RetryPolicy(base_delay=0.001, max_delay=0.001, **kwargs)
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=2.0)
+
+    for retry in range(20):
+        assert 0 <= policy.backoff(retry) <= 2.0
+
+
+def test_retry_after_is_honored():
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.001, budget=None)
+
+    assert policy._next_delay("POST", 0, status=429, retry_after="3") == 3
+    assert policy._next_delay("POST", 0, status=429, retry_after="999") == 30
+    assert policy._next_delay("POST", 0, status=500, retry_after="3") < 1
+    assert policy._next_delay("POST", 5, status=429) is None
+    assert policy._next_delay("POST", 0, status=404) is None
+
+
+def test_retry_methods():
+    policy = _fast_policy(retry_methods=frozenset({"GET"}), budget=None)
+
+    assert policy._next_delay("GET", 0, status=503) is not None
+    assert policy._next_delay("POST", 0, status=503) is None
+
+
+def test_budget_exhaustion():
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, capacity=2.0)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=1.0)
+    budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_429_is_retried(autumn_server):
+    autumn_server.responses = [
+        (429, {"message": "slow down"}, {"Retry-After": "0"}),
+        (503, {"message": "unavailable"}),
+    ]
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=_fast_policy(),
+    )
+
+    response = client.track("user_123", "messages")
+
+    assert isinstance(response, TrackResponse)
+    assert len(autumn_server.requests) == 3
+
+
+def test_final_failure_raises_http_error(autumn_server):
+    autumn_server.default = (
+        503,
+        {"message": "unavailable", "code": "service_unavailable"},
+    )
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=_fast_policy(max_retries=2),
+    )
+
+    with pytest.raises(AutumnHTTPError) as exc_info:
+        client.track("user_123", "messages")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == "service_unavailable"
+    assert len(autumn_server.requests) == 3
+
+
+def test_shared_budget_stops_retry_storm(autumn_server):
+    autumn_server.default = (503, {"message": "unavailable"})
+    policy = _fast_policy(
+        budget=RetryBudget(ratio=0.0, min_per_second=0.0, capacity=3.0)
+    )
+    client = Client(
+        token="sk_test", base_url=autumn_server.url, retry_policy=policy
+    )
+
+    for _ in range(3):
+        with pytest.raises(AutumnHTTPError):
+            client.track("user_123", "messages")
+
+    # Only three retries were banked, and the first call spent all of them.
+    assert len(autumn_server.requests) == (1 + 3) + 1 + 1
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+
+from autumn.error import AutumnHTTPError
+
+CUSTOMER = {
+    "id": "user_123",
+    "created_at": 0,
+    "env": "sandbox",
+    "metadata": {},
+    "products": [],
+    "features": {},
+}
+
+
+def test_concurrent_gets_share_one_request(autumn_server, make_client):
+    autumn_server.default = (200, CUSTOMER)
+    autumn_server.delay = 0.2
+    client = make_client(single_flight=True, pool_maxsize=8)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.customers.get("user_123"))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(autumn_server.requests) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+    client.close()
+
+
+def test_errors_are_shared_and_not_cached(autumn_server, make_client):
+    autumn_server.responses = [(404, {"message": "missing", "code": "nope"})]
+    autumn_server.default = (200, CUSTOMER)
+    client = make_client(single_flight=True)
+
+    with pytest.raises(AutumnHTTPError):
+        client.customers.get("user_123")
+    assert client.customers.get("user_123").id == "user_123"
+    assert len(autumn_server.requests) == 2
+
+    client.close()
+
+
+def test_posts_are_not_shared(autumn_server, make_client):
+    autumn_server.default = (
+        200,
+        {"allowed": True, "customer_id": "user_123", "code": "ok"},
+    )
+    autumn_server.delay = 0.1
+    client = make_client(single_flight=True, pool_maxsize=4)
+
+    threads = [
+        threading.Thread(
+            target=lambda: client.check("user_123", feature_id="messages")
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(autumn_server.requests) == 4
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_gets_share_one_request(autumn_server, make_async_client):
+    autumn_server.default = (200, CUSTOMER)
+    autumn_server.delay = 0.2
+    client = make_async_client(
+        single_flight=True,
+    )
+
+    results = await asyncio.gather(
+        *(client.customers.get("user_123") for _ in range(10)),
+        client.customers.get("user_456"),
+    )
+
+    assert len(autumn_server.requests) == 2
+    assert all(result is results[0] for result in results[:10])
+
+    await client.close()
@@ -0,0 +1,136 @@
+import pytest
+
+from autumn.spool import FileSpool, Spool, SQLiteSpool
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def make_spool(request, tmp_path):
+    def make():
+        if request.param == "file":
+            return FileSpool(str(tmp_path / "events.jsonl"))
+        return SQLiteSpool(str(tmp_path / "events.db"))
+
+    return make
+
+
+def test_spool_round_trip(make_spool):
+    spool = make_spool()
+    spool.append("evt_1", {"customer_id": "a", "value": 1})
+    spool.append("evt_2", {"customer_id": "b", "value": 1})
+    spool.merge("evt_1", 4)
+    spool.ack(["evt_2"])
+    spool.close()
+
+    spool = make_spool()
+    assert spool.pending() == [{"customer_id": "a", "value": 5}]
+    spool.close()
+
+
+def test_spool_requires_every_method():
+    class AppendOnly(Spool):
+        def append(self, event_id, payload):
+            pass
+
+    with pytest.raises(TypeError):
+        AppendOnly()  # type: ignore
+
+
+def test_file_spool_ignores_torn_line(tmp_path):
+    path = tmp_path / "events.jsonl"
+    spool = FileSpool(str(path))
+    spool.append("evt_1", {"customer_id": "a", "value": 1})
+    spool.close()
+
+    with open(path, "a") as file:
+        file.write('{"op": "add", "id": "evt_2", "pay')
+
+    spool = FileSpool(str(path))
+    assert [event["customer_id"] for event in spool.pending()] == ["a"]
+    spool.close()
+
+
+def test_file_spool_compacts(tmp_path):
+    path = tmp_path / "events.jsonl"
+    spool = FileSpool(str(path), compact_threshold=2)
+    for i in range(3):
+        spool.append(f"evt_{i}", {"value": i})
+    spool.ack(["evt_0", "evt_1"])
+
+    with open(path) as file:
+        assert len(file.readlines()) == 1
+    spool.close()
+
+
+def test_tracker_spools_until_sent(make_spool, make_client):
+    client = make_client()
+    tracker = client.tracker(
+        flush_interval=60, coalesce=True, spool=make_spool()
+    )
+    tracker.track("user_123", "messages", value=2)
+    tracker.track("user_123", "messages", value=3)
+
+    reader = make_spool()
+    [pending] = reader.pending()
+    assert pending["value"] == 5
+    reader.close()
+
+    client.close()
+
+    reader = make_spool()
+    assert reader.pending() == []
+    reader.close()
+
+
+@pytest.mark.parametrize("status, kept", [(503, 1), (400, 0)])
+def test_tracker_keeps_events_it_could_not_send(
+    autumn_server, make_spool, make_client, status, kept
+):
+    autumn_server.default = (status, {"message": "oops"})
+    errors = []
+    client = make_client()
+    tracker = client.tracker(
+        flush_interval=0.01,
+        max_attempts=1,
+        spool=make_spool(),
+        on_error=lambda payload, exc: errors.append(exc),
+    )
+    tracker.track("user_123", "messages")
+    assert tracker.flush(timeout=5)
+    assert tracker.stats.failed == 1
+    client.close()
+    assert len(errors) == 1
+
+    spool = make_spool()
+    assert len(spool.pending()) == kept
+    spool.close()
+
+
+def test_tracker_replays_spooled_events(
+    autumn_server, make_spool, make_client
+):
+    # What a process that died with one event queued leaves behind.
+    spool = make_spool()
+    spool.append(
+        "evt_1",
+        {
+            "customer_id": "user_123",
+            "feature_id": "messages",
+            "value": 5,
+            "idempotency_key": "evt_1",
+        },
+    )
+    spool.close()
+
+    client = make_client()
+    tracker = client.tracker(flush_interval=0.01, spool=make_spool())
+    assert tracker.stats.replayed == 1
+    assert tracker.flush(timeout=5)
+
+    [(_, _, body)] = autumn_server.requests
+    assert body["idempotency_key"] == "evt_1"
+    assert body["value"] == 5
+    client.close()
+
+    spool = make_spool()
+    assert spool.pending() == []
+    spool.close()
@@ -0,0 +1,48 @@
+import pytest
+
+from autumn.error import AutumnHTTPError
+
+CHECK = {"allowed": True, "customer_id": "user_123", "code": "ok"}
+
+
+def test_submit_runs_in_parallel(autumn_server, make_client):
+    autumn_server.default = (200, CHECK)
+    autumn_server.delay = 0.2
+    client = make_client(pool_maxsize=4)
+
+    futures = [
+        client.submit("check", customer_id="user_123", feature_id=f"f{i}")
+        for i in range(4)
+    ]
+    results = [future.result(timeout=0.7) for future in futures]
+
+    assert all(result.allowed for result in results)
+    assert client._executor._max_workers == 4
+
+    client.close()
+    assert client._executor is None
+
+
+def test_submit_propagates_errors(autumn_server, make_client):
+    autumn_server.default = (404, {"message": "missing", "code": "not_found"})
+    client = make_client()
+
+    future = client.submit("customers.get", customer_id="user_123")
+    with pytest.raises(AutumnHTTPError):
+        future.result(timeout=5)
+
+    with pytest.raises(AttributeError):
+        client.submit("_build_payload")
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_submit(autumn_server, make_async_client):
+    autumn_server.default = (200, CHECK)
+    client = make_async_client()
+
+    task = client.submit("check", customer_id="user_123", feature_id="f")
+    assert (await task).allowed
+
+    await client.close()
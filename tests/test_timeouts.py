@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from autumn.client import Client
+from autumn.error import AutumnTimeoutError
+from autumn.timeouts import Timeout, _select_timeout
+
+
+def test_select_timeout_longest_prefix():
+    default = Timeout()
+    customers = Timeout(connect=1, read=2)
+    portal = Timeout(connect=1, read=20)
+    overrides = {
+        "/customers": customers,
+        "/customers/cus_1/billing_portal": portal,
+    }
+
+    assert _select_timeout("/check", default, overrides) is default
+    assert _select_timeout("/customers", default, overrides) is customers
+    assert _select_timeout("/customers/cus_1", default, overrides) is customers
+    assert (
+        _select_timeout("/customers/cus_1/billing_portal", default, overrides)
+        is portal
+    )
+    assert _select_timeout("/customersx", default, overrides) is default
+
+
+def test_deadline_skips_backoff(autumn_server):
+    autumn_server.default = (
+        503,
+        {"message": "unavailable"},
+        {"Retry-After": "5"},
+    )
+    client = Client(token="sk_test", base_url=autumn_server.url)
+
+    start = time.monotonic()
+    with pytest.raises(AutumnTimeoutError):
+        client.check("user_123", feature_id="messages", deadline=0.5)
+
+    assert time.monotonic() - start < 0.5
+    assert len(autumn_server.requests) == 1
+
+
+def test_read_timeout_is_bounded_by_deadline(autumn_server):
+    autumn_server.delay = 1.0
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        endpoint_timeouts={"/check": Timeout(connect=1, read=5)},
+    )
+
+    start = time.monotonic()
+    with pytest.raises(AutumnTimeoutError):
+        client.check("user_123", feature_id="messages", deadline=0.2)
+
+    assert time.monotonic() - start < 0.9
@@ -0,0 +1,204 @@
+import time
+
+import pytest
+
+from autumn.client import Client
+from autumn.error import AutumnError
+from autumn.retry import RetryPolicy
+
+
+def test_tracker_flushes_on_batch_size(autumn_server, make_client):
+    client = make_client()
+    tracker = client.tracker(max_batch=3, flush_interval=60)
+
+    for _ in range(3):
+        tracker.track("user_123", "messages")
+
+    assert tracker.flush(timeout=5)
+    stats = tracker.stats
+    assert stats.sent == 3
+    assert stats.queue_depth == 0
+
+    keys = {body["idempotency_key"] for _, _, body in autumn_server.requests}
+    assert len(keys) == 3
+
+    client.close()
+
+
+def test_tracker_retries_with_same_idempotency_key(autumn_server, make_client):
+    autumn_server.responses = [(503, {"message": "unavailable"})]
+    client = make_client()
+    tracker = client.tracker(flush_interval=0.01)
+
+    tracker.track("user_123", "messages", idempotency_key="evt_1")
+    assert tracker.flush(timeout=5)
+
+    assert tracker.stats.sent == 1
+    assert tracker.stats.retried == 1
+    assert [
+        body["idempotency_key"] for _, _, body in autumn_server.requests
+    ] == [
+        "evt_1",
+        "evt_1",
+    ]
+
+    client.close()
+
+
+def test_tracker_reports_failures(autumn_server, make_client):
+    autumn_server.default = (400, {"message": "bad", "code": "invalid"})
+    errors = []
+    client = make_client()
+    tracker = client.tracker(
+        flush_interval=0.01, on_error=lambda event, exc: errors.append(exc)
+    )
+
+    tracker.track("user_123", "messages")
+    assert tracker.flush(timeout=5)
+
+    # Client errors are not retried.
+    assert len(autumn_server.requests) == 1
+    assert tracker.stats.failed == 1
+    assert errors[0].code == "invalid"
+
+    client.close()
+
+
+def test_tracker_does_not_stack_client_retries(autumn_server):
+    autumn_server.default = (503, {"message": "unavailable"})
+    client = Client(
+        token="sk_test",
+        base_url=autumn_server.url,
+        retry_policy=RetryPolicy(max_retries=5, base_delay=0),
+    )
+    tracker = client.tracker(flush_interval=0.01, max_attempts=2)
+
+    tracker.track("user_123", "messages")
+    assert tracker.flush(timeout=5)
+
+    assert len(autumn_server.requests) == 2
+    assert tracker.stats.failed == 1
+
+    client.close()
+
+
+def test_tracker_backs_off_between_attempts(autumn_server, make_client):
+    autumn_server.default = (503, {"message": "unavailable"})
+    retries = []
+    client = make_client()
+    client.http.retry_policy.backoff = (
+        lambda retry: retries.append(retry) or 0.3
+    )
+    tracker = client.tracker(flush_interval=0.01, max_attempts=3)
+
+    start = time.monotonic()
+    tracker.track("user_123", "messages")
+    # A flush waits out the backoff instead of spending every attempt at once.
+    assert not tracker.flush(timeout=0.2)
+    assert len(autumn_server.requests) == 1
+    assert tracker.stats.queue_depth == 1
+
+    assert tracker.flush(timeout=5)
+    assert time.monotonic() - start >= 0.6
+    assert len(autumn_server.requests) == 3
+    assert retries == [0, 1]
+    assert tracker.stats.failed == 1
+
+    client.close()
+
+
+def test_tracker_close_skips_backoff(autumn_server, make_client):
+    autumn_server.default = (503, {"message": "unavailable"})
+    client = make_client()
+    client.http.retry_policy.backoff = lambda retry: 60
+    tracker = client.tracker(flush_interval=0.01, max_attempts=3)
+
+    tracker.track("user_123", "messages")
+    time.sleep(0.2)
+    start = time.monotonic()
+    client.close()
+
+    assert time.monotonic() - start < 5
+    assert len(autumn_server.requests) == 3
+    assert tracker.stats.failed == 1
+
+
+def test_tracker_sends_concurrently(autumn_server, make_client):
+    autumn_server.delay = 0.2
+    client = make_client()
+    tracker = client.tracker(max_batch=10, flush_interval=60, concurrency=10)
+
+    for _ in range(10):
+        tracker.track("user_123", "messages")
+
+    start = time.monotonic()
+    assert tracker.flush(timeout=5)
+    assert time.monotonic() - start < 1
+    assert tracker.stats.sent == 10
+
+    client.close()
+
+
+def test_tracker_drops_when_full(make_client):
+    errors = []
+    client = make_client()
+    tracker = client.tracker(
+        max_queue=1,
+        flush_interval=60,
+        on_error=lambda event, exc: errors.append(exc),
+    )
+
+    assert tracker.track("user_123", "messages") is not None
+    assert tracker.track("user_123", "messages") is None
+
+    assert tracker.stats.dropped == 1
+    assert errors[0].code == "tracker_queue_full"
+
+    client.close()
+    assert tracker.stats.sent == 1
+
+    with pytest.raises(AutumnError):
+        tracker.track("user_123", "messages")
+
+
+def test_tracker_coalesces_increments(autumn_server, make_client):
+    client = make_client()
+    # One event in flight at a time keeps the requests in order.
+    tracker = client.tracker(flush_interval=60, coalesce=True, concurrency=1)
+
+    keys = {tracker.track("user_123", "messages", value=2) for _ in range(10)}
+    tracker.track("user_123", "messages", entity_id="seat_1")
+    tracker.track("user_123", "messages", properties={"model": "gpt"})
+
+    assert tracker.flush(timeout=5)
+    stats = tracker.stats
+    assert stats.enqueued == 12
+    assert stats.coalesced == 9
+    assert stats.sent == 12
+    assert stats.coalescing_ratio == 4.0
+
+    bodies = [body for _, _, body in autumn_server.requests]
+    assert len(bodies) == 3
+    assert bodies[0]["value"] == 20
+    assert keys == {bodies[0]["idempotency_key"]}
+    assert bodies[1]["entity_id"] == "seat_1"
+    assert bodies[2]["properties"] == {"model": "gpt"}
+
+    client.close()
+
+
+def test_tracker_does_not_coalesce_into_sent_events(
+    autumn_server, make_client
+):
+    client = make_client()
+    tracker = client.tracker(flush_interval=60, coalesce=True)
+
+    tracker.track("user_123", "messages")
+    assert tracker.flush(timeout=5)
+    tracker.track("user_123", "messages")
+    assert tracker.flush(timeout=5)
+
+    assert [body["value"] for _, _, body in autumn_server.requests] == [1, 1]
+    assert tracker.stats.coalesced == 0
+
+    client.close()